@@ -0,0 +1,103 @@
+"""Benchmark building Arrow tables from FEWS time series directly and via pandas.
+
+PI JSON series from ``tests/test_data/timeseries_response.json`` are repeated
+under new location IDs, and the NetCDF members of
+``tests/test_data/timeseries_multi_member.zip`` are decoded once. Both are
+converted to a ``pyarrow.Table`` with the converters in
+``fews_py_wrapper.arrow`` and through a pandas DataFrame. Time is the best of
+``--repeat`` runs; peak is the largest traced allocation of a single run.
+Run from the repository root::
+
+    python benchmarks/arrow_output.py --scales 100 1000
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+
+from fews_py_wrapper.arrow import netcdf_datasets_to_arrow, pi_json_to_arrow
+from fews_py_wrapper.pi_json import pi_json_to_dataframe
+from fews_py_wrapper.utils import convert_netcdf_zip_response_to_xarray
+
+TEST_DATA = Path(__file__).parents[1] / "tests" / "test_data"
+
+
+def _scale_document(document: dict[str, Any], scale: int) -> dict[str, Any]:
+    scaled = {key: value for key, value in document.items() if key != "timeSeries"}
+    scaled["timeSeries"] = [
+        {
+            "header": {
+                **series["header"],
+                "locationId": f"{series['header']['locationId']}_{index}",
+            },
+            "events": series["events"],
+        }
+        for index in range(scale)
+        for series in document["timeSeries"]
+    ]
+    return scaled
+
+
+def _netcdf_via_pandas(datasets: list[Any]) -> pa.Table:
+    return pa.concat_tables(
+        [
+            pa.Table.from_pandas(
+                dataset[list(dataset.data_vars)].to_dataframe().reset_index()
+            )
+            for dataset in datasets
+        ],
+        promote_options="permissive",
+    )
+
+
+def _measure(func: Any, argument: Any, repeat: int) -> tuple[float, float]:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(argument)
+        timings.append(time.perf_counter() - started)
+    tracemalloc.start()
+    func(argument)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(timings), peak / 2**20
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    document = json.loads((TEST_DATA / "timeseries_response.json").read_text())
+    datasets = convert_netcdf_zip_response_to_xarray(
+        (TEST_DATA / "timeseries_multi_member.zip").read_bytes()
+    )
+    cases: list[tuple[str, Any, Any]] = []
+    for scale in args.scales:
+        scaled = _scale_document(document, scale)
+        cases += [
+            (f"PI JSON x{scale} direct", pi_json_to_arrow, scaled),
+            (
+                f"PI JSON x{scale} via pandas",
+                lambda content: pa.Table.from_pandas(pi_json_to_dataframe(content)),
+                scaled,
+            ),
+        ]
+    cases += [
+        ("NetCDF direct", netcdf_datasets_to_arrow, datasets),
+        ("NetCDF via pandas", _netcdf_via_pandas, datasets),
+    ]
+    print(f"{'conversion':<28}{'seconds':>10}{'peak MiB':>10}")
+    for name, func, argument in cases:
+        seconds, peak = _measure(func, argument, args.repeat)
+        print(f"{name:<28}{seconds:>10.4f}{peak:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
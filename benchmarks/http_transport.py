@@ -0,0 +1,147 @@
+"""Benchmark request throughput with different HTTP transport settings.
+
+A local HTTP/1.1 server with keep-alive stands in for FEWS and answers every
+request with a small PI JSON parameters document after ``--latency``
+milliseconds. ``--concurrency`` threads share one ``FewsWebServiceClient``
+and issue ``--requests`` ``get_parameters`` calls in total. Clients are
+created without keep-alive, with the default pool, with the keep-alive pool
+sized to the concurrency and with pre-warmed connections. The server runs in
+its own process and counts the connections that were opened. Run from the
+repository root::
+
+    python benchmarks/http_transport.py --requests 4000 --concurrency 64
+"""
+
+import argparse
+import json
+import multiprocessing
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from fews_py_wrapper import FewsWebServiceClient, TransportConfig
+
+PARAMETERS = json.dumps(
+    {
+        "version": "1.34",
+        "timeSeriesParameters": [
+            {
+                "id": "H.obs",
+                "name": "Water level",
+                "parameterType": "instantaneous",
+                "unit": "m",
+            },
+            {
+                "id": "Q.obs",
+                "name": "Discharge",
+                "parameterType": "instantaneous",
+                "unit": "m3/s",
+            },
+        ],
+    }
+).encode()
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(self, handler: Any, connections: Any) -> None:
+        super().__init__(("127.0.0.1", 0), handler)
+        self.connections = connections
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        with self.connections.get_lock():
+            self.connections.value += 1
+        super().process_request(request, client_address)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    latency = 0.0
+
+    def do_GET(self) -> None:
+        time.sleep(self.latency)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(PARAMETERS)))
+        self.end_headers()
+        self.wfile.write(PARAMETERS)
+
+    def do_HEAD(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def _serve(latency: float, port: Any, connections: Any) -> None:
+    _Handler.latency = latency
+    server = _Server(_Handler, connections)
+    port.value = server.server_address[1]
+    server.serve_forever()
+
+
+def _run(
+    base_url: str,
+    connections: Any,
+    transport: TransportConfig,
+    requests: int,
+    concurrency: int,
+) -> tuple[float, int]:
+    connections.value = 0
+    started = time.perf_counter()
+    client = FewsWebServiceClient(base_url=base_url, transport=transport)
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(lambda _: client.get_parameters(), range(requests)))
+    elapsed = time.perf_counter() - started
+    client.client.get_httpx_client().close()
+    return requests / elapsed, connections.value
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=4000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--latency", type=float, default=2.0, help="milliseconds")
+    args = parser.parse_args()
+
+    port = multiprocessing.Value("i", 0)
+    connections = multiprocessing.Value("i", 0)
+    server = multiprocessing.Process(
+        target=_serve, args=(args.latency / 1000, port, connections), daemon=True
+    )
+    server.start()
+    while not port.value:
+        time.sleep(0.01)
+    base_url = f"http://127.0.0.1:{port.value}"
+    cases = [
+        ("no keep-alive", TransportConfig(max_keepalive_connections=0)),
+        ("default pool", TransportConfig()),
+        (
+            "keep-alive = concurrency",
+            TransportConfig(max_keepalive_connections=args.concurrency),
+        ),
+        (
+            "keep-alive + prewarm",
+            TransportConfig(
+                max_keepalive_connections=args.concurrency,
+                prewarm=args.concurrency,
+            ),
+        ),
+    ]
+    print(f"{'transport':<28}{'req/s':>10}{'connections':>13}")
+    for name, transport in cases:
+        rate, opened = _run(
+            base_url, connections, transport, args.requests, args.concurrency
+        )
+        print(f"{name:<28}{rate:>10.0f}{opened:>13}")
+    server.terminate()
+
+
+if __name__ == "__main__":
+    main()
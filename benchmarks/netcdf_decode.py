@@ -0,0 +1,107 @@
+"""Benchmark decoding of FEWS PI_NETCDF ZIP responses.
+
+Compares decoding members straight from memory with extracting them to a
+temporary directory first, and serial decoding with the thread and process
+executors. "fresh pool" starts new worker processes for every call, which shows
+what reusing the process pool saves. ``--variable`` and ``--last-steps`` add
+runs that only read one variable or the last time steps of each member. Run
+from the repository root::
+
+    python benchmarks/netcdf_decode.py
+    python benchmarks/netcdf_decode.py path/to/response.zip --repeat 20 --workers 16
+    python benchmarks/netcdf_decode.py --variable H_obs --last-steps 48
+"""
+
+import argparse
+import os
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from fews_py_wrapper.utils import (
+    _shutdown_netcdf_process_pool,
+    convert_netcdf_zip_response_to_xarray,
+)
+
+DEFAULT_ZIP = (
+    Path(__file__).parents[1] / "tests" / "test_data" / "timeseries_multi_member.zip"
+)
+
+
+def _time_decode(
+    content: bytes, options: dict[str, Any], repeat: int, fresh_pool: bool = False
+) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        if fresh_pool:
+            _shutdown_netcdf_process_pool()
+        started = time.perf_counter()
+        convert_netcdf_zip_response_to_xarray(content, **options)
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def _peak_python_memory(content: bytes, options: dict[str, Any]) -> int:
+    tracemalloc.start()
+    try:
+        convert_netcdf_zip_response_to_xarray(content, **options)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _last_steps_slice(content: bytes, steps: int) -> slice:
+    """Return the time slice of the last ``steps`` steps of the first member."""
+    datasets = convert_netcdf_zip_response_to_xarray(content)
+    return slice(np.datetime64(datasets[0]["time"].values[-steps]), None)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("zip_path", nargs="?", type=Path, default=DEFAULT_ZIP)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--variable", help="also decode only this variable")
+    parser.add_argument(
+        "--last-steps", type=int, help="also decode only these last time steps"
+    )
+    args = parser.parse_args()
+
+    content = args.zip_path.read_bytes()
+    # Warm up imports and the HDF5 library before timing.
+    convert_netcdf_zip_response_to_xarray(content)
+    convert_netcdf_zip_response_to_xarray(
+        content, max_workers=args.workers, executor="process"
+    )
+
+    print(f"{args.zip_path.name}: {len(content) / 1024:.1f} KiB")
+    variants: list[tuple[str, dict[str, Any]]] = [
+        ("temp files", {"in_memory": False}),
+        ("in memory", {"in_memory": True}),
+        ("threads", {"max_workers": args.workers, "executor": "thread"}),
+        ("processes", {"max_workers": args.workers, "executor": "process"}),
+        ("fresh pool", {"max_workers": args.workers, "executor": "process"}),
+    ]
+    if args.variable:
+        variants.append(("variable", {"variables": [args.variable]}))
+    if args.last_steps:
+        time_slice = _last_steps_slice(content, args.last_steps)
+        variants.append(("last steps", {"time_slice": time_slice}))
+    print(f"{'path':<12}{'median ms':>12}{'min ms':>12}{'peak KiB':>12}")
+    for label, options in variants:
+        timings = _time_decode(
+            content, options, args.repeat, fresh_pool=label == "fresh pool"
+        )
+        peak = _peak_python_memory(content, options)
+        print(
+            f"{label:<12}{statistics.median(timings) * 1000:>12.1f}"
+            f"{min(timings) * 1000:>12.1f}{peak / 1024:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Benchmark peak memory of downloading FEWS PI_NETCDF responses.
+
+A ZIP response is built by repeating the members of
+``tests/test_data/timeseries_multi_member.zip`` ``--copies`` times and served
+by a local HTTP server. It is fetched with ``get_timeseries`` reading the
+whole body into memory, streaming it to a spooled temporary file and
+streaming it to a file path. With ``--decode`` the NetCDF members are decoded
+as well, which adds the (equal) size of the decoded datasets to every peak.
+Run from the repository root::
+
+    python benchmarks/netcdf_download.py --copies 200
+    python benchmarks/netcdf_download.py --copies 10 --decode
+"""
+
+import argparse
+import io
+import tempfile
+import threading
+import time
+import tracemalloc
+import zipfile
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+from fews_py_wrapper import FewsWebServiceClient
+from fews_py_wrapper._api import TimeSeries
+
+DEFAULT_ZIP = (
+    Path(__file__).parents[1] / "tests" / "test_data" / "timeseries_multi_member.zip"
+)
+
+
+def _build_response(zip_path: Path, copies: int) -> bytes:
+    buffer = io.BytesIO()
+    with (
+        zipfile.ZipFile(zip_path) as source,
+        zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as target,
+    ):
+        members = [(member, source.read(member)) for member in source.infolist()]
+        for copy in range(copies):
+            for member, content in members:
+                target.writestr(f"{copy}_{member.filename}", content)
+    return buffer.getvalue()
+
+
+def _serve(content: bytes) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/zip")
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            chunk_size = 1 << 16
+            for start in range(0, len(content), chunk_size):
+                self.wfile.write(content[start : start + chunk_size])
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _measure(func: Callable[[], object]) -> tuple[float, int]:
+    tracemalloc.start()
+    try:
+        started = time.perf_counter()
+        func()
+        return time.perf_counter() - started, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("zip_path", nargs="?", type=Path, default=DEFAULT_ZIP)
+    parser.add_argument("--copies", type=int, default=100)
+    parser.add_argument("--spool-size", type=int, default=1 << 20)
+    parser.add_argument("--decode", action="store_true")
+    args = parser.parse_args()
+
+    content = _build_response(args.zip_path, args.copies)
+    server = _serve(content)
+    client = FewsWebServiceClient(
+        base_url=f"http://127.0.0.1:{server.server_address[1]}"
+    )
+    print(f"response: {len(content) / 2**20:.1f} MiB")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        download_path = Path(temp_dir) / "response.zip"
+
+        def spooled_download() -> None:
+            TimeSeries().download(
+                client=client.client, spool_size=args.spool_size
+            ).close()
+
+        variants: list[tuple[str, Callable[[], object]]] = [
+            (
+                "download in memory",
+                lambda: TimeSeries().execute(client=client.client),
+            ),
+            ("download spooled", spooled_download),
+            (
+                "download to path",
+                lambda: TimeSeries().download(
+                    client=client.client, download_path=download_path
+                ),
+            ),
+        ]
+        if args.decode:
+            variants += [
+                ("decode in memory", lambda: client.get_timeseries()),
+                (
+                    "decode spooled",
+                    lambda: client.get_timeseries(spool_size=args.spool_size),
+                ),
+                (
+                    "decode from path",
+                    lambda: client.get_timeseries(download_path=download_path),
+                ),
+            ]
+        print(f"{'path':<20}{'seconds':>10}{'peak MiB':>12}")
+        for label, func in variants:
+            elapsed, peak = _measure(func)
+            print(f"{label:<20}{elapsed:>10.2f}{peak / 2**20:>12.1f}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
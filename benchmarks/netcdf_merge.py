@@ -0,0 +1,94 @@
+"""Benchmark merging the NetCDF members of a FEWS PI_NETCDF response.
+
+The members of ``tests/test_data/timeseries_multi_member.zip`` have varying
+station sets and time axes. They are scaled up by repeating every station
+``--scale`` times under a new ``station_id``, and then merged with
+``merge_netcdf_datasets`` and with plain xarray. Run from the repository root::
+
+    python benchmarks/netcdf_merge.py --scale 10
+"""
+
+import argparse
+import functools
+import statistics
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+import xarray as xr
+
+from fews_py_wrapper.utils import (
+    convert_netcdf_zip_response_to_xarray,
+    merge_netcdf_datasets,
+)
+
+DEFAULT_ZIP = (
+    Path(__file__).parents[1] / "tests" / "test_data" / "timeseries_multi_member.zip"
+)
+
+
+def _scale_stations(dataset: xr.Dataset, scale: int) -> xr.Dataset:
+    copies = []
+    for copy in range(scale):
+        station_ids = np.char.add(
+            dataset["station_id"].values.astype(str), f"_{copy}"
+        ).astype(dataset["station_id"].dtype)
+        copies.append(dataset.assign_coords(station_id=("stations", station_ids)))
+    return xr.concat(copies, dim="stations", data_vars="minimal", coords="minimal")
+
+
+def _xarray_merge(datasets: list[xr.Dataset]) -> xr.Dataset:
+    indexed = [
+        dataset.drop_vars("time_bnds", errors="ignore").set_index(stations="station_id")
+        for dataset in datasets
+    ]
+    return xr.merge(indexed, compat="override", join="outer", combine_attrs="override")
+
+
+def _xarray_combine_first(datasets: list[xr.Dataset]) -> xr.Dataset:
+    # Same "first non-missing value wins" semantics as merge_netcdf_datasets.
+    indexed = [
+        dataset.drop_vars("time_bnds", errors="ignore").set_index(stations="station_id")
+        for dataset in datasets
+    ]
+    return functools.reduce(xr.Dataset.combine_first, indexed)
+
+
+def _time(func: Callable[[], object], repeat: int) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("zip_path", nargs="?", type=Path, default=DEFAULT_ZIP)
+    parser.add_argument("--scale", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    datasets = [
+        _scale_stations(dataset, args.scale)
+        for dataset in convert_netcdf_zip_response_to_xarray(args.zip_path.read_bytes())
+    ]
+    merged = merge_netcdf_datasets(datasets)
+    print(
+        f"{len(datasets)} members, {merged.sizes['stations']} stations, "
+        f"{merged.sizes['time']} time steps"
+    )
+    print(f"{'method':<24}{'median s':>10}{'min s':>10}")
+    for label, func in (
+        ("merge_netcdf_datasets", merge_netcdf_datasets),
+        ("xr.merge", _xarray_merge),
+        ("xr combine_first", _xarray_combine_first),
+    ):
+        timings = _time(functools.partial(func, datasets), args.repeat)
+        print(f"{label:<24}{statistics.median(timings):>10.2f}{min(timings):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Benchmark converting FEWS PI CSV time series to a pandas DataFrame.
+
+A synthetic document with ``--series`` columns of ``--events`` rows is parsed
+with ``pi_csv_to_dataframe`` using the ``c`` and ``pyarrow`` engines, and by
+decoding it to a string and reading that through ``io.StringIO``. Run from the
+repository root::
+
+    python benchmarks/pi_csv_to_pandas.py --series 100 --events 20000
+"""
+
+import argparse
+import io
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from fews_py_wrapper.pi_csv import pi_csv_to_dataframe
+
+
+def _build_document(series: int, events: int) -> bytes:
+    start = datetime(2025, 3, 14)
+    values = np.random.default_rng(0).random((events, series)).round(3)
+    rows = "".join(
+        f"{start + timedelta(minutes=5 * index):%Y-%m-%d %H:%M:%S},"
+        + ",".join(map(str, row))
+        + "\n"
+        for index, row in enumerate(values)
+    )
+    return (
+        "Location Names," + ",".join(f"Station {i}" for i in range(series)) + "\n"
+        "Location Ids," + ",".join(f"loc_{i}" for i in range(series)) + "\n"
+        "Time," + ",".join("H.obs" for _ in range(series)) + "\n" + rows
+    ).encode()
+
+
+def _decoded_string_io(content: bytes) -> pd.DataFrame:
+    return pd.read_csv(
+        io.StringIO(content.decode()), skiprows=2, index_col=0, parse_dates=True
+    )
+
+
+def _best_of(func: Callable[[bytes], object], content: bytes, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(content)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--series", type=int, default=50)
+    parser.add_argument("--events", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    content = _build_document(args.series, args.events)
+    print(f"document: {len(content) / 2**20:.1f} MiB")
+    print(f"{'method':<28}{'best s':>10}")
+    variants: list[tuple[str, Callable[[bytes], object]]] = [
+        ("decode + StringIO", _decoded_string_io),
+        (
+            "pi_csv_to_dataframe c",
+            lambda content: pi_csv_to_dataframe(content, layout="wide"),
+        ),
+        (
+            "pi_csv_to_dataframe pyarrow",
+            lambda content: pi_csv_to_dataframe(
+                content, layout="wide", engine="pyarrow"
+            ),
+        ),
+    ]
+    for label, func in variants:
+        print(f"{label:<28}{_best_of(func, content, args.repeat):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Benchmark converting FEWS PI JSON time series to pandas and xarray.
+
+The series in ``tests/test_data/timeseries_response.json`` are repeated under
+new location IDs to grow the document, and converted with
+``pi_json_to_dataframe``, ``pi_json_to_xarray`` and a per-event Python loop.
+Run from the repository root::
+
+    python benchmarks/pi_json_to_pandas.py --scales 1 10 100 1000 10000
+"""
+
+import argparse
+import copy
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from fews_py_wrapper.pi_json import pi_json_to_dataframe, pi_json_to_xarray
+
+DEFAULT_JSON = (
+    Path(__file__).parents[1] / "tests" / "test_data" / "timeseries_response.json"
+)
+
+
+def _scale_document(document: dict[str, Any], scale: int) -> dict[str, Any]:
+    scaled = {key: value for key, value in document.items() if key != "timeSeries"}
+    scaled["timeSeries"] = []
+    for copy_index in range(scale):
+        for series in document["timeSeries"]:
+            header = copy.deepcopy(series["header"])
+            header["locationId"] = f"{header['locationId']}_{copy_index}"
+            scaled["timeSeries"].append({"header": header, "events": series["events"]})
+    return scaled
+
+
+def _per_event_loop(document: dict[str, Any]) -> pd.DataFrame:
+    rows = []
+    for series in document["timeSeries"]:
+        header = series["header"]
+        miss_value = float(header["missVal"])
+        for event in series["events"]:
+            value = float(event["value"])
+            rows.append(
+                {
+                    "locationId": header["locationId"],
+                    "parameterId": header["parameterId"],
+                    "time": pd.Timestamp(f"{event['date']}T{event['time']}Z"),
+                    "value": None if value == miss_value else value,
+                    "flag": int(event["flag"]),
+                }
+            )
+    return pd.DataFrame(rows)
+
+
+def _best_of(func: Any, document: dict[str, Any], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(document)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("json_path", nargs="?", type=Path, default=DEFAULT_JSON)
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    document = json.loads(args.json_path.read_text())
+    print(
+        f"{'events':>10}{'pandas s':>10}{'xarray s':>10}{'loop s':>10}{'speed-up':>10}"
+    )
+    for scale in args.scales:
+        scaled = _scale_document(document, scale)
+        events = sum(len(series["events"]) for series in scaled["timeSeries"])
+        vectorized = _best_of(pi_json_to_dataframe, scaled, args.repeat)
+        dataset = _best_of(pi_json_to_xarray, scaled, args.repeat)
+        loop = _best_of(_per_event_loop, scaled, args.repeat)
+        print(
+            f"{events:>10}{vectorized:>10.4f}{dataset:>10.4f}{loop:>10.4f}"
+            f"{loop / vectorized:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
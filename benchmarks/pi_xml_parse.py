@@ -0,0 +1,90 @@
+"""Benchmark parsing FEWS PI XML time series documents.
+
+A synthetic document with ``--series`` series of ``--events`` events each is
+parsed with ``iter_pi_xml_series`` and with ``ElementTree.fromstring`` on the
+decoded text, which keeps the whole tree in memory. Run from the repository
+root::
+
+    python benchmarks/pi_xml_parse.py --series 200 --events 5000
+"""
+
+import argparse
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from fews_py_wrapper.pi_xml import iter_pi_xml_series
+
+NAMESPACE = "{http://www.wldelft.nl/fews/PI}"
+
+
+def _build_document(series: int, events: int) -> bytes:
+    start = datetime(2025, 3, 14)
+    event_lines = "".join(
+        f'<event date="{moment:%Y-%m-%d}" time="{moment:%H:%M:%S}" '
+        f'value="{index * 0.001:.3f}" flag="0"/>'
+        for index, moment in (
+            (index, start + timedelta(minutes=5 * index)) for index in range(events)
+        )
+    )
+    series_xml = "".join(
+        f"<series><header><locationId>loc_{index}</locationId>"
+        "<parameterId>H.obs</parameterId><missVal>-999.0</missVal></header>"
+        f"{event_lines}</series>"
+        for index in range(series)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<TimeSeries xmlns="http://www.wldelft.nl/fews/PI" version="1.34">'
+        f"<timeZone>0.0</timeZone>{series_xml}</TimeSeries>"
+    ).encode()
+
+
+def _streaming(content: bytes) -> None:
+    for series in iter_pi_xml_series(content):
+        series.values.sum()
+
+
+def _element_tree(content: bytes) -> None:
+    root = ET.fromstring(content.decode())
+    for series in root.iter(f"{NAMESPACE}series"):
+        values = [float(event.get("value", "nan")) for event in series[1:]]
+        np.array(values).sum()
+
+
+def _measure(func: Callable[[bytes], None], content: bytes) -> tuple[float, int]:
+    # Timed separately, because tracemalloc slows down allocation-heavy code.
+    started = time.perf_counter()
+    func(content)
+    elapsed = time.perf_counter() - started
+    tracemalloc.start()
+    try:
+        func(content)
+        return elapsed, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--series", type=int, default=100)
+    parser.add_argument("--events", type=int, default=2000)
+    args = parser.parse_args()
+
+    content = _build_document(args.series, args.events)
+    print(f"document: {len(content) / 2**20:.1f} MiB")
+    print(f"{'parser':<16}{'seconds':>10}{'peak MiB':>12}")
+    for label, func in (
+        ("iterparse", _streaming),
+        ("fromstring", _element_tree),
+    ):
+        elapsed, peak = _measure(func, content)
+        print(f"{label:<16}{elapsed:>10.2f}{peak / 2**20:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""Benchmark building polars DataFrames from FEWS responses directly and indirectly.
+
+Location records are synthesised and converted with
+``fews_py_wrapper.polars.pi_records_to_polars`` and by validating
+``PiLocation`` models first. PI JSON series from
+``tests/test_data/timeseries_response.json`` are repeated under new location
+IDs, and the NetCDF members of ``tests/test_data/timeseries_multi_member.zip``
+are decoded once; both are converted directly and through a pandas DataFrame.
+Time is the best of ``--repeat`` runs; peak is the largest traced allocation of
+a single run. Run from the repository root::
+
+    python benchmarks/polars_output.py --locations 100000 --scale 1000
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+from fews_py_wrapper.models import PiLocation
+from fews_py_wrapper.pi_json import pi_json_to_dataframe
+from fews_py_wrapper.polars import (
+    netcdf_datasets_to_polars,
+    pi_json_to_polars,
+    pi_records_to_polars,
+)
+from fews_py_wrapper.utils import convert_netcdf_zip_response_to_xarray
+
+TEST_DATA = Path(__file__).parents[1] / "tests" / "test_data"
+
+
+def _location_records(count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "locationId": f"location_{index}",
+            "description": f"Location {index}",
+            "shortName": f"L{index}",
+            "lat": str(-30 + index * 1e-5),
+            "lon": str(30 + index * 1e-5),
+            "x": str(30 + index * 1e-5),
+            "y": str(-30 + index * 1e-5),
+            "z": "0.0",
+            "attributes": [{"name": "stationOwner", "text": "eThekwini"}],
+        }
+        for index in range(count)
+    ]
+
+
+def _via_models(records: list[dict[str, Any]]) -> pl.DataFrame:
+    return pl.DataFrame(
+        [
+            PiLocation.model_validate(record).model_dump(
+                by_alias=True, exclude={"attributes"}
+            )
+            for record in records
+        ]
+    )
+
+
+def _scale_document(document: dict[str, Any], scale: int) -> dict[str, Any]:
+    scaled = {key: value for key, value in document.items() if key != "timeSeries"}
+    scaled["timeSeries"] = [
+        {
+            "header": {
+                **series["header"],
+                "locationId": f"{series['header']['locationId']}_{index}",
+            },
+            "events": series["events"],
+        }
+        for index in range(scale)
+        for series in document["timeSeries"]
+    ]
+    return scaled
+
+
+def _netcdf_via_pandas(datasets: list[Any]) -> pl.DataFrame:
+    return pl.concat(
+        [
+            pl.from_pandas(
+                dataset[list(dataset.data_vars)].to_dataframe().reset_index()
+            )
+            for dataset in datasets
+        ],
+        how="diagonal_relaxed",
+    )
+
+
+def _measure(func: Any, argument: Any, repeat: int) -> tuple[float, float]:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(argument)
+        timings.append(time.perf_counter() - started)
+    tracemalloc.start()
+    func(argument)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(timings), peak / 2**20
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--locations", type=int, default=100_000)
+    parser.add_argument("--scale", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    records = _location_records(args.locations)
+    document = _scale_document(
+        json.loads((TEST_DATA / "timeseries_response.json").read_text()), args.scale
+    )
+    datasets = convert_netcdf_zip_response_to_xarray(
+        (TEST_DATA / "timeseries_multi_member.zip").read_bytes()
+    )
+    cases: list[tuple[str, Any, Any]] = [
+        (
+            "locations direct",
+            lambda content: pi_records_to_polars(content, PiLocation),
+            records,
+        ),
+        ("locations via models", _via_models, records),
+        ("PI JSON direct", pi_json_to_polars, document),
+        (
+            "PI JSON via pandas",
+            lambda content: pl.from_pandas(pi_json_to_dataframe(content)),
+            document,
+        ),
+        ("NetCDF direct", netcdf_datasets_to_polars, datasets),
+        ("NetCDF via pandas", _netcdf_via_pandas, datasets),
+    ]
+    print(f"{'conversion':<28}{'seconds':>10}{'peak MiB':>10}")
+    for name, func, argument in cases:
+        seconds, peak = _measure(func, argument, args.repeat)
+        print(f"{name:<28}{seconds:>10.4f}{peak:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,11 @@
 __version__ = "0.1.0"
-from fews_py_wrapper.fews_webservices import FewsWebServiceClient
+from fews_py_wrapper.async_fews_webservices import AsyncFewsWebServiceClient
+from fews_py_wrapper.fews_webservices import (
+    FewsWebServiceClient,
+    ResponseCache,
+    TimeSeriesFetchStats,
+    TransportConfig,
+)
 from fews_py_wrapper.models import (
     PiFilter,
     PiFilterBoundingBox,
@@ -25,6 +31,7 @@ from fews_py_wrapper.models import (
 )
 
 __all__ = [
+    "AsyncFewsWebServiceClient",
     "FewsWebServiceClient",
     "PiFilterBoundingBox",
     "PiFilter",
@@ -47,4 +54,7 @@ __all__ = [
     "PiWhatIfTemplatesResponse",
     "PiWorkflow",
     "PiWorkflowsResponse",
+    "ResponseCache",
+    "TimeSeriesFetchStats",
+    "TransportConfig",
 ]
@@ -1,3 +1,4 @@
+from fews_py_wrapper._api.base import DEFAULT_SPOOL_SIZE
 from fews_py_wrapper._api.endpoints import (
     Filters,
     Locations,
@@ -14,6 +15,7 @@ from fews_py_wrapper._api.endpoints import (
 )
 
 __all__ = [
+    "DEFAULT_SPOOL_SIZE",
     "Filters",
     "TimeSeries",
     "PostTimeSeries",
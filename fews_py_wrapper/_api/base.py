@@ -1,21 +1,49 @@
+import asyncio
 import codecs
+import contextlib
 import inspect
 import json
+import os
+import tempfile
+import uuid
+from collections.abc import AsyncIterator, Iterator, Mapping
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Callable, cast, get_args
+from pathlib import Path
+from typing import IO, Any, Awaitable, Callable, cast, get_args
 
 from fews_openapi_py_client import AuthenticatedClient, Client
 from fews_openapi_py_client.types import Unset
 from requests import HTTPError
 
-__all__ = ["ApiEndpoint"]
+from fews_py_wrapper.utils import format_datetime
+
+__all__ = ["ApiEndpoint", "DEFAULT_SPOOL_SIZE"]
+
+# Downloads without a target path stay in memory up to this size and are
+# rolled over to a temporary file beyond it.
+DEFAULT_SPOOL_SIZE = 16 * 1024 * 1024
 
 
 class ApiEndpoint:
     """Wraps a single API endpoint with parameter handling and validation."""
 
     endpoint_function: Callable[..., Any]
+    async_endpoint_function: Callable[..., Awaitable[Any]]
+    # The request builder (``_get_kwargs``) of the generated endpoint module,
+    # needed to send streamed requests.
+    request_kwargs_function: Callable[..., dict[str, Any]]
     success_status_codes: frozenset[int] = frozenset({200})
+    response_size: int = 0
+    status_code: int | None = None
+    # Codec of the response charset, set when a response is received.
+    response_encoding: str = "utf-8"
+    decode_text: bool = True
+    # Datetime arguments, formatted as FEWS time strings of ``time_arg_type``.
+    time_args: tuple[str, ...] = ()
+    time_arg_type: Callable[[str], Any] = str
+    # Model that a request body given as a dictionary is converted to.
+    body_model: Any = None
 
     def execute(
         self,
@@ -26,6 +54,11 @@ class ApiEndpoint:
         """
         Execute the API endpoint call.
 
+        The status code, size and charset codec of the raw response body are
+        kept in ``status_code``, ``response_size`` and ``response_encoding``.
+        Text responses are decoded to strings unless ``decode_text`` is
+        ``False``, in which case the raw bytes are returned.
+
         Args:
             client: AuthenticatedClient or Client instance for API calls.
             document_format: Format of the returned document.
@@ -36,10 +69,219 @@ class ApiEndpoint:
 
         """
         response = self.endpoint_function(client=client, **kwargs)
+        self.status_code = int(response.status_code)
+        self.response_size = len(response.content)
+        self.response_encoding = self._get_response_encoding(
+            response.headers.get("content-type", "")
+        )
         if response.status_code not in self.success_status_codes:
             self._request_error_handler(response)
         return self._parse_response_content(response)
 
+    async def execute_async(
+        self,
+        *,
+        client: AuthenticatedClient | Client,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Execute the API endpoint call without blocking the event loop.
+
+        Input kwargs are prepared with ``_prepare_kwargs`` before the request is
+        sent. Response parsing runs in a worker thread so that decoding large
+        payloads does not stall other coroutines.
+
+        Args:
+            client: AuthenticatedClient or Client instance for API calls.
+            **kwargs: Keyword arguments for the API call.
+
+        Returns:
+            Parsed response content based on the returned content type.
+        """
+        kwargs = self._prepare_kwargs(kwargs)
+        response = await self.async_endpoint_function(client=client, **kwargs)
+        self.status_code = int(response.status_code)
+        self.response_size = len(response.content)
+        self.response_encoding = self._get_response_encoding(
+            response.headers.get("content-type", "")
+        )
+        if response.status_code not in self.success_status_codes:
+            self._request_error_handler(response)
+        return await asyncio.to_thread(self._parse_response_content, response)
+
+    @contextlib.contextmanager
+    def stream(
+        self,
+        *,
+        client: AuthenticatedClient | Client,
+        **kwargs: Any,
+    ) -> Iterator[Iterator[bytes]]:
+        """
+        Send the API endpoint request and stream the response body.
+
+        The request is built by ``request_kwargs_function`` and sent with the
+        httpx client of ``client`` in streaming mode, so the body is not read
+        into memory at once. The status code is kept in ``status_code`` and
+        the codec of the response charset in ``response_encoding``.
+
+        Args:
+            client: AuthenticatedClient or Client instance for API calls.
+            **kwargs: Keyword arguments for the API call.
+
+        Yields:
+            An iterator over the raw response body chunks.
+
+        Raises:
+            HTTPError: If the response status is not a success status.
+        """
+        request_kwargs = self.request_kwargs_function(**self._prepare_kwargs(kwargs))
+        with client.get_httpx_client().stream(**request_kwargs) as response:
+            self.status_code = int(response.status_code)
+            self.response_encoding = self._get_response_encoding(
+                response.headers.get("content-type", "")
+            )
+            if response.status_code not in self.success_status_codes:
+                response.read()
+                self._request_error_handler(response)
+            yield response.iter_bytes()
+
+    @contextlib.asynccontextmanager
+    async def stream_async(
+        self,
+        *,
+        client: AuthenticatedClient | Client,
+        **kwargs: Any,
+    ) -> AsyncIterator[AsyncIterator[bytes]]:
+        """
+        Asynchronous variant of :meth:`stream`.
+
+        Args:
+            client: AuthenticatedClient or Client instance for API calls.
+            **kwargs: Keyword arguments for the API call.
+
+        Yields:
+            An asynchronous iterator over the raw response body chunks.
+        """
+        request_kwargs = self.request_kwargs_function(**self._prepare_kwargs(kwargs))
+        async with client.get_async_httpx_client().stream(**request_kwargs) as response:
+            self.status_code = int(response.status_code)
+            self.response_encoding = self._get_response_encoding(
+                response.headers.get("content-type", "")
+            )
+            if response.status_code not in self.success_status_codes:
+                await response.aread()
+                self._request_error_handler(response)
+            yield response.aiter_bytes()
+
+    def download(
+        self,
+        *,
+        client: AuthenticatedClient | Client,
+        download_path: str | Path | None = None,
+        spool_size: int = DEFAULT_SPOOL_SIZE,
+        **kwargs: Any,
+    ) -> Path | IO[bytes]:
+        """
+        Stream the API endpoint response body to a file.
+
+        The body is written chunk by chunk, so it is never held in memory as a
+        whole. The status code and the number of bytes written are kept in
+        ``status_code`` and ``response_size``.
+
+        Args:
+            client: AuthenticatedClient or Client instance for API calls.
+            download_path: File to write the body to. The body is written to a
+                temporary file next to it that replaces ``download_path`` only
+                once the download succeeded, so an existing file is left
+                untouched by a failed request. When omitted, the body is
+                written to a ``tempfile.SpooledTemporaryFile`` that stays in
+                memory up to ``spool_size`` bytes and moves to disk beyond it.
+            spool_size: In-memory size limit of the spooled temporary file;
+                ``0`` writes the body to disk right away.
+            **kwargs: Keyword arguments for the API call.
+
+        Returns:
+            ``download_path`` as a ``Path``, or the spooled temporary file,
+            positioned at the start. The caller closes the temporary file.
+        """
+        target = self._open_download(download_path, spool_size)
+        try:
+            with self.stream(client=client, **kwargs) as chunks:
+                self.response_size = sum(target.write(chunk) for chunk in chunks)
+        except BaseException:
+            self._discard_download(target, download_path)
+            raise
+        return self._finish_download(target, download_path)
+
+    async def download_async(
+        self,
+        *,
+        client: AuthenticatedClient | Client,
+        download_path: str | Path | None = None,
+        spool_size: int = DEFAULT_SPOOL_SIZE,
+        **kwargs: Any,
+    ) -> Path | IO[bytes]:
+        """
+        Asynchronous variant of :meth:`download`.
+
+        File operations, including the writes of the body chunks, run in a
+        worker thread so that a slow disk does not stall the event loop.
+
+        Args:
+            client: AuthenticatedClient or Client instance for API calls.
+            download_path: File to write the body to, see :meth:`download`.
+            spool_size: In-memory size limit of the spooled temporary file.
+            **kwargs: Keyword arguments for the API call.
+
+        Returns:
+            ``download_path`` as a ``Path``, or the spooled temporary file.
+        """
+        target = await asyncio.to_thread(self._open_download, download_path, spool_size)
+        try:
+            async with self.stream_async(client=client, **kwargs) as chunks:
+                self.response_size = 0
+                async for chunk in chunks:
+                    self.response_size += await asyncio.to_thread(target.write, chunk)
+        except BaseException:
+            await asyncio.to_thread(self._discard_download, target, download_path)
+            raise
+        return await asyncio.to_thread(self._finish_download, target, download_path)
+
+    @staticmethod
+    def _open_download(download_path: str | Path | None, spool_size: int) -> IO[bytes]:
+        """Open the file that a response body is downloaded to."""
+        if download_path is not None:
+            path = Path(download_path)
+            return path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.part").open(
+                "xb"
+            )
+        if spool_size == 0:
+            # A spooled file with a zero size limit never rolls over to disk.
+            return tempfile.TemporaryFile()
+        return tempfile.SpooledTemporaryFile(max_size=spool_size)
+
+    @staticmethod
+    def _discard_download(target: IO[bytes], download_path: str | Path | None) -> None:
+        """Close the file of a failed download and remove a partial file."""
+        target.close()
+        if download_path is not None:
+            Path(target.name).unlink(missing_ok=True)
+
+    def _finish_download(
+        self, target: IO[bytes], download_path: str | Path | None
+    ) -> Path | IO[bytes]:
+        """Move a downloaded file into place, or rewind a spooled one."""
+        if download_path is not None:
+            target.close()
+            try:
+                os.replace(target.name, download_path)
+            except BaseException:
+                Path(target.name).unlink(missing_ok=True)
+                raise
+            return Path(download_path)
+        target.seek(0)
+        return target
+
     def input_args(self) -> list[str]:
         """
         Get the list of input argument names for the API endpoint.
@@ -47,14 +289,15 @@ class ApiEndpoint:
         Returns:
             list: Parameter names accepted by the API endpoint function.
         """
-        return list(inspect.signature(self.endpoint_function).parameters)
+        return list(self._call_plan().arg_names)
 
     def update_input_kwargs(self, kwargs: dict[str, Any]) -> dict[str, Any]:
         """
         Convert and validate kwargs to match API endpoint parameter models.
 
-        Converts values to their appropriate enum types and handles boolean
-        conversions as needed.
+        Converts values to their appropriate enum types, handles boolean
+        conversions, formats the datetime arguments in ``time_args`` and builds
+        the request body from a dictionary, using the endpoint's call plan.
 
         Args:
             kwargs: Dictionary of keyword arguments to update.
@@ -65,30 +308,58 @@ class ApiEndpoint:
         Raises:
             ValueError: If an argument value is invalid or cannot be converted.
         """
-        param_models = self._get_parameter_models()
-        updated_kwargs = {}
-        try:
-            for key, value in kwargs.items():
-                if key in param_models:
-                    if param_models[key]["is_bool"]:
-                        updated_kwargs[key] = param_models[key]["model"](
-                            self._convert_bools(value)
-                        )
-                    else:
-                        updated_kwargs[key] = param_models[key]["model"](value)
-                else:
-                    updated_kwargs[key] = value
-            return updated_kwargs
-        except ValueError as e:
-            raise ValueError(f"Invalid argument value: {e}") from e
+        return self._call_plan().apply(kwargs)
+
+    def _prepare_kwargs(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Prepare endpoint kwargs before they are passed to the API function."""
+        return self.update_input_kwargs(kwargs)
 
-    def _get_parameter_models(self) -> dict[str, dict[str, Any]]:
+    @classmethod
+    def _call_plan(cls) -> "_CallPlan":
+        """Return the call plan of this endpoint, compiling it on first use.
+
+        Plans are kept per endpoint function, so an endpoint function that is
+        replaced (for example patched in tests) gets a plan of its own.
+        """
+        key = (cls, cls.endpoint_function)
+        plan = _CALL_PLANS.get(key)
+        if plan is None:
+            plan = _CALL_PLANS[key] = cls._compile_call_plan()
+        return plan
+
+    @classmethod
+    def _compile_call_plan(cls) -> "_CallPlan":
+        """Build the argument converters of this endpoint once."""
+        function_params = inspect.signature(cls.endpoint_function).parameters
+        converters = {
+            name: _enum_converter(model["model"], model["is_bool"])
+            for name, model in cls._get_parameter_models(function_params).items()
+        }
+        for name in cls.time_args:
+            converters[name] = _time_converter(name, cls.time_arg_type)
+        if cls.body_model is not None:
+            converters["body"] = _body_converter(cls.body_model)
+        converters.update(cls._argument_converters())
+        return _CallPlan(arg_names=tuple(function_params), converters=converters)
+
+    @classmethod
+    def _argument_converters(cls) -> dict[str, Callable[[Any], Any]]:
+        """Return converters for endpoint-specific arguments."""
+        return {}
+
+    @classmethod
+    def _get_parameter_models(
+        cls, function_params: Mapping[str, inspect.Parameter]
+    ) -> dict[str, dict[str, Any]]:
         """
         Extract parameter models from the API endpoint function signature.
 
         Identifies enum types and boolean flags from function parameter
         annotations, excluding standard types and the 'client' parameter.
 
+        Args:
+            function_params: The parameters of the endpoint function signature.
+
         Returns:
             dict: Mapping of parameter names to model information containing:
                 - 'is_bool': bool indicating if the parameter is a boolean enum
@@ -97,7 +368,6 @@ class ApiEndpoint:
         Raises:
             ValueError: If a parameter has unexpected annotation structure.
         """
-        function_params = inspect.signature(self.endpoint_function).parameters
         standard_types = (str, int, float, bool, list, dict, tuple, set, datetime)
         parameter_models: dict[str, dict[str, Any]] = {}
         for param_name, param in function_params.items():
@@ -107,7 +377,7 @@ class ApiEndpoint:
             args = get_args(annotation)
 
             # Check if argument annotation contains standard types
-            if self._contains_types(args, standard_types) or not args:
+            if cls._contains_types(args, standard_types) or not args:
                 continue
 
             arg_list = list(args)
@@ -133,8 +403,9 @@ class ApiEndpoint:
             parameter_models[param_name] = m_dict
         return parameter_models
 
+    @classmethod
     def _contains_types(
-        self, args: tuple[Any, ...] | list[Any], check_types: tuple[type[Any], ...]
+        cls, args: tuple[Any, ...] | list[Any], check_types: tuple[type[Any], ...]
     ) -> bool:
         """
         Recursively check if any type in args is contained in check_types.
@@ -152,11 +423,12 @@ class ApiEndpoint:
             if arg in check_types:
                 return True
             nested_args = get_args(arg)
-            if nested_args and self._contains_types(nested_args, check_types):
+            if nested_args and cls._contains_types(nested_args, check_types):
                 return True
         return False
 
-    def _convert_bools(self, arg: bool) -> str:
+    @staticmethod
+    def _convert_bools(arg: bool) -> str:
         """
         Convert a boolean value to the string representation expected by the API.
 
@@ -181,10 +453,10 @@ class ApiEndpoint:
             return json.loads(
                 self._decode_response_body(response.content, content_type)
             )
-        if media_type.startswith("text/") or media_type in {
-            "application/xml",
-            "text/xml",
-        }:
+        if self.decode_text and (
+            media_type.startswith("text/")
+            or media_type in {"application/xml", "text/xml"}
+        ):
             return self._decode_response_body(response.content, content_type)
         return cast(bytes, response.content)
 
@@ -216,3 +488,71 @@ class ApiEndpoint:
         raise HTTPError(
             f"Request failed with status code {response.status_code}: {response_body}"
         )
+
+
+@dataclass(frozen=True)
+class _CallPlan:
+    """The argument conversions of one endpoint, compiled from its signature.
+
+    Applying a plan only looks up each keyword argument in ``converters``;
+    annotations are inspected once, when the plan is compiled.
+    """
+
+    arg_names: tuple[str, ...]
+    converters: dict[str, Callable[[Any], Any]]
+
+    def apply(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Return ``kwargs`` with every planned argument converted."""
+        converters = self.converters
+        return {
+            key: converters[key](value) if key in converters else value
+            for key, value in kwargs.items()
+        }
+
+
+# Compiled call plans by endpoint class and endpoint function.
+_CALL_PLANS: dict[tuple[type[ApiEndpoint], Callable[..., Any]], _CallPlan] = {}
+
+
+def _enum_converter(model: Any, is_bool: bool) -> Callable[[Any], Any]:
+    """Return a converter of argument values to the enum ``model``."""
+
+    def convert(value: Any) -> Any:
+        try:
+            return model(ApiEndpoint._convert_bools(value) if is_bool else value)
+        except ValueError as e:
+            raise ValueError(f"Invalid argument value: {e}") from e
+
+    return convert
+
+
+def _time_converter(name: str, arg_type: Callable[[str], Any]) -> Callable[[Any], Any]:
+    """Return a converter of a datetime argument to a FEWS time string."""
+
+    def convert(value: Any) -> Any:
+        if value is None:
+            return None
+        if not isinstance(value, datetime):
+            raise ValueError(
+                f"Invalid argument value for {name}: Expected datetime,"
+                f" got {type(value)}"
+            )
+        return arg_type(format_datetime(value))
+
+    return convert
+
+
+def _body_converter(model: Any) -> Callable[[Any], Any]:
+    """Return a converter of a request body dictionary to ``model``."""
+
+    def convert(body: Any) -> Any:
+        if body is None or isinstance(body, model):
+            return body
+        if isinstance(body, dict):
+            return model.from_dict(body)
+        raise ValueError(
+            f"Invalid argument value for body: Expected {model.__name__} or dict, "
+            f"got {type(body)}"
+        )
+
+    return convert
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Any, cast
+from typing import Any, Callable, cast
 
 from fews_openapi_py_client import AuthenticatedClient, Client
 from fews_openapi_py_client.api.filters import filters
@@ -40,8 +40,41 @@ class _RFC3339DateTime(str):
         return str(self)
 
 
+def _format_external_forecast_times(
+    external_forecast_times: Any,
+) -> list[str] | None:
+    if external_forecast_times is None:
+        return None
+    if not isinstance(external_forecast_times, list):
+        arg_type = type(external_forecast_times)
+        raise ValueError(
+            "Invalid argument value for external_forecast_times: Expected list,"
+            f" got {arg_type}"
+        )
+
+    formatted_external_forecast_times: list[str] = []
+    for external_forecast_time in external_forecast_times:
+        if isinstance(external_forecast_time, datetime):
+            formatted_external_forecast_times.append(
+                format_datetime(external_forecast_time)
+            )
+            continue
+        if isinstance(external_forecast_time, str):
+            formatted_external_forecast_times.append(external_forecast_time)
+            continue
+
+        arg_type = type(external_forecast_time)
+        raise ValueError(
+            "Invalid argument value for external_forecast_times: Expected"
+            f" datetime or str items, got {arg_type}"
+        )
+    return formatted_external_forecast_times
+
+
 class Filters(ApiEndpoint):
     endpoint_function = staticmethod(filters.sync_detailed)
+    async_endpoint_function = staticmethod(filters.asyncio_detailed)
+    request_kwargs_function = staticmethod(filters._get_kwargs)
 
     def execute(
         self,
@@ -49,128 +82,87 @@ class Filters(ApiEndpoint):
         client: AuthenticatedClient | Client,
         **kwargs: Any,
     ) -> dict[str, Any] | str:
-        kwargs = self.update_input_kwargs(kwargs)
+        kwargs = self._prepare_kwargs(kwargs)
         return cast(dict[str, Any] | str, super().execute(client=client, **kwargs))
 
 
 class Parameters(ApiEndpoint):
     endpoint_function = staticmethod(parameters.sync_detailed)
+    async_endpoint_function = staticmethod(parameters.asyncio_detailed)
+    request_kwargs_function = staticmethod(parameters._get_kwargs)
 
     def execute(
         self, *, client: AuthenticatedClient | Client, **kwargs: Any
     ) -> dict[str, Any]:
-        kwargs = self.update_input_kwargs(kwargs)
+        kwargs = self._prepare_kwargs(kwargs)
         return cast(dict[str, Any], super().execute(client=client, **kwargs))
 
 
 class Locations(ApiEndpoint):
     endpoint_function = staticmethod(locations.sync_detailed)
+    async_endpoint_function = staticmethod(locations.asyncio_detailed)
+    request_kwargs_function = staticmethod(locations._get_kwargs)
 
     def execute(
         self, *, client: AuthenticatedClient | Client, **kwargs: Any
     ) -> dict[str, Any]:
-        kwargs = self.update_input_kwargs(kwargs)
+        kwargs = self._prepare_kwargs(kwargs)
         return cast(dict[str, Any], super().execute(client=client, **kwargs))
 
 
 class TimeSeries(ApiEndpoint):
     endpoint_function = staticmethod(timeseries.sync_detailed)
+    async_endpoint_function = staticmethod(timeseries.asyncio_detailed)
+    request_kwargs_function = staticmethod(timeseries._get_kwargs)
     success_status_codes = frozenset({200, 206})
+    time_args = (
+        "start_time",
+        "end_time",
+        "start_creation_time",
+        "end_creation_time",
+        "start_forecast_time",
+        "end_forecast_time",
+    )
 
     def execute(
         self, *, client: AuthenticatedClient | Client, **kwargs: Any
     ) -> dict[str, Any] | bytes | str:
-        kwargs = self.update_input_kwargs(kwargs)
-        kwargs = self._format_time_args(kwargs)
+        kwargs = self._prepare_kwargs(kwargs)
         return cast(
             dict[str, Any] | bytes | str, super().execute(client=client, **kwargs)
         )
 
-    def _format_time_args(self, kwargs: dict[str, Any]) -> dict[str, Any]:
-        time_args = [
-            "start_time",
-            "end_time",
-            "start_creation_time",
-            "end_creation_time",
-            "start_forecast_time",
-            "end_forecast_time",
-        ]
-        for arg in time_args:
-            if arg in kwargs and kwargs[arg] is not None:
-                if not isinstance(kwargs[arg], datetime):
-                    arg_type = type(kwargs[arg])
-                    raise ValueError(
-                        f"Invalid argument value for {arg}: Expected datetime,"
-                        f" got {arg_type}"
-                    )
-                kwargs[arg] = format_datetime(kwargs[arg])
-
-        if (
-            "external_forecast_times" in kwargs
-            and kwargs["external_forecast_times"] is not None
-        ):
-            external_forecast_times = kwargs["external_forecast_times"]
-            if not isinstance(external_forecast_times, list):
-                arg_type = type(external_forecast_times)
-                raise ValueError(
-                    "Invalid argument value for external_forecast_times: Expected list,"
-                    f" got {arg_type}"
-                )
-
-            formatted_external_forecast_times: list[str] = []
-            for external_forecast_time in external_forecast_times:
-                if isinstance(external_forecast_time, datetime):
-                    formatted_external_forecast_times.append(
-                        format_datetime(external_forecast_time)
-                    )
-                    continue
-                if isinstance(external_forecast_time, str):
-                    formatted_external_forecast_times.append(external_forecast_time)
-                    continue
-
-                arg_type = type(external_forecast_time)
-                raise ValueError(
-                    "Invalid argument value for external_forecast_times: Expected"
-                    f" datetime or str items, got {arg_type}"
-                )
-
-            kwargs["external_forecast_times"] = formatted_external_forecast_times
-        return kwargs
+    @classmethod
+    def _argument_converters(cls) -> dict[str, Callable[[Any], Any]]:
+        return {"external_forecast_times": _format_external_forecast_times}
 
 
 class PostTimeSeries(ApiEndpoint):
     endpoint_function = staticmethod(posttimeseries.sync_detailed)
+    async_endpoint_function = staticmethod(posttimeseries.asyncio_detailed)
+    body_model = PosttimeseriesBody
 
     def execute(
         self, *, client: AuthenticatedClient | Client, **kwargs: Any
     ) -> dict[str, Any] | bytes | str:
-        kwargs = self._prepare_body(kwargs)
-        body = kwargs.pop("body", None)
-        kwargs = self.update_input_kwargs(kwargs)
-        if body is not None:
-            kwargs["body"] = body
+        kwargs = self._prepare_kwargs(kwargs)
         return cast(
             dict[str, Any] | bytes | str,
             super().execute(client=client, **kwargs),
         )
 
-    def _prepare_body(self, kwargs: dict[str, Any]) -> dict[str, Any]:
-        body = kwargs.get("body")
-        if body is None:
-            return kwargs
-        if isinstance(body, dict):
-            kwargs["body"] = PosttimeseriesBody.from_dict(body)
-            return kwargs
-        if isinstance(body, PosttimeseriesBody):
-            return kwargs
-        raise ValueError(
-            "Invalid argument value for body: Expected PosttimeseriesBody or dict, "
-            f"got {type(body)}"
-        )
-
 
 class Taskruns(ApiEndpoint):
     endpoint_function = staticmethod(taskruns.sync_detailed)
+    async_endpoint_function = staticmethod(taskruns.asyncio_detailed)
+    request_kwargs_function = staticmethod(taskruns._get_kwargs)
+    time_args = (
+        "start_forecast_time",
+        "end_forecast_time",
+        "start_dispatch_time",
+        "end_dispatch_time",
+    )
+    time_arg_type = _RFC3339DateTime
 
     def execute(
         self,
@@ -178,30 +170,14 @@ class Taskruns(ApiEndpoint):
         client: AuthenticatedClient | Client,
         **kwargs: Any,
     ) -> dict[str, Any] | str:
-        kwargs = self.update_input_kwargs(kwargs)
-        kwargs = self._format_time_args(kwargs)
+        kwargs = self._prepare_kwargs(kwargs)
         return cast(dict[str, Any] | str, super().execute(client=client, **kwargs))
 
-    def _format_time_args(self, kwargs: dict[str, Any]) -> dict[str, Any]:
-        for arg in [
-            "start_forecast_time",
-            "end_forecast_time",
-            "start_dispatch_time",
-            "end_dispatch_time",
-        ]:
-            if arg in kwargs and kwargs[arg] is not None:
-                if not isinstance(kwargs[arg], datetime):
-                    arg_type = type(kwargs[arg])
-                    raise ValueError(
-                        f"Invalid argument value for {arg}: Expected datetime,"
-                        f" got {arg_type}"
-                    )
-                kwargs[arg] = _RFC3339DateTime(format_datetime(kwargs[arg]))
-        return kwargs
-
 
 class Taskrunstatus(ApiEndpoint):
     endpoint_function = staticmethod(taskrunstatus.sync_detailed)
+    async_endpoint_function = staticmethod(taskrunstatus.asyncio_detailed)
+    request_kwargs_function = staticmethod(taskrunstatus._get_kwargs)
 
     def execute(
         self,
@@ -209,12 +185,14 @@ class Taskrunstatus(ApiEndpoint):
         client: AuthenticatedClient | Client,
         **kwargs: Any,
     ) -> dict[str, Any]:
-        kwargs = self.update_input_kwargs(kwargs)
+        kwargs = self._prepare_kwargs(kwargs)
         return cast(dict[str, Any], super().execute(client=client, **kwargs))
 
 
 class WhatIfTemplates(ApiEndpoint):
     endpoint_function = staticmethod(whatiftemplates.sync_detailed)
+    async_endpoint_function = staticmethod(whatiftemplates.asyncio_detailed)
+    request_kwargs_function = staticmethod(whatiftemplates._get_kwargs)
 
     def execute(
         self,
@@ -222,12 +200,14 @@ class WhatIfTemplates(ApiEndpoint):
         client: AuthenticatedClient | Client,
         **kwargs: Any,
     ) -> dict[str, Any]:
-        kwargs = self.update_input_kwargs(kwargs)
+        kwargs = self._prepare_kwargs(kwargs)
         return cast(dict[str, Any], super().execute(client=client, **kwargs))
 
 
 class WhatIfScenarios(ApiEndpoint):
     endpoint_function = staticmethod(whatifscenarios.sync_detailed)
+    async_endpoint_function = staticmethod(whatifscenarios.asyncio_detailed)
+    request_kwargs_function = staticmethod(whatifscenarios._get_kwargs)
 
     def execute(
         self,
@@ -235,12 +215,13 @@ class WhatIfScenarios(ApiEndpoint):
         client: AuthenticatedClient | Client,
         **kwargs: Any,
     ) -> dict[str, Any]:
-        kwargs = self.update_input_kwargs(kwargs)
+        kwargs = self._prepare_kwargs(kwargs)
         return cast(dict[str, Any], super().execute(client=client, **kwargs))
 
 
 class PostWhatIfScenarios(ApiEndpoint):
     endpoint_function = staticmethod(post_what_if_scenarios.sync_detailed)
+    async_endpoint_function = staticmethod(post_what_if_scenarios.asyncio_detailed)
 
     def execute(
         self,
@@ -248,51 +229,26 @@ class PostWhatIfScenarios(ApiEndpoint):
         client: AuthenticatedClient | Client,
         **kwargs: Any,
     ) -> dict[str, Any]:
-        kwargs = self.update_input_kwargs(kwargs)
+        kwargs = self._prepare_kwargs(kwargs)
         return cast(dict[str, Any], super().execute(client=client, **kwargs))
 
 
 class PostRunTask(ApiEndpoint):
     endpoint_function = staticmethod(postruntask.sync_detailed)
+    async_endpoint_function = staticmethod(postruntask.asyncio_detailed)
+    time_args = ("start_time", "end_time", "time_zero")
+    time_arg_type = _RFC3339DateTime
+    body_model = PostruntaskBody
 
     def execute(self, *, client: AuthenticatedClient | Client, **kwargs: Any) -> str:
-        kwargs = self._prepare_body(kwargs)
-        body = kwargs.pop("body", None)
-        kwargs = self.update_input_kwargs(kwargs)
-        kwargs = self._format_time_args(kwargs)
-        if body is not None:
-            kwargs["body"] = body
+        kwargs = self._prepare_kwargs(kwargs)
         return cast(str, super().execute(client=client, **kwargs))
 
-    def _prepare_body(self, kwargs: dict[str, Any]) -> dict[str, Any]:
-        body = kwargs.get("body")
-        if body is None:
-            return kwargs
-        if isinstance(body, dict):
-            kwargs["body"] = PostruntaskBody.from_dict(body)
-            return kwargs
-        if isinstance(body, PostruntaskBody):
-            return kwargs
-        raise ValueError(
-            "Invalid argument value for body: Expected PostruntaskBody or dict, "
-            f"got {type(body)}"
-        )
-
-    def _format_time_args(self, kwargs: dict[str, Any]) -> dict[str, Any]:
-        for arg in ["start_time", "end_time", "time_zero"]:
-            if arg in kwargs and kwargs[arg] is not None:
-                if not isinstance(kwargs[arg], datetime):
-                    arg_type = type(kwargs[arg])
-                    raise ValueError(
-                        f"Invalid argument value for {arg}: Expected datetime,"
-                        f" got {arg_type}"
-                    )
-                kwargs[arg] = _RFC3339DateTime(format_datetime(kwargs[arg]))
-        return kwargs
-
 
 class Workflows(ApiEndpoint):
     endpoint_function = staticmethod(workflows.sync_detailed)
+    async_endpoint_function = staticmethod(workflows.asyncio_detailed)
+    request_kwargs_function = staticmethod(workflows._get_kwargs)
 
     def execute(
         self,
@@ -300,5 +256,5 @@ class Workflows(ApiEndpoint):
         client: AuthenticatedClient | Client,
         **kwargs: Any,
     ) -> dict[str, Any] | str:
-        kwargs = self.update_input_kwargs(kwargs)
+        kwargs = self._prepare_kwargs(kwargs)
         return cast(dict[str, Any] | str, super().execute(client=client, **kwargs))
@@ -0,0 +1,147 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import xarray as xr
+
+from fews_py_wrapper.pi_json import (
+    PI_JSON_HEADER_COLUMNS,
+    flatten_pi_json_events,
+    header_value,
+    validate_compact_options,
+)
+from fews_py_wrapper.utils import (
+    decode_label,
+    netcdf_parameter_id,
+    netcdf_series_variables,
+)
+
+__all__ = [
+    "LabelColumn",
+    "empty_netcdf_table_columns",
+    "netcdf_table_columns",
+    "pi_json_table_columns",
+]
+
+
+@dataclass
+class LabelColumn:
+    """A string column stored as codes into ``labels``, ``-1`` where missing."""
+
+    codes: np.ndarray
+    labels: list[str]
+
+
+def pi_json_table_columns(
+    content: dict[str, Any], value_dtype: str | None = None, flags: str = "keep"
+) -> dict[str, Any]:
+    """Return the long-layout columns of a PI JSON document as NumPy arrays.
+
+    Header fields become :class:`LabelColumn` objects; ``time`` holds naive
+    UTC ``datetime64[ns]`` values, ``value`` is ``NaN`` where missing. There is
+    no ``flag`` column with ``flags="drop"``.
+    """
+    validate_compact_options(value_dtype, flags)
+    events = flatten_pi_json_events(
+        content, value_dtype=value_dtype, parse_flags=flags != "drop"
+    )
+    columns: dict[str, Any] = {
+        name: _repeat_header_labels(
+            [header_value(header, name) for header in events.headers],
+            events.lengths,
+        )
+        for name in PI_JSON_HEADER_COLUMNS
+    }
+    columns["time"] = events.times
+    columns["value"] = events.values
+    if events.flags is not None:
+        columns["flag"] = events.flags
+    return columns
+
+
+def netcdf_table_columns(datasets: Iterable[xr.Dataset]) -> list[dict[str, Any]]:
+    """Return the long-layout columns of every NetCDF series variable.
+
+    Each variable on the ``time`` and ``stations`` dimensions gives one set of
+    columns in the layout of :func:`pi_json_table_columns` without ``flag``:
+    label columns for ``PI_JSON_HEADER_COLUMNS``, an optional ``forecastDate``
+    for an ``analysis_time`` dimension, ``time`` and ``value``. The values are
+    the raveled variable data, which is a view when the data is contiguous.
+    """
+    return [
+        _netcdf_variable_columns(dataset, name)
+        for dataset in datasets
+        for name in netcdf_series_variables(dataset)
+    ]
+
+
+def empty_netcdf_table_columns() -> dict[str, Any]:
+    """Return NetCDF long-layout columns without rows."""
+    columns: dict[str, Any] = {
+        name: LabelColumn(codes=np.empty(0, dtype=np.int32), labels=[])
+        for name in PI_JSON_HEADER_COLUMNS
+    }
+    columns["time"] = np.empty(0, dtype="datetime64[ns]")
+    columns["value"] = np.empty(0, dtype=np.float64)
+    return columns
+
+
+def _netcdf_variable_columns(dataset: xr.Dataset, name: str) -> dict[str, Any]:
+    """Return the long-layout columns of one NetCDF series variable."""
+    if "station_id" not in dataset.variables:
+        raise ValueError("Converting NetCDF datasets requires a station_id variable.")
+    variable = dataset[name].variable
+    dims = tuple(str(dim) for dim in variable.dims)
+    shape = variable.shape
+    values = np.ravel(variable.values)
+    missing = np.broadcast_to(np.int32(-1), values.shape)
+
+    columns: dict[str, Any] = {
+        "locationId": LabelColumn(
+            codes=_dimension_codes(shape, dims.index("stations")),
+            labels=[decode_label(item) for item in dataset["station_id"].values],
+        ),
+        "parameterId": LabelColumn(
+            codes=np.zeros(values.size, dtype=np.int32),
+            labels=[netcdf_parameter_id(dataset, name)],
+        ),
+        "qualifierId": LabelColumn(codes=missing, labels=[]),
+        "ensembleMemberIndex": LabelColumn(codes=missing, labels=[]),
+    }
+    if "realization" in dims:
+        members = (
+            dataset["realization"].values
+            if "realization" in dataset.variables
+            else np.arange(dataset.sizes["realization"])
+        )
+        columns["ensembleMemberIndex"] = LabelColumn(
+            codes=_dimension_codes(shape, dims.index("realization")),
+            labels=[str(member) for member in members],
+        )
+    if "analysis_time" in dims:
+        codes = _dimension_codes(shape, dims.index("analysis_time"))
+        columns["forecastDate"] = np.asarray(
+            dataset["analysis_time"].values, dtype="datetime64[ns]"
+        )[codes]
+    codes = _dimension_codes(shape, dims.index("time"))
+    columns["time"] = np.asarray(dataset["time"].values, dtype="datetime64[ns]")[codes]
+    columns["value"] = values
+    return columns
+
+
+def _dimension_codes(shape: tuple[int, ...], axis: int) -> np.ndarray:
+    """Return the index along ``axis`` of every value of a C-ordered array."""
+    index = np.arange(shape[axis], dtype=np.int32)
+    index = index.reshape([-1 if dim == axis else 1 for dim in range(len(shape))])
+    return np.broadcast_to(index, shape).ravel()
+
+
+def _repeat_header_labels(values: list[str | None], lengths: np.ndarray) -> LabelColumn:
+    """Build a label column that repeats one header value per event."""
+    per_series = pd.Categorical(values)
+    return LabelColumn(
+        codes=np.repeat(per_series.codes.astype(np.int32), lengths),
+        labels=per_series.categories.tolist(),
+    )
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import importlib.util
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+
+import numpy as np
+import xarray as xr
+
+from fews_py_wrapper._tables import (
+    LabelColumn,
+    empty_netcdf_table_columns,
+    netcdf_table_columns,
+    pi_json_table_columns,
+)
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+__all__ = [
+    "PARQUET_PARTITION_COLUMNS",
+    "netcdf_datasets_to_arrow",
+    "pi_json_to_arrow",
+    "write_parquet_dataset",
+]
+
+PARQUET_PARTITION_COLUMNS = ("parameterId", "locationId", "date")
+
+
+def pi_json_to_arrow(
+    content: dict[str, Any],
+    *,
+    value_dtype: str | None = None,
+    flags: str = "keep",
+) -> pa.Table:
+    """Convert a FEWS PI JSON time series document to a ``pyarrow.Table``.
+
+    The table has the same columns as the ``long`` layout of
+    :func:`fews_py_wrapper.pi_json.pi_json_to_dataframe`: the header fields in
+    ``PI_JSON_HEADER_COLUMNS`` as dictionary-encoded strings, ``time`` as a UTC
+    timestamp, ``value`` (null where equal to ``missVal``) and ``flag``. The
+    ``time``, ``value`` and ``flag`` columns wrap the parsed NumPy arrays
+    without copying them, and no pandas objects are built. ``value_dtype`` and
+    ``flags`` work as in :func:`fews_py_wrapper.pi_json.pi_json_to_dataframe`.
+
+    Requires the optional ``pyarrow`` dependency.
+    """
+    _require_pyarrow()
+    return _arrow_table(
+        pi_json_table_columns(content, value_dtype=value_dtype, flags=flags)
+    )
+
+
+def netcdf_datasets_to_arrow(datasets: Iterable[xr.Dataset]) -> pa.Table:
+    """Convert FEWS NetCDF member datasets to a single ``pyarrow.Table``.
+
+    Every variable on the ``time`` and ``stations`` dimensions, other than flag
+    and comment variables, becomes one block of rows with the columns of
+    :func:`pi_json_to_arrow` except ``flag``:
+    ``locationId`` from ``station_id``, ``parameterId`` from the
+    ``originalParameterId`` attribute (or the variable name when a member has
+    several variables), ``ensembleMemberIndex`` from ``realization``, ``time``
+    and ``value``. Variables with an ``analysis_time`` dimension add a
+    ``forecastDate`` column. Values keep their NetCDF data type and are not
+    copied when the variable is contiguous in memory; missing values are null.
+
+    Requires the optional ``pyarrow`` dependency.
+
+    Raises:
+        ValueError: If a member has a series variable but no ``station_id``.
+    """
+    _require_pyarrow()
+    import pyarrow as pa
+
+    tables = [_arrow_table(columns) for columns in netcdf_table_columns(datasets)]
+    if not tables:
+        return _arrow_table(empty_netcdf_table_columns())
+    return pa.concat_tables(tables, promote_options="permissive")
+
+
+def write_parquet_dataset(
+    table: pa.Table,
+    root_path: str | Path,
+    partition_by: Sequence[str] = PARQUET_PARTITION_COLUMNS,
+) -> Path:
+    """Write a time series table as a Hive-partitioned Parquet dataset.
+
+    ``table`` is a ``pyarrow.Table`` as returned by ``get_timeseries`` with
+    ``output="arrow"``. The rows are written to one directory per combination
+    of ``partition_by`` values below ``root_path``, such as
+    ``parameterId=H.obs/locationId=A/date=2025-03-14``. The ``date`` partition
+    is the UTC date of ``time`` and is derived when the table has no ``date``
+    column. Rows are grouped by partition first, so every partition gets a
+    single file per call. Every call adds new files, so several responses can
+    be written to the same dataset.
+
+    Requires the optional ``pyarrow`` dependency.
+
+    Returns:
+        The dataset root directory.
+
+    Raises:
+        ValueError: If ``table`` has no column for one of ``partition_by``.
+    """
+    _require_pyarrow()
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    missing = [
+        name
+        for name in partition_by
+        if name not in table.column_names and name != "date"
+    ]
+    if missing:
+        raise ValueError(
+            f"Cannot partition by missing column(s): {', '.join(missing)}."
+        )
+    if "date" in partition_by and "date" not in table.column_names:
+        table = table.append_column("date", pc.cast(table["time"], pa.date32()))
+    order, partition_count = _partition_order(table, partition_by)
+    root = Path(root_path)
+    pq.write_to_dataset(
+        table.take(order),
+        root,
+        partition_cols=list(partition_by),
+        max_partitions=partition_count,
+    )
+    return root
+
+
+def _require_pyarrow() -> None:
+    """Raise an ``ImportError`` with install instructions without pyarrow."""
+    if importlib.util.find_spec("pyarrow") is None:
+        raise ImportError(
+            "Arrow output requires pyarrow. Install it with "
+            "`pip install fews-py-wrapper[arrow]`."
+        )
+
+
+def _partition_order(
+    table: pa.Table, partition_by: Sequence[str]
+) -> tuple[np.ndarray, int]:
+    """Return a stable row order that groups rows by partition, and the count."""
+    import pyarrow.compute as pc
+    import pyarrow.types as pa_types
+
+    keys = []
+    for name in partition_by:
+        column = table[name].combine_chunks()
+        if not pa_types.is_dictionary(column.type):
+            column = pc.dictionary_encode(column)
+        indices = cast("pa.DictionaryArray", column).indices
+        keys.append(indices.fill_null(-1).to_numpy())
+    if not keys or not table.num_rows:
+        return np.arange(table.num_rows), 1
+    order = np.lexsort(keys[::-1])
+    sorted_keys = np.stack([key[order] for key in keys])
+    changes = np.any(sorted_keys[:, 1:] != sorted_keys[:, :-1], axis=0)
+    return order, int(np.count_nonzero(changes)) + 1
+
+
+def _arrow_table(columns: dict[str, Any]) -> pa.Table:
+    """Wrap long-layout NumPy columns as a table, without copying the arrays."""
+    import pyarrow as pa
+
+    arrays: dict[str, pa.Array] = {}
+    for name, column in columns.items():
+        if isinstance(column, LabelColumn) and not column.labels:
+            arrays[name] = pa.nulls(
+                len(column.codes), type=pa.dictionary(pa.int32(), pa.string())
+            )
+        elif isinstance(column, LabelColumn):
+            arrays[name] = pa.DictionaryArray.from_arrays(
+                pa.array(column.codes, type=pa.int32(), mask=column.codes < 0),
+                pa.array(column.labels, type=pa.string()),
+            )
+        elif np.issubdtype(column.dtype, np.datetime64):
+            arrays[name] = pa.array(column, type=pa.timestamp("ns", tz="UTC"))
+        elif np.issubdtype(column.dtype, np.floating):
+            arrays[name] = pa.array(column, mask=np.isnan(column))
+        else:
+            arrays[name] = pa.array(column)
+    return pa.table(arrays)
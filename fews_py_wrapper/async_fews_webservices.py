@@ -0,0 +1,759 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from datetime import datetime, timedelta
+from http import HTTPStatus
+from pathlib import Path
+from types import TracebackType
+from typing import IO, TYPE_CHECKING, Any, TypeVar
+
+import pandas as pd
+import xarray as xr
+
+from fews_py_wrapper._api import (
+    Filters,
+    Locations,
+    Parameters,
+    PostRunTask,
+    PostTimeSeries,
+    PostWhatIfScenarios,
+    Taskruns,
+    Taskrunstatus,
+    TimeSeries,
+    WhatIfScenarios,
+    WhatIfTemplates,
+    Workflows,
+)
+from fews_py_wrapper.fews_webservices import (
+    TimeSeriesFetchStats,
+    _FewsWebServiceClientBase,
+    _shared_result,
+    _timeseries_result_is_unshared,
+    _TimeSeriesDecoding,
+)
+from fews_py_wrapper.models import (
+    PiFilter,
+    PiLocation,
+    PiParameter,
+    PiTaskRun,
+    PiTaskRunStatusResponse,
+    PiWhatIfScenarioDescriptor,
+    PiWhatIfScenariosResponse,
+    PiWhatIfTemplate,
+    PiWhatIfTemplatesResponse,
+    PiWorkflow,
+)
+from fews_py_wrapper.pi_json import PiJsonSeriesDecoder
+from fews_py_wrapper.pi_xml import PiXmlSeries
+from fews_py_wrapper.utils import NetcdfMemberCache, NetcdfZipResponse
+
+if TYPE_CHECKING:
+    import polars as pl
+    import pyarrow as pa
+
+__all__ = ["AsyncFewsWebServiceClient"]
+
+T = TypeVar("T")
+
+
+class AsyncFewsWebServiceClient(_FewsWebServiceClientBase):
+    """Asynchronous client for interacting with FEWS web services.
+
+    Exposes the same public methods as
+    :class:`~fews_py_wrapper.fews_webservices.FewsWebServiceClient` as
+    coroutines. Requests are sent with the ``asyncio_detailed`` variants of the
+    generated FEWS OpenAPI client, and response decoding runs in worker threads
+    so large payloads do not block the event loop. With ``coalesce=True``,
+    concurrent identical ``get_*`` calls on the same event loop share one
+    request, and a ``cache`` reuses results as described for the synchronous
+    client.
+
+    Example:
+        ::
+
+            import asyncio
+
+            async def main():
+                async with AsyncFewsWebServiceClient(
+                    base_url="https://example.com/FewsWebServices/rest"
+                ) as client:
+                    locations, parameters = await asyncio.gather(
+                        client.get_locations(),
+                        client.get_parameters(),
+                    )
+                print(len(locations), len(parameters))
+
+            asyncio.run(main())
+    """
+
+    async def __aenter__(self) -> "AsyncFewsWebServiceClient":
+        if self.transport.prewarm:
+            await self.prewarm(self.transport.prewarm)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying asynchronous HTTP connection pool."""
+        await self.client.get_async_httpx_client().aclose()
+
+    async def prewarm(self, connections: int) -> None:
+        """Asynchronous variant of ``FewsWebServiceClient.prewarm``.
+
+        ``transport.prewarm`` connections are opened when the client is
+        entered with ``async with``.
+        """
+        connections = self._prewarm_connections(connections)
+        httpx_client = self.client.get_async_httpx_client()
+        await asyncio.gather(*(httpx_client.head("") for _ in range(connections)))
+
+    async def batch(
+        self,
+        calls: Iterable[Callable[[], Awaitable[T]]],
+        *,
+        max_workers: int = 4,
+        return_exceptions: bool = False,
+    ) -> list[T | BaseException]:
+        """Asynchronous variant of ``FewsWebServiceClient.batch``.
+
+        ``calls`` return awaitables, such as
+        ``partial(client.get_taskrunstatus, task_id="SA1_1")`` for this
+        client, and at most ``max_workers`` of them are awaited at a time.
+        """
+        calls = list(calls)
+        results: list[T | BaseException] = [None] * len(calls)  # type: ignore[list-item]
+        async for index, result in self.as_completed(
+            calls, max_workers=max_workers, return_exceptions=return_exceptions
+        ):
+            results[index] = result
+        return results
+
+    async def map(
+        self,
+        method: Callable[..., Awaitable[T]],
+        kwargs: Iterable[dict[str, Any]],
+        *,
+        max_workers: int = 4,
+        return_exceptions: bool = False,
+    ) -> list[T | BaseException]:
+        """Asynchronous variant of ``FewsWebServiceClient.map``."""
+        return await self.batch(
+            [functools.partial(method, **call_kwargs) for call_kwargs in kwargs],
+            max_workers=max_workers,
+            return_exceptions=return_exceptions,
+        )
+
+    async def as_completed(
+        self,
+        calls: Iterable[Callable[[], Awaitable[T]]],
+        *,
+        max_workers: int = 4,
+        return_exceptions: bool = False,
+    ) -> AsyncIterator[tuple[int, T | BaseException]]:
+        """Asynchronous variant of ``FewsWebServiceClient.as_completed``."""
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def run(index: int, call: Callable[[], Awaitable[T]]) -> Any:
+            async with semaphore:
+                try:
+                    return index, await call()
+                except Exception as exc:
+                    if not return_exceptions:
+                        raise
+                    return index, exc
+
+        tasks = [asyncio.ensure_future(run(*item)) for item in enumerate(calls)]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @_shared_result
+    async def get_locations(
+        self, *, output: str | None = None
+    ) -> list[PiLocation] | pl.DataFrame:
+        """Asynchronous variant of ``FewsWebServiceClient.get_locations``."""
+        self._validate_metadata_output(output)
+        content = await Locations().execute_async(
+            client=self.client, document_format="PI_JSON"
+        )
+        return await asyncio.to_thread(self._locations_from_content, content, output)
+
+    @_shared_result
+    async def get_parameters(
+        self, *, output: str | None = None
+    ) -> list[PiParameter] | pl.DataFrame:
+        """Asynchronous variant of ``FewsWebServiceClient.get_parameters``."""
+        self._validate_metadata_output(output)
+        content = await Parameters().execute_async(
+            client=self.client, document_format="PI_JSON"
+        )
+        return await asyncio.to_thread(self._parameters_from_content, content, output)
+
+    @_shared_result(unshared=_timeseries_result_is_unshared)
+    async def get_timeseries(
+        self,
+        *,
+        location_ids: list[str] | None = None,
+        parameter_ids: list[str] | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        document_format: str = "PI_NETCDF",
+        chunk: timedelta | None = None,
+        batch_size: int | None = None,
+        max_workers: int = 4,
+        decode_workers: int = 1,
+        lazy: bool = False,
+        spill_dir: str | Path | None = None,
+        merge: bool = False,
+        output: str | None = None,
+        layout: str = "long",
+        csv_engine: str = "c",
+        download_path: str | Path | None = None,
+        spool_size: int | None = None,
+        value_dtype: str | None = None,
+        flags: str = "keep",
+        skip_comments: bool = False,
+        variables: list[str] | None = None,
+        time_slice: slice | None = None,
+        station_ids: list[str] | None = None,
+        member_cache: NetcdfMemberCache | None = None,
+        stats: TimeSeriesFetchStats | None = None,
+        **kwargs: Any,
+    ) -> (
+        list[xr.Dataset]
+        | xr.Dataset
+        | pd.DataFrame
+        | dict[str, Any]
+        | str
+        | Iterator[PiXmlSeries]
+        | pa.Table
+        | pl.DataFrame
+        | NetcdfZipResponse
+    ):
+        """Asynchronous variant of ``FewsWebServiceClient.get_timeseries``.
+
+        ``PI_NETCDF`` ZIP responses are unpacked in a worker thread. When
+        ``chunk`` or ``batch_size`` is used, at most ``max_workers`` windows or
+        batches are requested concurrently. Partial (HTTP 206) responses are
+        continued in the same way as in the synchronous client.
+        """
+        decoding = self._timeseries_decoding(
+            document_format,
+            decode_workers=decode_workers,
+            lazy=lazy,
+            spill_dir=spill_dir,
+            merge=merge,
+            output=output,
+            layout=layout,
+            csv_engine=csv_engine,
+            download_path=download_path,
+            spool_size=spool_size,
+            value_dtype=value_dtype,
+            flags=flags,
+            skip_comments=skip_comments,
+            variables=variables,
+            time_slice=time_slice,
+            station_ids=station_ids,
+            member_cache=member_cache,
+        )
+        if download_path is not None and (chunk is not None or batch_size is not None):
+            raise ValueError(
+                "download_path cannot be combined with chunk or batch_size."
+            )
+
+        non_none_kwargs = self._collect_non_none_kwargs(
+            local_kwargs=locals().copy(),
+            pop_kwargs=[
+                "decoding",
+                "chunk",
+                "batch_size",
+                "max_workers",
+                "decode_workers",
+                "lazy",
+                "spill_dir",
+                "merge",
+                "output",
+                "layout",
+                "csv_engine",
+                "download_path",
+                "spool_size",
+                "value_dtype",
+                "flags",
+                "skip_comments",
+                "variables",
+                "time_slice",
+                "station_ids",
+                "member_cache",
+                "stats",
+            ],
+        )
+        if stats is None:
+            stats = TimeSeriesFetchStats()
+        result: (
+            list[xr.Dataset]
+            | NetcdfZipResponse
+            | dict[str, Any]
+            | str
+            | bytes
+            | Path
+            | IO[bytes]
+            | pd.DataFrame
+        )
+        if batch_size is not None:
+            result = await self._get_timeseries_in_batches(
+                non_none_kwargs,
+                decoding,
+                chunk,
+                batch_size,
+                max_workers,
+                stats,
+            )
+        elif chunk is not None:
+            result = await self._get_timeseries_in_windows(
+                non_none_kwargs, decoding, chunk, max_workers, stats
+            )
+        else:
+            result = await self._fetch_timeseries(non_none_kwargs, decoding, stats)
+        return await asyncio.to_thread(self._timeseries_output, result, decoding)
+
+    async def iter_timeseries(
+        self,
+        *,
+        location_ids: list[str] | None = None,
+        parameter_ids: list[str] | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Asynchronous variant of ``FewsWebServiceClient.iter_timeseries``.
+
+        Use it with ``async for``; series are yielded while the response body
+        is still being received.
+        """
+        endpoint_kwargs = self._streamed_timeseries_kwargs(locals().copy())
+        endpoint = TimeSeries()
+        async with endpoint.stream_async(
+            client=self.client, **endpoint_kwargs
+        ) as chunks:
+            if endpoint.status_code == HTTPStatus.PARTIAL_CONTENT:
+                self._warn_partial_timeseries_stream()
+            decoder = PiJsonSeriesDecoder(encoding=endpoint.response_encoding)
+            async for chunk in chunks:
+                for series in decoder.feed(chunk):
+                    yield series
+        for series in decoder.close():
+            yield series
+
+    async def _fetch_timeseries(
+        self,
+        endpoint_kwargs: dict[str, Any],
+        decoding: _TimeSeriesDecoding,
+        stats: TimeSeriesFetchStats,
+        semaphore: asyncio.Semaphore | None = None,
+    ) -> (
+        list[xr.Dataset]
+        | NetcdfZipResponse
+        | dict[str, Any]
+        | str
+        | bytes
+        | Path
+        | IO[bytes]
+        | pd.DataFrame
+    ):
+        """Fetch one time series request, continuing partial responses.
+
+        The continuation halves of a partial response are requested
+        concurrently, each holding ``semaphore`` while its request is open.
+        """
+        endpoint = TimeSeries()
+        endpoint.decode_text = decoding.decode_text
+        async with semaphore or contextlib.nullcontext():
+            started = time.perf_counter()
+            if decoding.downloads:
+                content = await endpoint.download_async(
+                    client=self.client, **decoding.download_kwargs(), **endpoint_kwargs
+                )
+            else:
+                content = await endpoint.execute_async(
+                    client=self.client, **endpoint_kwargs
+                )
+        partial = endpoint.status_code == HTTPStatus.PARTIAL_CONTENT
+        stats.record_response(
+            time.perf_counter() - started, endpoint.response_size, partial
+        )
+        if partial:
+            continuation_kwargs = self._split_partial_timeseries_kwargs(
+                endpoint_kwargs, decoding.document_format
+            )
+            if continuation_kwargs is not None:
+                self._close_timeseries_content(content)
+                stats.record_continuations(len(continuation_kwargs))
+                results = await asyncio.gather(
+                    *(
+                        self._fetch_timeseries(
+                            kwargs, decoding.for_continuation(), stats, semaphore
+                        )
+                        for kwargs in continuation_kwargs
+                    )
+                )
+                return await asyncio.to_thread(
+                    self._merge_timeseries_windows,
+                    list(results),
+                    decoding.document_format,
+                )
+        return await asyncio.to_thread(
+            self._timeseries_from_content,
+            content,
+            decoding,
+            endpoint.response_encoding,
+        )
+
+    async def _get_timeseries_in_windows(
+        self,
+        endpoint_kwargs: dict[str, Any],
+        decoding: _TimeSeriesDecoding,
+        chunk: timedelta,
+        max_workers: int,
+        stats: TimeSeriesFetchStats,
+    ) -> list[xr.Dataset] | NetcdfZipResponse | dict[str, Any]:
+        """Fetch time series per time window concurrently and merge them."""
+        window_kwargs = self._split_timeseries_kwargs(
+            endpoint_kwargs, chunk, decoding.document_format
+        )
+        semaphore = asyncio.Semaphore(max_workers)
+        results = await asyncio.gather(
+            *(
+                self._fetch_timeseries(kwargs, decoding, stats, semaphore)
+                for kwargs in window_kwargs
+            )
+        )
+        return await asyncio.to_thread(
+            self._merge_timeseries_windows, list(results), decoding.document_format
+        )
+
+    async def _get_timeseries_in_batches(
+        self,
+        endpoint_kwargs: dict[str, Any],
+        decoding: _TimeSeriesDecoding,
+        chunk: timedelta | None,
+        batch_size: int,
+        max_workers: int,
+        stats: TimeSeriesFetchStats,
+    ) -> list[xr.Dataset] | NetcdfZipResponse | dict[str, Any]:
+        """Fetch location x parameter batches in waves and merge them in order.
+
+        The requests of a wave, including the time windows of each batch, are
+        sent concurrently while at most ``max_workers`` of them are open.
+        """
+        planner = self._plan_timeseries_batches(
+            endpoint_kwargs, decoding.document_format, batch_size
+        )
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def fetch_batch(
+            kwargs: dict[str, Any],
+        ) -> tuple[Any, TimeSeriesFetchStats]:
+            batch_stats = TimeSeriesFetchStats()
+            if chunk is None:
+                return (
+                    await self._fetch_timeseries(
+                        kwargs, decoding, batch_stats, semaphore
+                    ),
+                    batch_stats,
+                )
+            results = await asyncio.gather(
+                *(
+                    self._fetch_timeseries(window, decoding, batch_stats, semaphore)
+                    for window in self._split_timeseries_kwargs(
+                        kwargs, chunk, decoding.document_format
+                    )
+                )
+            )
+            return (
+                await asyncio.to_thread(
+                    self._merge_timeseries_windows,
+                    list(results),
+                    decoding.document_format,
+                ),
+                batch_stats,
+            )
+
+        batch_results: list[Any] = []
+        while not planner.done:
+            wave = await asyncio.gather(
+                *(fetch_batch(kwargs) for kwargs in planner.next_wave(max_workers))
+            )
+            planner.record_wave(
+                [
+                    (batch_stats.elapsed_seconds, batch_stats.response_bytes)
+                    for _, batch_stats in wave
+                ]
+            )
+            for result, batch_stats in wave:
+                batch_results.append(result)
+                stats.merge(batch_stats)
+        return await asyncio.to_thread(
+            self._merge_timeseries_batches, batch_results, decoding.document_format
+        )
+
+    async def post_timeseries(
+        self,
+        *,
+        pi_time_series_xml_content: str | None = None,
+        pi_time_series_json_content: str | None = None,
+        filter_id: str | None = None,
+        convert_datum: bool | None = None,
+    ) -> str:
+        """Asynchronous variant of ``FewsWebServiceClient.post_timeseries``."""
+        endpoint_kwargs = self._post_timeseries_kwargs(
+            pi_time_series_xml_content,
+            pi_time_series_json_content,
+            filter_id,
+            convert_datum,
+        )
+        content = await PostTimeSeries().execute_async(
+            client=self.client, **endpoint_kwargs
+        )
+        return self._text_from_content(content, "POST timeseries")
+
+    @_shared_result
+    async def get_filters(
+        self,
+        filter_id: str | None = None,
+        *,
+        document_format: str | None = "PI_JSON",
+        document_version: str | None = None,
+    ) -> list[PiFilter] | str:
+        """Asynchronous variant of ``FewsWebServiceClient.get_filters``."""
+        endpoint_kwargs = self._collect_non_none_kwargs(
+            {
+                "filter_id": filter_id,
+                "document_format": document_format,
+                "document_version": document_version,
+            }
+        )
+        content = await Filters().execute_async(client=self.client, **endpoint_kwargs)
+        return await asyncio.to_thread(self._filters_from_content, content)
+
+    async def post_runtask(
+        self,
+        *,
+        workflow_id: str,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        time_zero: datetime | None = None,
+        cold_state_id: str | None = None,
+        scenario_id: str | None = None,
+        user_id: str | None = None,
+        description: str | None = None,
+        run_option: str | None = None,
+        run_locally_and_promote_to_server: bool | None = None,
+        pi_parameters_xml_content: str | None = None,
+    ) -> str:
+        """Asynchronous variant of ``FewsWebServiceClient.post_runtask``."""
+        request_body = self._collect_non_none_kwargs(
+            {
+                "piParametersXmlContent": pi_parameters_xml_content,
+            }
+        )
+        endpoint_kwargs = self._collect_non_none_kwargs(
+            {
+                "workflow_id": workflow_id,
+                "start_time": start_time,
+                "end_time": end_time,
+                "time_zero": time_zero,
+                "cold_state_id": cold_state_id,
+                "scenario_id": scenario_id,
+                "user_id": user_id,
+                "description": description,
+                "run_option": run_option,
+                "run_locally_and_promote_to_server": run_locally_and_promote_to_server,
+                "body": request_body or None,
+            }
+        )
+        content = await PostRunTask().execute_async(
+            client=self.client, **endpoint_kwargs
+        )
+        return self._text_from_content(content, "POST runtask")
+
+    @_shared_result
+    async def get_taskruns(
+        self,
+        *,
+        workflow_id: str,
+        topology_node_id: str | None = None,
+        forecast_count: int | str | None = None,
+        task_run_ids: list[str] | None = None,
+        scenario_id: str | None = None,
+        mc_id: str | None = None,
+        start_forecast_time: datetime | None = None,
+        end_forecast_time: datetime | None = None,
+        start_dispatch_time: datetime | None = None,
+        end_dispatch_time: datetime | None = None,
+        task_run_status_ids: list[str] | None = None,
+        only_forecasts: bool | None = None,
+        task_run_count: int | str | None = None,
+        only_current: bool | None = None,
+        document_format: str | None = "PI_JSON",
+        document_version: str | None = None,
+        output: str | None = None,
+    ) -> list[PiTaskRun] | str | pl.DataFrame:
+        """Asynchronous variant of ``FewsWebServiceClient.get_taskruns``."""
+        self._validate_metadata_output(output, document_format)
+        endpoint_kwargs = self._collect_non_none_kwargs(
+            {
+                "workflow_id": workflow_id,
+                "topology_node_id": topology_node_id,
+                "forecast_count": forecast_count,
+                "task_run_ids": task_run_ids,
+                "scenario_id": scenario_id,
+                "mc_id": mc_id,
+                "start_forecast_time": start_forecast_time,
+                "end_forecast_time": end_forecast_time,
+                "start_dispatch_time": start_dispatch_time,
+                "end_dispatch_time": end_dispatch_time,
+                "task_run_status_ids": task_run_status_ids,
+                "only_forecasts": only_forecasts,
+                "task_run_count": task_run_count,
+                "only_current": only_current,
+                "document_format": document_format,
+                "document_version": document_version,
+            }
+        )
+        content = await Taskruns().execute_async(client=self.client, **endpoint_kwargs)
+        return await asyncio.to_thread(self._taskruns_from_content, content, output)
+
+    @_shared_result
+    async def get_taskrunstatus(
+        self,
+        *,
+        task_id: str,
+        max_wait_millis: int | str | None = None,
+        document_format: str | None = "PI_JSON",
+        document_version: str | None = None,
+    ) -> PiTaskRunStatusResponse:
+        """Asynchronous variant of ``FewsWebServiceClient.get_taskrunstatus``."""
+        endpoint_kwargs = self._collect_non_none_kwargs(
+            {
+                "task_id": task_id,
+                "max_wait_millis": max_wait_millis,
+                "document_format": document_format,
+                "document_version": document_version,
+            }
+        )
+        content = await Taskrunstatus().execute_async(
+            client=self.client, **endpoint_kwargs
+        )
+        return await asyncio.to_thread(PiTaskRunStatusResponse.model_validate, content)
+
+    @_shared_result
+    async def get_whatiftemplates(
+        self,
+        *,
+        what_if_template_id: str | None = None,
+        document_format: str | None = "PI_JSON",
+        document_version: str | None = None,
+    ) -> list[PiWhatIfTemplate]:
+        """Asynchronous variant of ``FewsWebServiceClient.get_whatiftemplates``."""
+        endpoint_kwargs = self._collect_non_none_kwargs(
+            {
+                "what_if_template_id": what_if_template_id,
+                "document_format": document_format,
+                "document_version": document_version,
+            }
+        )
+        content = await WhatIfTemplates().execute_async(
+            client=self.client, **endpoint_kwargs
+        )
+        response = await asyncio.to_thread(
+            PiWhatIfTemplatesResponse.model_validate, content
+        )
+        return response.templates
+
+    @_shared_result
+    async def get_whatifscenarios(
+        self,
+        *,
+        what_if_template_id: str | None = None,
+        what_if_scenario_id: str | None = None,
+        workflow_id: str | None = None,
+        document_format: str | None = "PI_JSON",
+        document_version: str | None = None,
+    ) -> list[PiWhatIfScenarioDescriptor]:
+        """Asynchronous variant of ``FewsWebServiceClient.get_whatifscenarios``."""
+        endpoint_kwargs = self._collect_non_none_kwargs(
+            {
+                "what_if_template_id": what_if_template_id,
+                "what_if_scenario_id": what_if_scenario_id,
+                "workflow_id": workflow_id,
+                "document_format": document_format,
+                "document_version": document_version,
+            }
+        )
+        content = await WhatIfScenarios().execute_async(
+            client=self.client, **endpoint_kwargs
+        )
+        response = await asyncio.to_thread(
+            PiWhatIfScenariosResponse.model_validate, content
+        )
+        return response.scenario_descriptors
+
+    async def post_whatifscenarios(
+        self,
+        *,
+        what_if_template_id: str | None = None,
+        single_run_what_if: bool | None = None,
+        name: str | None = None,
+        document_format: str | None = "PI_JSON",
+        document_version: str | None = None,
+    ) -> PiWhatIfScenarioDescriptor:
+        """Asynchronous variant of ``FewsWebServiceClient.post_whatifscenarios``."""
+        endpoint_kwargs = self._collect_non_none_kwargs(
+            {
+                "what_if_template_id": what_if_template_id,
+                "single_run_what_if": single_run_what_if,
+                "name": name,
+                "document_format": document_format,
+                "document_version": document_version,
+            }
+        )
+        content = await PostWhatIfScenarios().execute_async(
+            client=self.client, **endpoint_kwargs
+        )
+        return await asyncio.to_thread(
+            PiWhatIfScenarioDescriptor.model_validate, content
+        )
+
+    async def execute_workflow(self, *args: Any, **kwargs: Any) -> str:
+        """Backward-compatible alias for :meth:`post_runtask`."""
+        return await self.post_runtask(*args, **kwargs)
+
+    @_shared_result
+    async def get_workflows(
+        self,
+        *,
+        document_format: str | None = "PI_JSON",
+        document_version: str | None = None,
+    ) -> list[PiWorkflow] | str:
+        """Asynchronous variant of ``FewsWebServiceClient.get_workflows``."""
+        endpoint_kwargs = self._collect_non_none_kwargs(
+            {
+                "document_format": document_format,
+                "document_version": document_version,
+            }
+        )
+        content = await Workflows().execute_async(client=self.client, **endpoint_kwargs)
+        return await asyncio.to_thread(self._workflows_from_content, content)
@@ -1,11 +1,37 @@
-import inspect
-from datetime import datetime
-from typing import Any
+from __future__ import annotations
 
+import asyncio
+import concurrent.futures
+import dataclasses
+import functools
+import importlib.util
+import inspect
+import io
+import itertools
+import sys
+import threading
+import time
+import warnings
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from http import HTTPStatus
+from pathlib import Path, PurePath
+from typing import IO, TYPE_CHECKING, Any, TypeVar, cast
+from urllib.parse import quote
+
+import httpx
+import numpy as np
+import pandas as pd
 import xarray as xr
 from fews_openapi_py_client import AuthenticatedClient, Client
+from pydantic import AliasChoices, BaseModel
 
 from fews_py_wrapper._api import (
+    DEFAULT_SPOOL_SIZE,
     Filters,
     Locations,
     Parameters,
@@ -19,6 +45,7 @@ from fews_py_wrapper._api import (
     WhatIfTemplates,
     Workflows,
 )
+from fews_py_wrapper.arrow import netcdf_datasets_to_arrow, pi_json_to_arrow
 from fews_py_wrapper.models import (
     PiFilter,
     PiFiltersResponse,
@@ -36,15 +63,744 @@ from fews_py_wrapper.models import (
     PiWorkflow,
     PiWorkflowsResponse,
 )
-from fews_py_wrapper.utils import convert_netcdf_zip_response_to_xarray
+from fews_py_wrapper.pi_csv import CSV_ENGINES, pi_csv_to_dataframe
+from fews_py_wrapper.pi_json import (
+    DATAFRAME_LAYOUTS,
+    PI_JSON_COMMENT_FIELDS,
+    drop_pi_json_event_fields,
+    iter_pi_json_series,
+    pi_json_to_dataframe,
+    pi_json_to_xarray,
+    validate_compact_options,
+)
+from fews_py_wrapper.pi_xml import PiXmlSeries, iter_pi_xml_series
+from fews_py_wrapper.polars import (
+    netcdf_datasets_to_polars,
+    pi_json_to_polars,
+    pi_records_to_polars,
+)
+from fews_py_wrapper.utils import (
+    NetcdfMemberCache,
+    NetcdfZipResponse,
+    concat_netcdf_station_batches,
+    concat_netcdf_time_chunks,
+    concat_netcdf_zip_responses,
+    convert_netcdf_zip_response_to_xarray,
+    merge_netcdf_datasets,
+    merge_pi_json_time_chunks,
+    open_netcdf_zip_response_lazily,
+    split_time_window,
+    validate_time_slice,
+)
+
+if TYPE_CHECKING:
+    import polars as pl
+    import pyarrow as pa
+
+__all__ = [
+    "FewsWebServiceClient",
+    "ResponseCache",
+    "TimeSeriesFetchStats",
+    "TransportConfig",
+]
 
-__all__ = ["FewsWebServiceClient"]
+T = TypeVar("T")
 
 PI_TIMESERIES_DOCUMENT_FORMATS = frozenset({"PI_JSON", "PI_XML", "PI_CSV", "PI_NETCDF"})
+MERGEABLE_TIMESERIES_DOCUMENT_FORMATS = frozenset({"PI_JSON", "PI_NETCDF"})
+# Output conversions of get_timeseries and the document formats they accept.
+TIMESERIES_OUTPUT_DOCUMENT_FORMATS = {
+    "pandas": frozenset({"PI_JSON", "PI_CSV"}),
+    "xarray": frozenset({"PI_JSON"}),
+    "numpy": frozenset({"PI_XML"}),
+    "arrow": frozenset({"PI_JSON", "PI_NETCDF"}),
+    "polars": frozenset({"PI_JSON", "PI_NETCDF"}),
+    "members": frozenset({"PI_NETCDF"}),
+}
+# Output conversions of get_locations, get_parameters and get_taskruns.
+METADATA_OUTPUTS = ("polars",)
+MAX_TIMESERIES_QUERY_LENGTH = 6000
+TIMESERIES_BATCH_TARGET_SECONDS = 30.0
+TIMESERIES_BATCH_TARGET_BYTES = 64 * 1024 * 1024
+MIN_TIMESERIES_CONTINUATION_WINDOW = timedelta(minutes=1)
+CACHEABLE_METHODS = frozenset(
+    {
+        "get_locations",
+        "get_parameters",
+        "get_timeseries",
+        "get_filters",
+        "get_taskruns",
+        "get_whatiftemplates",
+        "get_whatifscenarios",
+        "get_workflows",
+    }
+)
+RESPONSE_CACHE_TTL = {
+    "get_locations": 300.0,
+    "get_parameters": 300.0,
+    "get_filters": 300.0,
+    "get_workflows": 300.0,
+    "get_whatiftemplates": 300.0,
+}
+
+_MISSING = object()
+_RESULT_SIZE_SAMPLE = 64
+_CLIENT_GENERATIONS = itertools.count()
+
+
+@dataclass(frozen=True)
+class TransportConfig:
+    """HTTP connection settings shared by every request of a client.
+
+    Pass an instance as ``transport`` to the client. The defaults match
+    httpx: a pool of at most 100 connections of which 20 are kept alive for
+    5 seconds, and no timeouts. Raise ``max_keepalive_connections`` to the
+    number of concurrent requests (``max_workers`` of chunked and batched
+    calls) so that connections are reused instead of reopened.
+
+    Attributes:
+        max_connections: Maximum number of open connections; ``None`` for no
+            limit. Further requests wait up to ``pool_timeout`` for a free one.
+        max_keepalive_connections: Idle connections kept open for reuse.
+        keepalive_expiry: Seconds an idle connection is kept open.
+        connect_timeout: Seconds to wait for a connection to be established.
+        read_timeout: Seconds to wait for a chunk of the response.
+        write_timeout: Seconds to wait for a chunk of the request to be sent.
+        pool_timeout: Seconds to wait for a free connection from the pool.
+        http2: Negotiate HTTP/2 with servers that support it, multiplexing
+            concurrent requests over one connection. Requires the ``http2``
+            extra.
+        prewarm: Number of connections opened when the client is created, so
+            the first requests do not pay for connection and TLS setup. See
+            :meth:`FewsWebServiceClient.prewarm`.
+    """
+
+    max_connections: int | None = 100
+    max_keepalive_connections: int | None = 20
+    keepalive_expiry: float | None = 5.0
+    connect_timeout: float | None = None
+    read_timeout: float | None = None
+    write_timeout: float | None = None
+    pool_timeout: float | None = None
+    http2: bool = False
+    prewarm: int = 0
+
+    def __post_init__(self) -> None:
+        for name in (
+            "max_connections",
+            "max_keepalive_connections",
+            "keepalive_expiry",
+            "connect_timeout",
+            "read_timeout",
+            "write_timeout",
+            "pool_timeout",
+        ):
+            value = getattr(self, name)
+            if value is not None and value < 0:
+                raise ValueError(f"{name} must not be negative.")
+        if self.prewarm < 0:
+            raise ValueError("prewarm must not be negative.")
+
+    def client_kwargs(self) -> dict[str, Any]:
+        """Return the transport arguments of the generated FEWS clients."""
+        if self.http2 and importlib.util.find_spec("h2") is None:
+            raise ImportError(
+                "HTTP/2 requires the h2 package. Install it with "
+                "`pip install fews-py-wrapper[http2]`."
+            )
+        return {
+            "timeout": httpx.Timeout(
+                connect=self.connect_timeout,
+                read=self.read_timeout,
+                write=self.write_timeout,
+                pool=self.pool_timeout,
+            ),
+            "httpx_args": {
+                "limits": httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                    keepalive_expiry=self.keepalive_expiry,
+                ),
+                "http2": self.http2,
+            },
+        }
+
+
+@dataclass
+class TimeSeriesFetchStats:
+    """Request statistics collected while fetching time series.
+
+    Pass an instance as ``stats`` to ``get_timeseries`` to see how many HTTP
+    requests a call needed. ``continuation_requests`` counts the extra requests
+    issued to complete HTTP 206 partial responses. Instances may be shared by
+    concurrent calls.
+    """
+
+    requests: int = 0
+    partial_responses: int = 0
+    continuation_requests: int = 0
+    response_bytes: int = 0
+    elapsed_seconds: float = 0.0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    def record_response(
+        self, elapsed_seconds: float, response_bytes: int, partial: bool
+    ) -> None:
+        """Record one completed HTTP request."""
+        with self._lock:
+            self.requests += 1
+            self.partial_responses += int(partial)
+            self.response_bytes += response_bytes
+            self.elapsed_seconds += elapsed_seconds
+
+    def record_continuations(self, count: int) -> None:
+        """Record continuation requests issued for a partial response."""
+        with self._lock:
+            self.continuation_requests += count
+
+    def merge(self, other: "TimeSeriesFetchStats") -> None:
+        """Add the counters of another statistics object."""
+        with self._lock:
+            self.requests += other.requests
+            self.partial_responses += other.partial_responses
+            self.continuation_requests += other.continuation_requests
+            self.response_bytes += other.response_bytes
+            self.elapsed_seconds += other.elapsed_seconds
+
+
+class ResponseCache:
+    """Bounded in-memory cache of parsed client results with a TTL per method.
+
+    Pass an instance as ``cache`` to a client to reuse the results of
+    ``get_*`` calls for ``ttl[method]`` seconds instead of requesting and
+    validating them again. Results are keyed by the method and its normalized
+    arguments, so ``get_timeseries(location_ids=["A"])`` and
+    ``get_timeseries(location_ids=("A",))`` share an entry. Only the
+    metadata methods in ``RESPONSE_CACHE_TTL`` are cached by default; set a
+    TTL for ``get_timeseries`` or other methods in ``CACHEABLE_METHODS`` to
+    cache them too. ``get_taskrunstatus`` is never cached, since the status of
+    a task run changes while it runs.
+
+    Entries are evicted least recently used first once the estimated size of
+    the cached results exceeds ``max_bytes``. Results larger than
+    ``max_entry_bytes``, such as large time series queries, and results that
+    hold files or streams (downloads, lazy datasets, ``output="members"``
+    and PI XML iterators) are not cached. Cached results are shared between
+    callers and must not be modified in place. The cache is safe to share
+    between threads and clients; each client only reuses its own entries and
+    starts afresh after ``authenticate``.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        *,
+        ttl: Mapping[str, float] | None = None,
+        max_entry_bytes: int | None = None,
+    ) -> None:
+        if max_bytes < 0:
+            raise ValueError("max_bytes must not be negative.")
+        if max_entry_bytes is not None and max_entry_bytes < 0:
+            raise ValueError("max_entry_bytes must not be negative.")
+        self.ttl = {**RESPONSE_CACHE_TTL, **(ttl or {})}
+        for method, seconds in self.ttl.items():
+            if method not in CACHEABLE_METHODS:
+                raise ValueError(
+                    f"Unsupported cached method {method!r}. "
+                    f"Expected one of {sorted(CACHEABLE_METHODS)}."
+                )
+            if seconds < 0:
+                raise ValueError(f"ttl of {method} must not be negative.")
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = (
+            max_bytes // 8 if max_entry_bytes is None else max_entry_bytes
+        )
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self._entries: OrderedDict[tuple[Any, ...], tuple[float, int, Any]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self, method: str | None = None) -> None:
+        """Remove all cached results, or only those of ``method``."""
+        with self._lock:
+            for key in list(self._entries):
+                if method is None or key[0] == method:
+                    self._remove(key)
+
+    def _get(self, key: tuple[Any, ...]) -> Any:
+        """Return the cached result for ``key``, or ``_MISSING``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return _MISSING
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def _put(self, key: tuple[Any, ...], result: Any) -> None:
+        """Cache ``result`` if its method has a TTL and it is small enough."""
+        ttl = self.ttl.get(key[0])
+        if not ttl:
+            return
+        nbytes = _result_nbytes(result)
+        if nbytes is None or nbytes > min(self.max_entry_bytes, self.max_bytes):
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + ttl, nbytes, result)
+            self.nbytes += nbytes
+            while self.nbytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: tuple[Any, ...]) -> None:
+        self.nbytes -= self._entries.pop(key)[1]
+
+
+def _result_nbytes(result: Any) -> int | None:
+    """Estimate the memory held by a parsed client result.
+
+    Long lists, such as thousands of locations, are estimated from an evenly
+    spaced sample of ``_RESULT_SIZE_SAMPLE`` items. Returns ``None`` for
+    results that must not be cached because they hold open files, streams or
+    lazily loaded data.
+    """
+    if result is None or isinstance(result, (str, bytes, int, float, datetime)):
+        return sys.getsizeof(result)
+    if isinstance(result, xr.Dataset):
+        return None if result.chunks else result.nbytes
+    if isinstance(result, pd.DataFrame):
+        return int(result.memory_usage(deep=True).sum())
+    if isinstance(result, pd.Series):
+        return int(result.memory_usage(deep=True))
+    if isinstance(result, np.ndarray):
+        return result.nbytes
+    scale = 1.0
+    if isinstance(result, (list, tuple)):
+        items: Iterable[Any] = result
+        if len(result) > _RESULT_SIZE_SAMPLE:
+            items = result[:: len(result) // _RESULT_SIZE_SAMPLE][:_RESULT_SIZE_SAMPLE]
+            scale = len(result) / _RESULT_SIZE_SAMPLE
+    elif isinstance(result, dict):
+        items = itertools.chain.from_iterable(result.items())
+    elif isinstance(result, (BaseModel, PiXmlSeries)):
+        items = vars(result).values()
+    elif hasattr(result, "estimated_size"):
+        return int(result.estimated_size())  # polars.DataFrame
+    elif type(result).__module__.startswith("pyarrow"):
+        return int(result.nbytes)
+    else:
+        return None
+    total = 0
+    for item in items:
+        nbytes = _result_nbytes(item)
+        if nbytes is None:
+            return None
+        total += nbytes
+    return sys.getsizeof(result) + int(total * scale)
+
+
+@dataclass(frozen=True)
+class _TimeSeriesDecoding:
+    """How time series responses of one ``get_timeseries`` call are decoded."""
+
+    document_format: str
+    decode_workers: int = 1
+    lazy: bool = False
+    spill_dir: str | Path | None = None
+    merge: bool = False
+    output: str | None = None
+    layout: str = "long"
+    csv_engine: str = "c"
+    download_path: str | Path | None = None
+    spool_size: int | None = None
+    value_dtype: str | None = None
+    flags: str = "keep"
+    skip_comments: bool = False
+    variables: list[str] | None = None
+    time_slice: slice | None = None
+    station_ids: list[str] | None = None
+    member_cache: NetcdfMemberCache | None = None
+
+    @property
+    def downloads(self) -> bool:
+        """Whether responses are streamed to a file instead of memory.
+
+        ``PI_XML`` responses parsed with ``output="numpy"`` are always
+        streamed, so the parser never holds the whole document.
+        """
+        return (
+            self.download_path is not None
+            or self.spool_size is not None
+            or self.output == "numpy"
+        )
+
+    def download_kwargs(self) -> dict[str, Any]:
+        """Return the file arguments of ``ApiEndpoint.download``."""
+        return {
+            "download_path": self.download_path,
+            "spool_size": DEFAULT_SPOOL_SIZE
+            if self.spool_size is None
+            else self.spool_size,
+        }
+
+    def for_continuation(self) -> "_TimeSeriesDecoding":
+        """Decoding for the continuation requests of a partial response.
+
+        Continuations are spooled instead of overwriting ``download_path``.
+        """
+        return dataclasses.replace(self, download_path=None)
+
+    @property
+    def decode_text(self) -> bool:
+        """Whether text responses are decoded to strings when received.
+
+        Output conversions of text formats parse the response bytes directly.
+        """
+        return self.output is None
+
+    def netcdf_decode_kwargs(self) -> dict[str, Any]:
+        """Return the subset and compact options of the NetCDF decoding functions."""
+        return {
+            "value_dtype": self.value_dtype,
+            "flags": self.flags,
+            "skip_comments": self.skip_comments,
+            "variables": self.variables,
+            "time_slice": self.time_slice,
+            "station_ids": self.station_ids,
+        }
+
+    def netcdf_member_kwargs(self) -> dict[str, Any]:
+        """Return the options of a lazily decoded ``NetcdfZipResponse``."""
+        kwargs = self.netcdf_decode_kwargs()
+        del kwargs["variables"]
+        return {**kwargs, "cache": self.member_cache}
+
+    def pi_json_compact_kwargs(self) -> dict[str, Any]:
+        """Return the compact options of the PI JSON output conversions."""
+        return {"value_dtype": self.value_dtype, "flags": self.flags}
+
+    @property
+    def dropped_pi_json_event_fields(self) -> tuple[str, ...]:
+        """Event fields removed from raw PI JSON responses."""
+        dropped: tuple[str, ...] = ("flag",) if self.flags == "drop" else ()
+        if self.skip_comments:
+            dropped += PI_JSON_COMMENT_FIELDS
+        return dropped
+
+
+class _TimeSeriesBatchPlanner:
+    """Plan location x parameter batches for large time series queries.
+
+    Location IDs are cut into consecutive batches of at most ``batch_size`` IDs
+    whose encoded query stays below ``MAX_TIMESERIES_QUERY_LENGTH``. Parameter
+    IDs are split into groups by query length only. Each location batch is
+    combined with every parameter group, so batches follow the input order.
+
+    After each wave of requests, the location batch size is adapted to the
+    slowest or largest response: batches shrink when responses exceed
+    ``TIMESERIES_BATCH_TARGET_SECONDS`` or ``TIMESERIES_BATCH_TARGET_BYTES``
+    and grow back towards ``batch_size`` when responses are well below them.
+    """
+
+    def __init__(
+        self,
+        endpoint_kwargs: dict[str, Any],
+        batch_size: int,
+        max_query_length: int = MAX_TIMESERIES_QUERY_LENGTH,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer.")
+        self.endpoint_kwargs = endpoint_kwargs
+        self.max_batch_size = batch_size
+        self.batch_size = batch_size
+        self._location_ids: list[str] = list(endpoint_kwargs.get("location_ids") or [])
+        self._position = 0
+        self._started = False
+
+        parameter_ids = list(endpoint_kwargs.get("parameter_ids") or [])
+        self._parameter_groups: list[list[str] | None] = (
+            list(
+                self._split_by_query_length(
+                    parameter_ids, "parameterIds", max_query_length // 2
+                )
+            )
+            if parameter_ids
+            else [None]
+        )
+        self._location_query_budget = max_query_length - max(
+            self._query_length("parameterIds", group or [])
+            for group in self._parameter_groups
+        )
 
+    @property
+    def done(self) -> bool:
+        if not self._location_ids:
+            return self._started
+        return self._position >= len(self._location_ids)
+
+    def next_wave(self, max_batches: int) -> list[dict[str, Any]]:
+        """Return endpoint kwargs for up to ``max_batches`` location batches."""
+        wave: list[dict[str, Any]] = []
+        self._started = True
+        if not self._location_ids:
+            return [self._batch_kwargs(None, group) for group in self._parameter_groups]
+        for _ in range(max_batches):
+            if self.done:
+                break
+            location_batch = self._next_location_batch()
+            wave.extend(
+                self._batch_kwargs(location_batch, group)
+                for group in self._parameter_groups
+            )
+        return wave
+
+    def record_wave(self, measurements: list[tuple[float, int]]) -> None:
+        """Adapt the batch size to measured ``(seconds, bytes)`` per request."""
+        if not measurements:
+            return
+        load = max(
+            max(
+                seconds / TIMESERIES_BATCH_TARGET_SECONDS,
+                size / TIMESERIES_BATCH_TARGET_BYTES,
+            )
+            for seconds, size in measurements
+        )
+        if load > 1:
+            self.batch_size = max(1, int(self.batch_size / load))
+        elif load < 0.5:
+            self.batch_size = min(self.max_batch_size, self.batch_size * 2)
+
+    def _next_location_batch(self) -> list[str]:
+        batch: list[str] = []
+        query_length = 0
+        while self._position < len(self._location_ids) and len(batch) < (
+            self.batch_size
+        ):
+            location_id = self._location_ids[self._position]
+            id_length = self._query_length("locationIds", [location_id])
+            if batch and query_length + id_length > self._location_query_budget:
+                break
+            batch.append(location_id)
+            query_length += id_length
+            self._position += 1
+        return batch
+
+    def _batch_kwargs(
+        self, location_ids: list[str] | None, parameter_ids: list[str] | None
+    ) -> dict[str, Any]:
+        kwargs = dict(self.endpoint_kwargs)
+        if location_ids is not None:
+            kwargs["location_ids"] = location_ids
+        if parameter_ids is not None:
+            kwargs["parameter_ids"] = parameter_ids
+        return kwargs
+
+    @classmethod
+    def _split_by_query_length(
+        cls, ids: list[str], name: str, max_length: int
+    ) -> list[list[str]]:
+        groups: list[list[str]] = [[]]
+        group_length = 0
+        for identifier in ids:
+            id_length = cls._query_length(name, [identifier])
+            if groups[-1] and group_length + id_length > max_length:
+                groups.append([])
+                group_length = 0
+            groups[-1].append(identifier)
+            group_length += id_length
+        return groups
+
+    @staticmethod
+    def _query_length(name: str, ids: list[str]) -> int:
+        """Length of ``name=id&`` pairs as encoded in the request URL."""
+        return sum(len(name) + len(quote(str(value), safe="")) + 2 for value in ids)
+
+
+def _canonical_argument(value: Any) -> Hashable:
+    """Return a hashable form of ``value`` that compares equal for equal requests.
+
+    Sequences become tuples, sets frozensets, mappings sorted item tuples and
+    timezone-aware datetimes are converted to UTC. Scalars keep their type so
+    that, for example, ``1`` and ``True`` do not match.
+
+    Raises:
+        TypeError: For any other type, such as statistics collectors,
+            caches or file objects, whose identity matters to the call.
+    """
+    if value is None or isinstance(value, (str, bytes, int, float, Enum)):
+        return type(value), value
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+        return datetime, value
+    if isinstance(value, (timedelta, PurePath)):
+        return type(value), value
+    if isinstance(value, (list, tuple)):
+        return tuple, tuple(_canonical_argument(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset, frozenset(_canonical_argument(item) for item in value)
+    if isinstance(value, dict):
+        return dict, tuple(
+            sorted((str(key), _canonical_argument(item)) for key, item in value.items())
+        )
+    if isinstance(value, slice):
+        return slice, tuple(
+            _canonical_argument(bound)
+            for bound in (value.start, value.stop, value.step)
+        )
+    raise TypeError(f"{type(value).__name__} cannot be part of a coalescing key.")
+
+
+def _shared_result(
+    func: Callable[..., Any] | None = None,
+    *,
+    unshared: Callable[[dict[str, Any]], bool] | None = None,
+) -> Any:
+    """Let calls of a client GET method share cached and in-flight results.
+
+    When the client coalesces calls or caches results of this method (see
+    :class:`ResponseCache`), the arguments of a call are normalized with
+    :func:`_canonical_argument`, defaults included, into a key together with
+    the method and the generated client in use. A cached result for the key is
+    returned without a request. Otherwise, with ``coalesce=True``, a call whose
+    key is already in flight waits for that call and returns its result, or
+    raises its exception, instead of sending its own request. Calls with
+    arguments that cannot be normalized always run on their own, as do calls
+    for which ``unshared`` returns ``True`` given their keyword arguments,
+    such as calls returning iterators or open files.
+    """
+    if func is None:
+        return functools.partial(_shared_result, unshared=unshared)
+    signature = inspect.signature(func)
+    name = func.__name__
+    # Defaults are normalized once; a call only normalizes what it passes.
+    defaults = {
+        parameter_name: _canonical_argument(parameter.default)
+        for parameter_name, parameter in signature.parameters.items()
+        if parameter.default is not inspect.Parameter.empty
+    }
+
+    def call_key(
+        client: _FewsWebServiceClientBase, args: Any, kwargs: Any
+    ) -> tuple[Any, ...] | None:
+        cached = client.cache is not None and bool(client.cache.ttl.get(name))
+        if not client.coalesce and not cached:
+            return None
+        try:
+            if args:
+                bound = signature.bind(client, *args, **kwargs)
+                kwargs = dict(list(bound.arguments.items())[1:])
+            if unshared is not None and unshared(kwargs):
+                return None
+            arguments = defaults.copy()
+            others = []
+            for argument, value in kwargs.items():
+                if argument in arguments:
+                    arguments[argument] = _canonical_argument(value)
+                else:
+                    others.append((argument, _canonical_argument(value)))
+        except TypeError:
+            # Invalid calls run on their own, so they raise their usual error.
+            return None
+        return (
+            name,
+            client._client_generation,
+            tuple(arguments.values()),
+            tuple(sorted(others)),
+        )
 
-class FewsWebServiceClient:
-    """Client for interacting with FEWS web services."""
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(
+            self: _FewsWebServiceClientBase, *args: Any, **kwargs: Any
+        ) -> Any:
+            key = call_key(self, args, kwargs)
+            if key is None:
+                return await func(self, *args, **kwargs)
+            result = self._cached_result(key)
+            if result is not _MISSING:
+                return result
+
+            async def call() -> Any:
+                result = await func(self, *args, **kwargs)
+                self._cache_result(key, result)
+                return result
+
+            if not self.coalesce:
+                return await call()
+            flight_key = key + (id(asyncio.get_running_loop()),)
+            with self._in_flight_lock:
+                task = self._in_flight.get(flight_key)
+                if task is None:
+                    task = asyncio.ensure_future(call())
+                    self._in_flight[flight_key] = task
+                    task.add_done_callback(
+                        functools.partial(self._finish_async_flight, flight_key)
+                    )
+            # Shielded, so cancelling one caller does not cancel the others.
+            return await asyncio.shield(task)
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(self: _FewsWebServiceClientBase, *args: Any, **kwargs: Any) -> Any:
+        key = call_key(self, args, kwargs)
+        if key is None:
+            return func(self, *args, **kwargs)
+        result = self._cached_result(key)
+        if result is not _MISSING:
+            return result
+        if not self.coalesce:
+            result = func(self, *args, **kwargs)
+            self._cache_result(key, result)
+            return result
+        with self._in_flight_lock:
+            in_flight = self._in_flight.get(key)
+            if in_flight is None:
+                future: concurrent.futures.Future[Any] = concurrent.futures.Future()
+                self._in_flight[key] = future
+        if in_flight is not None:
+            return in_flight.result()
+        try:
+            result = func(self, *args, **kwargs)
+            self._cache_result(key, result)
+        except BaseException as exc:
+            self._finish_flight(key)
+            future.set_exception(exc)
+            raise
+        self._finish_flight(key)
+        future.set_result(result)
+        return result
+
+    return wrapper
+
+
+def _timeseries_result_is_unshared(kwargs: dict[str, Any]) -> bool:
+    """Return whether ``get_timeseries`` returns an iterator or open files."""
+    return (
+        kwargs.get("output") in ("numpy", "members")
+        or bool(kwargs.get("lazy"))
+        or kwargs.get("download_path") is not None
+        or kwargs.get("spool_size") is not None
+    )
+
+
+class _FewsWebServiceClientBase:
+    """Shared construction and response handling for the FEWS clients."""
 
     client: Client | AuthenticatedClient
 
@@ -54,29 +810,857 @@ class FewsWebServiceClient:
         authenticate: bool = False,
         token: str | None = None,
         verify_ssl: bool = True,
+        transport: TransportConfig | None = None,
+        coalesce: bool = False,
+        cache: ResponseCache | None = None,
     ) -> None:
         self.base_url = base_url
+        self.transport = transport or TransportConfig()
+        self.coalesce = coalesce
+        self.cache = cache
+        self._in_flight: dict[tuple[Any, ...], Any] = {}
+        self._in_flight_lock = threading.Lock()
         if authenticate:
             if not token:
                 raise ValueError("Token must be provided for authentication.")
             self.authenticate(token, verify_ssl)
         else:
-            self.client = Client(base_url=base_url, verify_ssl=verify_ssl)
+            self._use_client(
+                Client(
+                    base_url=base_url,
+                    verify_ssl=verify_ssl,
+                    **self.transport.client_kwargs(),
+                )
+            )
 
     def authenticate(self, token: str, verify_ssl: bool) -> None:
-        """Authenticate with the FEWS web services."""
-        self.client = AuthenticatedClient(
-            base_url=self.base_url, token=token, verify_ssl=verify_ssl
+        """Authenticate with the FEWS web services.
+
+        Requests that are already running finish with the previous
+        credentials; requests started afterwards use the new ones.
+        """
+        self._use_client(
+            AuthenticatedClient(
+                base_url=self.base_url,
+                token=token,
+                verify_ssl=verify_ssl,
+                **self.transport.client_kwargs(),
+            )
+        )
+
+    def _use_client(self, client: Client | AuthenticatedClient) -> None:
+        """Switch new requests to ``client``.
+
+        The client and its generation are swapped together under the in-flight
+        lock, the client first, so a call keyed on the new generation always
+        requests with the new client.
+        """
+        with self._in_flight_lock:
+            self.client = client
+            # Identifies results and in-flight calls of this client and
+            # credentials.
+            self._client_generation = next(_CLIENT_GENERATIONS)
+
+    def _cached_result(self, key: tuple[Any, ...]) -> Any:
+        """Return the cached result for ``key``, or ``_MISSING``."""
+        if self.cache is None:
+            return _MISSING
+        return self.cache._get(key)
+
+    def _cache_result(self, key: tuple[Any, ...], result: Any) -> None:
+        if self.cache is not None:
+            self.cache._put(key, result)
+
+    def _finish_flight(self, key: tuple[Any, ...]) -> None:
+        """Let calls with ``key`` started from now on send a new request."""
+        with self._in_flight_lock:
+            del self._in_flight[key]
+
+    def _finish_async_flight(self, key: tuple[Any, ...], task: asyncio.Task) -> None:
+        self._finish_flight(key)
+        if not task.cancelled():
+            # Retrieve the exception so it is not reported as never retrieved
+            # when every caller was cancelled.
+            task.exception()
+
+    def _prewarm_connections(self, connections: int) -> int:
+        """Validate and bound the number of connections to open."""
+        if connections < 0:
+            raise ValueError("connections must not be negative.")
+        limits = [
+            limit
+            for limit in (
+                self.transport.max_connections,
+                self.transport.max_keepalive_connections,
+            )
+            if limit is not None
+        ]
+        return min([connections, *limits])
+
+    def endpoint_arguments(self, endpoint: str) -> list[str]:
+        """Get the arguments for a specific FEWS web service endpoint.
+
+        Args:
+            endpoint: The name of the endpoint, options: ``timeseries``,
+                ``post_timeseries``, ``post_runtask``, ``taskruns``,
+                ``taskrunstatus``, ``whatiftemplates``, ``whatifscenarios``,
+                ``post_whatifscenarios``, ``filters``, and ``workflows``.
+
+        Returns:
+            The argument names for the specified endpoint.
+        """
+        if endpoint == "timeseries":
+            return TimeSeries().input_args()
+        elif endpoint == "post_timeseries":
+            return list(inspect.signature(getattr(self, "post_timeseries")).parameters)
+        elif endpoint == "post_runtask":
+            return list(inspect.signature(getattr(self, "post_runtask")).parameters)
+        elif endpoint == "taskruns":
+            return list(inspect.signature(getattr(self, "get_taskruns")).parameters)
+        elif endpoint == "taskrunstatus":
+            return list(
+                inspect.signature(getattr(self, "get_taskrunstatus")).parameters
+            )
+        elif endpoint == "whatiftemplates":
+            return list(
+                inspect.signature(getattr(self, "get_whatiftemplates")).parameters
+            )
+        elif endpoint == "whatifscenarios":
+            return list(
+                inspect.signature(getattr(self, "get_whatifscenarios")).parameters
+            )
+        elif endpoint == "post_whatifscenarios":
+            return list(
+                inspect.signature(getattr(self, "post_whatifscenarios")).parameters
+            )
+        elif endpoint == "filters":
+            return list(inspect.signature(getattr(self, "get_filters")).parameters)
+        elif endpoint == "workflows":
+            return list(inspect.signature(getattr(self, "get_workflows")).parameters)
+        else:
+            raise ValueError(f"Unknown endpoint: {endpoint}")
+
+    def _collect_non_none_kwargs(
+        self, local_kwargs: dict[str, Any], pop_kwargs: list[str] | None = None
+    ) -> dict[str, Any]:
+        """Collect only non-None keyword arguments."""
+        local_kwargs.pop("self", None)
+        for key in pop_kwargs or []:
+            local_kwargs.pop(key, None)
+        if "kwargs" in local_kwargs:
+            extra_kwargs = local_kwargs.pop("kwargs")
+            if isinstance(extra_kwargs, dict):
+                local_kwargs.update(extra_kwargs)
+        return {k: v for k, v in local_kwargs.items() if v is not None}
+
+    def _validate_timeseries_document_format(self, document_format: Any) -> str:
+        """Return the plain document format value or raise for non-PI formats."""
+        document_format_value = getattr(document_format, "value", document_format)
+
+        if document_format_value not in PI_TIMESERIES_DOCUMENT_FORMATS:
+            supported_formats = ", ".join(sorted(PI_TIMESERIES_DOCUMENT_FORMATS))
+            raise ValueError(
+                "Unsupported timeseries document_format for this PI-focused wrapper: "
+                f"{document_format_value}. Supported formats are: {supported_formats}."
+            )
+        return cast(str, document_format_value)
+
+    def _streamed_timeseries_kwargs(
+        self, local_kwargs: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Collect the endpoint kwargs of an ``iter_timeseries`` call."""
+        non_none_kwargs = self._collect_non_none_kwargs(local_kwargs=local_kwargs)
+        document_format_value = self._validate_timeseries_document_format(
+            non_none_kwargs.get("document_format", "PI_JSON")
+        )
+        if document_format_value != "PI_JSON":
+            raise ValueError(
+                "iter_timeseries only supports PI_JSON responses, not "
+                f"{document_format_value}."
+            )
+        non_none_kwargs["document_format"] = document_format_value
+        return non_none_kwargs
+
+    def _warn_partial_timeseries_stream(self) -> None:
+        """Warn that a streamed time series response was truncated by FEWS."""
+        warnings.warn(
+            "FEWS returned a partial (HTTP 206) time series response. Streamed "
+            "responses are not continued, so the yielded series are incomplete. "
+            "Use get_timeseries to continue partial responses automatically.",
+            stacklevel=3,
+        )
+
+    def _timeseries_decoding(
+        self,
+        document_format: Any,
+        *,
+        decode_workers: int = 1,
+        lazy: bool = False,
+        spill_dir: str | Path | None = None,
+        merge: bool = False,
+        output: str | None = None,
+        layout: str = "long",
+        csv_engine: str = "c",
+        download_path: str | Path | None = None,
+        spool_size: int | None = None,
+        value_dtype: str | None = None,
+        flags: str = "keep",
+        skip_comments: bool = False,
+        variables: list[str] | None = None,
+        time_slice: slice | None = None,
+        station_ids: list[str] | None = None,
+        member_cache: NetcdfMemberCache | None = None,
+    ) -> _TimeSeriesDecoding:
+        """Validate the decode options of a ``get_timeseries`` call."""
+        document_format_value = self._validate_timeseries_document_format(
+            document_format
+        )
+        if lazy and document_format_value != "PI_NETCDF":
+            raise ValueError(
+                "lazy is only supported for PI_NETCDF responses, not "
+                f"{document_format_value}."
+            )
+        if merge and document_format_value != "PI_NETCDF":
+            raise ValueError(
+                "merge is only supported for PI_NETCDF responses, not "
+                f"{document_format_value}."
+            )
+        if merge and lazy:
+            raise ValueError("merge cannot be combined with lazy.")
+        if output is not None:
+            if output not in TIMESERIES_OUTPUT_DOCUMENT_FORMATS:
+                raise ValueError(
+                    f"Unsupported output '{output}'. Supported outputs are: "
+                    f"{', '.join(TIMESERIES_OUTPUT_DOCUMENT_FORMATS)}."
+                )
+            supported_formats = TIMESERIES_OUTPUT_DOCUMENT_FORMATS[output]
+            if document_format_value not in supported_formats:
+                raise ValueError(
+                    f"output='{output}' is not supported for "
+                    f"{document_format_value} responses. Supported formats are: "
+                    f"{', '.join(sorted(supported_formats))}."
+                )
+        if output is not None and (merge or lazy):
+            raise ValueError("output cannot be combined with merge or lazy.")
+        if layout not in DATAFRAME_LAYOUTS:
+            raise ValueError(
+                f"Unsupported layout '{layout}'. Supported layouts are: "
+                f"{', '.join(DATAFRAME_LAYOUTS)}."
+            )
+        if (
+            (download_path is not None or spool_size is not None)
+            and document_format_value != "PI_NETCDF"
+            and output != "numpy"
+        ):
+            raise ValueError(
+                "download_path and spool_size are only supported for PI_NETCDF "
+                f"responses and output='numpy', not {document_format_value}."
+            )
+        if spool_size is not None and spool_size < 0:
+            raise ValueError("spool_size must not be negative.")
+        if csv_engine not in CSV_ENGINES:
+            raise ValueError(
+                f"Unsupported CSV engine '{csv_engine}'. Supported engines are: "
+                f"{', '.join(CSV_ENGINES)}."
+            )
+        validate_compact_options(value_dtype, flags)
+        compacts = value_dtype is not None or flags != "keep" or skip_comments
+        if compacts and document_format_value not in ("PI_JSON", "PI_NETCDF"):
+            raise ValueError(
+                "value_dtype, flags and skip_comments are only supported for "
+                f"PI_JSON and PI_NETCDF responses, not {document_format_value}."
+            )
+        subsets = (
+            variables is not None or time_slice is not None or station_ids is not None
+        )
+        if subsets and document_format_value != "PI_NETCDF":
+            raise ValueError(
+                "variables, time_slice and station_ids are only supported for "
+                f"PI_NETCDF responses, not {document_format_value}."
+            )
+        validate_time_slice(time_slice)
+        if member_cache is not None and (document_format_value != "PI_NETCDF" or lazy):
+            raise ValueError(
+                "member_cache is only supported for PI_NETCDF responses that are "
+                "not opened lazily."
+            )
+        if output == "members" and variables is not None:
+            raise ValueError(
+                "variables cannot be combined with output='members'; select "
+                "members with NetcdfZipResponse.for_parameter instead."
+            )
+        if (
+            document_format_value == "PI_JSON"
+            and output is None
+            and (value_dtype is not None or flags == "pack")
+        ):
+            raise ValueError(
+                "value_dtype and flags='pack' require an output for PI_JSON responses."
+            )
+        return _TimeSeriesDecoding(
+            document_format=document_format_value,
+            decode_workers=decode_workers,
+            lazy=lazy,
+            spill_dir=spill_dir,
+            merge=merge,
+            output=output,
+            layout=layout,
+            csv_engine=csv_engine,
+            download_path=download_path,
+            spool_size=spool_size,
+            value_dtype=value_dtype,
+            flags=flags,
+            skip_comments=skip_comments,
+            variables=variables,
+            time_slice=time_slice,
+            station_ids=station_ids,
+            member_cache=member_cache,
         )
 
-    def get_locations(self) -> list[PiLocation]:
+    def _timeseries_from_content(
+        self, content: Any, decoding: _TimeSeriesDecoding, encoding: str = "utf-8"
+    ) -> (
+        list[xr.Dataset]
+        | NetcdfZipResponse
+        | dict[str, Any]
+        | str
+        | bytes
+        | Path
+        | IO[bytes]
+        | pd.DataFrame
+    ):
+        """Convert parsed time series content to the public return type.
+
+        ``encoding`` is the response charset, which ``PI_CSV`` responses are
+        parsed with for ``output="pandas"``.
+        """
+        document_format_value = decoding.document_format
+        if document_format_value == "PI_NETCDF":
+            if not isinstance(content, (bytes, Path, io.IOBase)):
+                raise ValueError(
+                    "Expected PI_NETCDF response content as bytes or a file."
+                )
+            content = cast(bytes | Path | IO[bytes], content)
+            if decoding.output == "members":
+                try:
+                    return NetcdfZipResponse(content, **decoding.netcdf_member_kwargs())
+                except Exception:
+                    self._close_timeseries_content(content)
+                    raise
+            try:
+                if decoding.lazy:
+                    return open_netcdf_zip_response_lazily(
+                        content,
+                        spill_dir=decoding.spill_dir,
+                        **decoding.netcdf_decode_kwargs(),
+                    )
+                return convert_netcdf_zip_response_to_xarray(
+                    content,
+                    max_workers=decoding.decode_workers,
+                    cache=decoding.member_cache,
+                    **decoding.netcdf_decode_kwargs(),
+                )
+            finally:
+                self._close_timeseries_content(content)
+        if document_format_value == "PI_JSON":
+            if not isinstance(content, dict):
+                raise ValueError("Expected PI_JSON response content as a dictionary.")
+            if decoding.output is None:
+                return drop_pi_json_event_fields(
+                    content, decoding.dropped_pi_json_event_fields
+                )
+            return content
+        if decoding.output == "numpy" and isinstance(content, (Path, io.IOBase)):
+            return cast(Path | IO[bytes], content)
+        if decoding.output == "pandas" and document_format_value == "PI_CSV":
+            if not isinstance(content, bytes):
+                raise ValueError("Expected PI_CSV response content as bytes.")
+            return pi_csv_to_dataframe(
+                content, decoding.layout, engine=decoding.csv_engine, encoding=encoding
+            )
+        if not decoding.decode_text:
+            if not isinstance(content, bytes):
+                raise ValueError(
+                    f"Expected {document_format_value} response content as bytes."
+                )
+            return content
+        if not isinstance(content, str):
+            raise ValueError(
+                f"Expected {document_format_value} response content as a string."
+            )
+        return content
+
+    def _close_timeseries_content(self, content: Any) -> None:
+        """Close a spooled response file once it is no longer needed."""
+        if isinstance(content, io.IOBase):
+            content.close()
+
+    def _iter_pi_xml_series(self, content: Path | IO[bytes]) -> Iterator[PiXmlSeries]:
+        """Parse a downloaded PI XML response, closing it once exhausted."""
+        try:
+            yield from iter_pi_xml_series(content)
+        finally:
+            self._close_timeseries_content(content)
+
+    def _timeseries_output(
+        self,
+        result: list[xr.Dataset]
+        | NetcdfZipResponse
+        | dict[str, Any]
+        | str
+        | bytes
+        | Path
+        | IO[bytes]
+        | pd.DataFrame,
+        decoding: _TimeSeriesDecoding,
+    ) -> (
+        list[xr.Dataset]
+        | xr.Dataset
+        | pd.DataFrame
+        | dict[str, Any]
+        | str
+        | Iterator[PiXmlSeries]
+        | pa.Table
+        | pl.DataFrame
+        | NetcdfZipResponse
+    ):
+        """Convert the assembled time series result to the requested output."""
+        if decoding.merge:
+            return merge_netcdf_datasets(cast(list[xr.Dataset], result))
+        if decoding.output == "pandas" and decoding.document_format == "PI_CSV":
+            return cast(pd.DataFrame, result)
+        if decoding.output == "pandas":
+            return pi_json_to_dataframe(
+                cast(dict[str, Any], result),
+                decoding.layout,
+                **decoding.pi_json_compact_kwargs(),
+            )
+        if decoding.output == "xarray":
+            return pi_json_to_xarray(
+                cast(dict[str, Any], result), value_dtype=decoding.value_dtype
+            )
+        if decoding.output == "numpy":
+            return self._iter_pi_xml_series(cast(Path | IO[bytes], result))
+        if decoding.output == "arrow" and decoding.document_format == "PI_NETCDF":
+            return netcdf_datasets_to_arrow(cast(list[xr.Dataset], result))
+        if decoding.output == "arrow":
+            return pi_json_to_arrow(
+                cast(dict[str, Any], result), **decoding.pi_json_compact_kwargs()
+            )
+        if decoding.output == "polars" and decoding.document_format == "PI_NETCDF":
+            return netcdf_datasets_to_polars(cast(list[xr.Dataset], result))
+        if decoding.output == "polars":
+            return pi_json_to_polars(
+                cast(dict[str, Any], result), **decoding.pi_json_compact_kwargs()
+            )
+        return cast(list[xr.Dataset] | NetcdfZipResponse | dict[str, Any] | str, result)
+
+    def _split_timeseries_kwargs(
+        self,
+        endpoint_kwargs: dict[str, Any],
+        chunk: timedelta,
+        document_format_value: str,
+    ) -> list[dict[str, Any]]:
+        """Split time series endpoint kwargs into one set per time window."""
+        if document_format_value not in MERGEABLE_TIMESERIES_DOCUMENT_FORMATS:
+            supported_formats = ", ".join(sorted(MERGEABLE_TIMESERIES_DOCUMENT_FORMATS))
+            raise ValueError(
+                f"chunk is not supported for {document_format_value} responses. "
+                f"Supported formats are: {supported_formats}."
+            )
+        start_time = endpoint_kwargs.get("start_time")
+        end_time = endpoint_kwargs.get("end_time")
+        if start_time is None or end_time is None:
+            raise ValueError("start_time and end_time are required when using chunk.")
+        return [
+            {**endpoint_kwargs, "start_time": window_start, "end_time": window_end}
+            for window_start, window_end in split_time_window(
+                start_time, end_time, chunk
+            )
+        ]
+
+    def _split_partial_timeseries_kwargs(
+        self,
+        endpoint_kwargs: dict[str, Any],
+        document_format_value: str,
+    ) -> list[dict[str, Any]] | None:
+        """Split the window of a partial (HTTP 206) response into two halves.
+
+        Returns ``None`` and warns when the request cannot be continued, in
+        which case the partial content is returned as is.
+        """
+        start_time = endpoint_kwargs.get("start_time")
+        end_time = endpoint_kwargs.get("end_time")
+        reason = None
+        if document_format_value not in MERGEABLE_TIMESERIES_DOCUMENT_FORMATS:
+            reason = f"{document_format_value} responses cannot be merged"
+        elif start_time is None or end_time is None:
+            reason = "start_time and end_time were not provided"
+        elif end_time - start_time < MIN_TIMESERIES_CONTINUATION_WINDOW:
+            reason = "the requested window cannot be split any further"
+        if reason is not None or start_time is None or end_time is None:
+            warnings.warn(
+                "FEWS returned a partial (HTTP 206) time series response that "
+                f"could not be continued because {reason}. The returned content "
+                "is incomplete.",
+                stacklevel=4,
+            )
+            return None
+
+        middle = (start_time + (end_time - start_time) / 2).replace(microsecond=0)
+        return [
+            {**endpoint_kwargs, "end_time": middle},
+            {**endpoint_kwargs, "start_time": middle},
+        ]
+
+    def _plan_timeseries_batches(
+        self,
+        endpoint_kwargs: dict[str, Any],
+        document_format_value: str,
+        batch_size: int,
+    ) -> _TimeSeriesBatchPlanner:
+        """Create the batch planner for a batched time series query."""
+        if document_format_value not in MERGEABLE_TIMESERIES_DOCUMENT_FORMATS:
+            supported_formats = ", ".join(sorted(MERGEABLE_TIMESERIES_DOCUMENT_FORMATS))
+            raise ValueError(
+                f"batch_size is not supported for {document_format_value} "
+                f"responses. Supported formats are: {supported_formats}."
+            )
+        return _TimeSeriesBatchPlanner(endpoint_kwargs, batch_size)
+
+    def _merge_timeseries_batches(
+        self,
+        results: list[Any],
+        document_format_value: str,
+    ) -> list[xr.Dataset] | NetcdfZipResponse | dict[str, Any]:
+        """Stitch per-batch time series results together in batch order."""
+        if document_format_value == "PI_NETCDF" and isinstance(
+            results[0], NetcdfZipResponse
+        ):
+            return concat_netcdf_zip_responses(results, "stations")
+        if document_format_value == "PI_NETCDF":
+            return concat_netcdf_station_batches(results)
+        # Batches never share a series, so merging keeps them in batch order.
+        return merge_pi_json_time_chunks(results)
+
+    def _merge_timeseries_windows(
+        self,
+        results: list[Any],
+        document_format_value: str,
+    ) -> list[xr.Dataset] | NetcdfZipResponse | dict[str, Any]:
+        """Stitch per-window time series results into one result."""
+        if document_format_value == "PI_NETCDF" and isinstance(
+            results[0], NetcdfZipResponse
+        ):
+            return concat_netcdf_zip_responses(results, "time")
+        if document_format_value == "PI_NETCDF":
+            return concat_netcdf_time_chunks(results)
+        return merge_pi_json_time_chunks(results)
+
+    def _post_timeseries_kwargs(
+        self,
+        pi_time_series_xml_content: str | None,
+        pi_time_series_json_content: str | None,
+        filter_id: str | None,
+        convert_datum: bool | None,
+    ) -> dict[str, Any]:
+        """Build the endpoint kwargs for ``POST /timeseries``."""
+        if pi_time_series_xml_content is None and pi_time_series_json_content is None:
+            raise ValueError(
+                "One of pi_time_series_xml_content or "
+                "pi_time_series_json_content must be provided."
+            )
+
+        request_body = self._collect_non_none_kwargs(
+            {
+                "piTimeSeriesXmlContent": pi_time_series_xml_content,
+                "piTimeSeriesJsonContent": pi_time_series_json_content,
+            }
+        )
+
+        return self._collect_non_none_kwargs(
+            {
+                "body": request_body,
+                "filter_id": filter_id,
+                "convert_datum": convert_datum,
+            }
+        )
+
+    def _text_from_content(self, content: Any, description: str) -> str:
+        """Return text content or raise when the response was not text."""
+        if not isinstance(content, str):
+            raise ValueError(f"Expected {description} response content as a string.")
+        return content
+
+    def _filters_from_content(self, content: Any) -> list[PiFilter] | str:
+        if isinstance(content, dict):
+            return PiFiltersResponse.model_validate(content).filters
+        return self._text_from_content(content, "filters")
+
+    def _validate_metadata_output(
+        self, output: str | None, document_format: str | None = "PI_JSON"
+    ) -> None:
+        """Validate the ``output`` option of a metadata call."""
+        if output is None:
+            return
+        if output not in METADATA_OUTPUTS:
+            raise ValueError(
+                f"Unsupported output '{output}'. Supported outputs are: "
+                f"{', '.join(METADATA_OUTPUTS)}."
+            )
+        if document_format != "PI_JSON":
+            raise ValueError(
+                f"output='{output}' requires document_format='PI_JSON', not "
+                f"{document_format}."
+            )
+
+    def _records_from_content(
+        self, content: Any, response_model: type[BaseModel], field_name: str
+    ) -> list[dict[str, Any]]:
+        """Return the raw entries of a PI JSON metadata response, unvalidated."""
+        if not isinstance(content, dict):
+            raise ValueError("Expected PI_JSON response content as a dictionary.")
+        alias = response_model.model_fields[field_name].validation_alias
+        keys = alias.choices if isinstance(alias, AliasChoices) else [field_name]
+        for key in keys:
+            if isinstance(key, str) and key in content:
+                return content[key] or []
+        return []
+
+    def _locations_from_content(
+        self, content: Any, output: str | None = None
+    ) -> list[PiLocation] | pl.DataFrame:
+        if output == "polars":
+            return pi_records_to_polars(
+                self._records_from_content(content, PiLocationsResponse, "locations"),
+                PiLocation,
+            )
+        return PiLocationsResponse.model_validate(content).locations
+
+    def _parameters_from_content(
+        self, content: Any, output: str | None = None
+    ) -> list[PiParameter] | pl.DataFrame:
+        if output == "polars":
+            return pi_records_to_polars(
+                self._records_from_content(content, PiParametersResponse, "parameters"),
+                PiParameter,
+            )
+        return PiParametersResponse.model_validate(content).parameters
+
+    def _taskruns_from_content(
+        self, content: Any, output: str | None = None
+    ) -> list[PiTaskRun] | str | pl.DataFrame:
+        if output == "polars":
+            return pi_records_to_polars(
+                self._records_from_content(content, PiTaskRunsResponse, "task_runs"),
+                PiTaskRun,
+            )
+        if isinstance(content, dict):
+            return PiTaskRunsResponse.model_validate(content).task_runs
+        return self._text_from_content(content, "taskruns")
+
+    def _workflows_from_content(self, content: Any) -> list[PiWorkflow] | str:
+        if isinstance(content, dict):
+            return PiWorkflowsResponse.model_validate(content).workflows
+        return self._text_from_content(content, "workflows")
+
+
+class FewsWebServiceClient(_FewsWebServiceClientBase):
+    """Client for interacting with FEWS web services.
+
+    All requests share the HTTP connection pool configured by ``transport``,
+    see :class:`TransportConfig`. Connections are opened up front when
+    ``transport.prewarm`` is set.
+
+    A client is thread-safe: one instance can be shared by many threads, and
+    :meth:`batch`, :meth:`map` and :meth:`as_completed` run many calls
+    concurrently. Every call creates its own endpoint object and request
+    state, and the httpx connection pool is created with the client rather
+    than by the first request.
+
+    With ``coalesce=True``, concurrent identical ``get_*`` calls share one
+    request: a call whose method and arguments, after normalization, match a
+    call that is still running waits for it and returns the same result
+    object. Results are then shared between callers and must not be modified
+    in place. Calls with arguments that carry state, such as ``stats`` or
+    ``member_cache``, and ``get_timeseries`` calls that return iterators or
+    open files, such as ``output="numpy"`` or ``lazy=True``, are never
+    coalesced.
+
+    Pass a :class:`ResponseCache` as ``cache`` to reuse the results of
+    ``get_*`` calls, by default of the metadata methods, for a TTL per method.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        authenticate: bool = False,
+        token: str | None = None,
+        verify_ssl: bool = True,
+        transport: TransportConfig | None = None,
+        coalesce: bool = False,
+        cache: ResponseCache | None = None,
+    ) -> None:
+        super().__init__(
+            base_url, authenticate, token, verify_ssl, transport, coalesce, cache
+        )
+        if self.transport.prewarm:
+            self.prewarm(self.transport.prewarm)
+
+    def prewarm(self, connections: int) -> None:
+        """Open connections to the FEWS server ahead of the first requests.
+
+        Sends ``connections`` concurrent ``HEAD`` requests to ``base_url``, so
+        that many connections (at most the pool's keep-alive limit) are
+        established and kept alive for reuse. Response statuses are ignored.
+
+        Raises:
+            httpx.TransportError: If the server cannot be reached.
+        """
+        connections = self._prewarm_connections(connections)
+        if not connections:
+            return
+        httpx_client = self.client.get_httpx_client()
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            list(executor.map(lambda _: httpx_client.head(""), range(connections)))
+
+    def _use_client(self, client: Client | AuthenticatedClient) -> None:
+        # Create the connection pool before any thread can send a request, so
+        # concurrent first requests do not each create one.
+        client.get_httpx_client()
+        super()._use_client(client)
+
+    def batch(
+        self,
+        calls: Iterable[Callable[[], T]],
+        *,
+        max_workers: int = 4,
+        return_exceptions: bool = False,
+    ) -> list[T | BaseException]:
+        """Run many client calls concurrently and return results in input order.
+
+        Args:
+            calls: Calls without arguments, typically built with
+                ``functools.partial`` from methods of this client, such as
+                ``partial(client.get_taskrunstatus, task_id="SA1_1")``. Calls
+                of different methods can be mixed.
+            max_workers: Maximum number of calls that run at the same time.
+            return_exceptions: Return the exception of a failed call in its
+                place instead of raising it.
+
+        Returns:
+            The result of each call, in the order of ``calls``.
+
+        Raises:
+            Exception: The first exception raised by a call, unless
+                ``return_exceptions`` is set. Calls that have not started yet
+                are cancelled.
+
+        Example:
+            ::
+
+                from functools import partial
+
+                locations, status, datasets = client.batch(
+                    [
+                        client.get_locations,
+                        partial(client.get_taskrunstatus, task_id="SA1_1"),
+                        partial(client.get_timeseries, parameter_ids=["H.obs"]),
+                    ]
+                )
+        """
+        calls = list(calls)
+        results: list[T | BaseException] = [None] * len(calls)  # type: ignore[list-item]
+        for index, result in self.as_completed(
+            calls, max_workers=max_workers, return_exceptions=return_exceptions
+        ):
+            results[index] = result
+        return results
+
+    def map(
+        self,
+        method: Callable[..., T],
+        kwargs: Iterable[dict[str, Any]],
+        *,
+        max_workers: int = 4,
+        return_exceptions: bool = False,
+    ) -> list[T | BaseException]:
+        """Call one client method with many sets of arguments concurrently.
+
+        Args:
+            method: A method of this client, such as ``client.get_timeseries``.
+            kwargs: The keyword arguments of each call.
+            max_workers: Maximum number of calls that run at the same time.
+            return_exceptions: Return exceptions in place of results, see
+                :meth:`batch`.
+
+        Returns:
+            The result of each call, in the order of ``kwargs``.
+
+        Example:
+            ::
+
+                statuses = client.map(
+                    client.get_taskrunstatus,
+                    [{"task_id": task_id} for task_id in task_ids],
+                    max_workers=8,
+                )
+        """
+        return self.batch(
+            [functools.partial(method, **call_kwargs) for call_kwargs in kwargs],
+            max_workers=max_workers,
+            return_exceptions=return_exceptions,
+        )
+
+    def as_completed(
+        self,
+        calls: Iterable[Callable[[], T]],
+        *,
+        max_workers: int = 4,
+        return_exceptions: bool = False,
+    ) -> Iterator[tuple[int, T | BaseException]]:
+        """Run many client calls concurrently and yield results as they finish.
+
+        Takes the same arguments as :meth:`batch`, but yields an
+        ``(index, result)`` pair for every call as soon as it completes, where
+        ``index`` is the position of the call in ``calls``. Calls that have
+        not started are cancelled when the iterator is closed or a call fails.
+        """
+        calls = list(calls)
+        if not calls:
+            return
+        executor = ThreadPoolExecutor(max_workers=min(max_workers, len(calls)))
+        try:
+            futures = {executor.submit(call): index for index, call in enumerate(calls)}
+            for future in concurrent.futures.as_completed(futures):
+                exception = future.exception()
+                if exception is not None and not return_exceptions:
+                    raise exception
+                yield (
+                    futures[future],
+                    future.result() if exception is None else exception,
+                )
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    @_shared_result
+    def get_locations(
+        self, *, output: str | None = None
+    ) -> list[PiLocation] | pl.DataFrame:
         """Get locations from the FEWS web services as a typed PI model.
 
+        Args:
+            output: Pass ``"polars"`` to get a ``polars.DataFrame`` with one row
+                per location, built column-wise from the response without
+                validating every entry. See
+                :func:`fews_py_wrapper.polars.pi_records_to_polars`.
+
         Returns:
             A list of typed PI locations containing location identifiers,
             coordinates, names, and optional relations or attributes. Response
             envelope metadata such as PI document version is used for validation
-            but not returned by this simplified public method.
+            but not returned by this simplified public method. A
+            ``polars.DataFrame`` with ``output="polars"``.
 
         Example:
             ::
@@ -91,17 +1675,28 @@ class FewsWebServiceClient:
                 print(first_location.location_id)
                 print(first_location.lat, first_location.lon)
         """
+        self._validate_metadata_output(output)
         content = Locations().execute(client=self.client, document_format="PI_JSON")
-        return PiLocationsResponse.model_validate(content).locations
+        return self._locations_from_content(content, output)
 
-    def get_parameters(self) -> list[PiParameter]:
+    @_shared_result
+    def get_parameters(
+        self, *, output: str | None = None
+    ) -> list[PiParameter] | pl.DataFrame:
         """Get parameters from the FEWS web services as a typed PI model.
 
+        Args:
+            output: Pass ``"polars"`` to get a ``polars.DataFrame`` with one row
+                per parameter, built column-wise from the response without
+                validating every entry. See
+                :func:`fews_py_wrapper.polars.pi_records_to_polars`.
+
         Returns:
             A list of typed PI parameters containing metadata such as parameter
             IDs, units, parameter type, and optional attributes. Response
             envelope metadata such as PI document version is used for validation
-            but not returned by this simplified public method.
+            but not returned by this simplified public method. A
+            ``polars.DataFrame`` with ``output="polars"``.
 
         Example:
             ::
@@ -116,9 +1711,11 @@ class FewsWebServiceClient:
                 print(first_parameter.id)
                 print(first_parameter.unit)
         """
+        self._validate_metadata_output(output)
         content = Parameters().execute(client=self.client, document_format="PI_JSON")
-        return PiParametersResponse.model_validate(content).parameters
+        return self._parameters_from_content(content, output)
 
+    @_shared_result(unshared=_timeseries_result_is_unshared)
     def get_timeseries(
         self,
         *,
@@ -127,10 +1724,46 @@ class FewsWebServiceClient:
         start_time: datetime | None = None,
         end_time: datetime | None = None,
         document_format: str = "PI_NETCDF",
+        chunk: timedelta | None = None,
+        batch_size: int | None = None,
+        max_workers: int = 4,
+        decode_workers: int = 1,
+        lazy: bool = False,
+        spill_dir: str | Path | None = None,
+        merge: bool = False,
+        output: str | None = None,
+        layout: str = "long",
+        csv_engine: str = "c",
+        download_path: str | Path | None = None,
+        spool_size: int | None = None,
+        value_dtype: str | None = None,
+        flags: str = "keep",
+        skip_comments: bool = False,
+        variables: list[str] | None = None,
+        time_slice: slice | None = None,
+        station_ids: list[str] | None = None,
+        member_cache: NetcdfMemberCache | None = None,
+        stats: TimeSeriesFetchStats | None = None,
         **kwargs: Any,
-    ) -> list[xr.Dataset] | dict[str, Any] | str:
+    ) -> (
+        list[xr.Dataset]
+        | xr.Dataset
+        | pd.DataFrame
+        | dict[str, Any]
+        | str
+        | Iterator[PiXmlSeries]
+        | pa.Table
+        | pl.DataFrame
+        | NetcdfZipResponse
+    ):
         """Get time series data from the FEWS web services.
 
+        FEWS answers with HTTP 206 when a response was truncated. For
+        ``PI_NETCDF`` and ``PI_JSON`` requests with ``start_time`` and
+        ``end_time``, the wrapper then splits the window in halves and keeps
+        fetching until the complete result is assembled. Otherwise a warning
+        is emitted and the partial content is returned.
+
         Args:
             location_ids: One or more FEWS location identifiers.
             parameter_ids: One or more FEWS parameter identifiers.
@@ -139,14 +1772,124 @@ class FewsWebServiceClient:
             document_format: FEWS PI response format. Supported values are
                 ``PI_JSON``, ``PI_XML``, ``PI_CSV`` and ``PI_NETCDF``.
                 Defaults to ``PI_NETCDF`` when omitted.
+            chunk: Optional window length. When provided, the period between
+                ``start_time`` and ``end_time`` is split into consecutive
+                windows of at most this length that are fetched concurrently
+                and stitched back together. Supported for ``PI_NETCDF`` and
+                ``PI_JSON``.
+            batch_size: Optional maximum number of location IDs per request.
+                When provided, ``location_ids`` and ``parameter_ids`` are split
+                into batches that keep the request URL short. Batches are
+                fetched concurrently and returned in input order. The batch
+                size shrinks automatically when responses are slow or large
+                and grows back when they are fast and small. Supported for
+                ``PI_NETCDF`` and ``PI_JSON``; NetCDF members of different
+                location batches are concatenated along ``stations``.
+            max_workers: Maximum number of windows or batches fetched
+                concurrently when ``chunk`` or ``batch_size`` is used.
+            decode_workers: Number of threads used to decode the NetCDF members
+                of a ``PI_NETCDF`` response. Members are returned in ZIP order.
+                netCDF4 reads stay serialized; only ZIP inflation and CF
+                decoding overlap.
+            lazy: When ``True``, ``PI_NETCDF`` members are written to spill
+                files and returned as lazy, dask-backed datasets that only read
+                the data that is computed. Requires the ``lazy`` extra.
+            spill_dir: Directory for the spill files of ``lazy`` responses.
+                Defaults to the system temporary directory. Spill files are
+                deleted once the datasets and lazy objects derived from them
+                are garbage collected, see
+                :func:`fews_py_wrapper.utils.open_netcdf_zip_response_lazily`.
+            merge: When ``True``, the NetCDF members of a ``PI_NETCDF``
+                response are merged into a single ``xarray.Dataset`` on the
+                union of all stations and time steps. See
+                :func:`fews_py_wrapper.utils.merge_netcdf_datasets`.
+            output: Optional conversion of the response. ``"pandas"`` turns a
+                ``PI_JSON`` or ``PI_CSV`` response into a ``pandas.DataFrame``,
+                see :func:`fews_py_wrapper.pi_json.pi_json_to_dataframe` and
+                :func:`fews_py_wrapper.pi_csv.pi_csv_to_dataframe`.
+                ``"xarray"`` turns a ``PI_JSON`` response into an
+                ``xarray.Dataset`` with the layout of a ``PI_NETCDF`` member, see
+                :func:`fews_py_wrapper.pi_json.pi_json_to_xarray`.
+                ``"numpy"`` streams a ``PI_XML`` response to a spooled file
+                (see ``spool_size``) and parses it incrementally from there,
+                see :func:`fews_py_wrapper.pi_xml.iter_pi_xml_series`.
+                ``"arrow"`` turns a ``PI_JSON`` or ``PI_NETCDF`` response into a
+                ``pyarrow.Table`` with one row per value, see
+                :func:`fews_py_wrapper.arrow.pi_json_to_arrow` and
+                :func:`fews_py_wrapper.arrow.netcdf_datasets_to_arrow`; requires
+                the ``arrow`` extra. ``"polars"`` gives the same table as a
+                ``polars.DataFrame``, see
+                :func:`fews_py_wrapper.polars.pi_json_to_polars` and
+                :func:`fews_py_wrapper.polars.netcdf_datasets_to_polars`;
+                requires the ``polars`` extra. ``"members"`` returns a
+                ``PI_NETCDF`` response as a
+                :class:`~fews_py_wrapper.utils.NetcdfZipResponse`, which only
+                decodes a NetCDF member when it is accessed. ``output`` cannot
+                be combined with ``merge`` or ``lazy``.
+            layout: Table layout for ``output``: ``"long"`` (one row per
+                event) or ``"wide"`` (one column per series).
+            csv_engine: ``pandas.read_csv`` engine for ``PI_CSV`` responses with
+                ``output="pandas"``: ``"c"`` or ``"pyarrow"`` (requires the
+                ``pyarrow`` package).
+            download_path: Stream the ``PI_NETCDF`` response body to this file
+                instead of reading it into memory, and decode the NetCDF
+                members from the file. With ``output="numpy"``, the ``PI_XML``
+                body is written there and parsed from the file. Cannot be
+                combined with ``chunk`` or ``batch_size``; continuation
+                requests of partial responses are spooled instead.
+            spool_size: Stream the ``PI_NETCDF`` response body, or the
+                ``PI_XML`` body of ``output="numpy"``, to a temporary file
+                that stays in memory up to this many bytes and moves to disk
+                beyond it. Defaults to 16 MiB when only ``download_path`` is
+                given or with ``output="numpy"``.
+            value_dtype: Precision of decoded values, ``"float32"`` or
+                ``"float64"``. Defaults to the type FEWS sends: ``float64`` for
+                ``PI_JSON`` outputs and the stored type of ``PI_NETCDF``
+                variables. ``"float32"`` halves the memory of the values.
+            flags: ``"keep"`` (default), ``"pack"`` or ``"drop"`` the quality
+                flags. Packed ``PI_NETCDF`` flag variables are stored as
+                ``uint8``; ``PI_JSON`` tables already hold 8-bit flags. Dropped
+                flags are not parsed at all.
+            skip_comments: Drop the comment and flag source text of every
+                event: ``PI_NETCDF`` text variables on the ``time`` dimension
+                and the ``comment`` and ``flagSource`` fields of raw ``PI_JSON``
+                events. ``value_dtype``, ``flags`` and ``skip_comments`` are
+                supported for ``PI_NETCDF`` and ``PI_JSON``; location and
+                parameter IDs are categorical columns in every table output.
+            variables: Only read these ``PI_NETCDF`` variables, given by name or
+                FEWS parameter ID. Other variables on the ``time`` dimension,
+                and members without any of them, are skipped before their data
+                is read. Useful when a filter makes FEWS return more parameters
+                than requested.
+            time_slice: Only read the ``PI_NETCDF`` time steps in this inclusive
+                ``slice`` of datetimes, such as the last 48 hours of a longer
+                request.
+            station_ids: Only read these ``PI_NETCDF`` stations, matched on
+                ``station_id``. See
+                :func:`fews_py_wrapper.utils.convert_netcdf_zip_response_to_xarray`.
+            member_cache: A :class:`~fews_py_wrapper.utils.NetcdfMemberCache`
+                shared between calls. ``PI_NETCDF`` members that are
+                byte-identical to a member decoded before with the same
+                options are served from the cache, which saves most of the
+                decoding work when the same forecasts are polled repeatedly.
+            stats: Optional :class:`TimeSeriesFetchStats` that is updated with
+                the number of requests, partial responses and continuation
+                requests needed for this call.
             **kwargs: Additional endpoint arguments accepted by the underlying
                 FEWS time series endpoint.
 
         Returns:
             A list of ``xarray.Dataset`` objects for ``PI_NETCDF`` responses,
-            preserving the original NetCDF member layout and ZIP member order;
-            a dictionary for ``PI_JSON``; or a string for ``PI_XML`` and
-            ``PI_CSV``.
+            preserving the original NetCDF member layout and ZIP member order,
+            or a single merged ``xarray.Dataset`` with ``merge=True``;
+            a ``pandas.DataFrame`` with ``output="pandas"``; an
+            ``xarray.Dataset`` with ``output="xarray"``; an iterator of
+            :class:`~fews_py_wrapper.pi_xml.PiXmlSeries` with
+            ``output="numpy"``; a ``pyarrow.Table`` with ``output="arrow"``;
+            a ``polars.DataFrame`` with ``output="polars"``; a
+            :class:`~fews_py_wrapper.utils.NetcdfZipResponse` with
+            ``output="members"``; a dictionary for
+            ``PI_JSON``; or a string for ``PI_XML`` and ``PI_CSV``.
 
         Example:
             Request time series as NetCDF. The ZIP payload returned by FEWS is
@@ -172,19 +1915,18 @@ class FewsWebServiceClient:
                 print(first_dataset)
 
             When FEWS writes multiple NetCDF files for a single request, each
-            member is returned as a separate dataset so you can choose your own
-            merge strategy.
+            member is returned as a separate dataset. Pass ``merge=True`` to
+            get one dataset covering all stations and time steps instead.
 
             ::
 
-                datasets = client.get_timeseries(
+                merged = client.get_timeseries(
                     location_ids=["Amanzimtoti_River_level"],
                     parameter_ids=["H.obs"],
                     start_time=datetime(2025, 3, 14, 10, 0, tzinfo=timezone.utc),
                     end_time=datetime(2025, 3, 15, 0, 0, tzinfo=timezone.utc),
+                    merge=True,
                 )
-
-                merged = xr.merge(datasets, combine_attrs="override")
                 print(merged)
 
             Request raw PI JSON explicitly.
@@ -208,36 +1950,273 @@ class FewsWebServiceClient:
             PI JSON responses are returned as raw dictionaries. Use
             ``PI_NETCDF`` when you want the wrapper to return one or more
             ``xarray.Dataset`` objects.
-        """
-        document_format_value = getattr(document_format, "value", document_format)
 
-        if document_format_value not in PI_TIMESERIES_DOCUMENT_FORMATS:
-            supported_formats = ", ".join(sorted(PI_TIMESERIES_DOCUMENT_FORMATS))
+            Fetch a multi-year period in 30-day windows. NetCDF members are
+            concatenated along ``time`` and PI JSON events are merged per
+            series, keeping timestamps on window boundaries once.
+
+            ::
+
+                from datetime import timedelta
+
+                datasets = client.get_timeseries(
+                    location_ids=["Amanzimtoti_River_level"],
+                    parameter_ids=["H.obs"],
+                    start_time=datetime(2020, 1, 1, tzinfo=timezone.utc),
+                    end_time=datetime(2025, 1, 1, tzinfo=timezone.utc),
+                    chunk=timedelta(days=30),
+                    max_workers=8,
+                )
+        """
+        decoding = self._timeseries_decoding(
+            document_format,
+            decode_workers=decode_workers,
+            lazy=lazy,
+            spill_dir=spill_dir,
+            merge=merge,
+            output=output,
+            layout=layout,
+            csv_engine=csv_engine,
+            download_path=download_path,
+            spool_size=spool_size,
+            value_dtype=value_dtype,
+            flags=flags,
+            skip_comments=skip_comments,
+            variables=variables,
+            time_slice=time_slice,
+            station_ids=station_ids,
+            member_cache=member_cache,
+        )
+        if download_path is not None and (chunk is not None or batch_size is not None):
             raise ValueError(
-                "Unsupported timeseries document_format for this PI-focused wrapper: "
-                f"{document_format_value}. Supported formats are: {supported_formats}."
+                "download_path cannot be combined with chunk or batch_size."
             )
 
         # Collect only non-None keyword arguments
         non_none_kwargs = self._collect_non_none_kwargs(
             local_kwargs=locals().copy(),
-            pop_kwargs=["document_format_value"],
+            pop_kwargs=[
+                "decoding",
+                "chunk",
+                "batch_size",
+                "max_workers",
+                "decode_workers",
+                "lazy",
+                "spill_dir",
+                "merge",
+                "output",
+                "layout",
+                "csv_engine",
+                "download_path",
+                "spool_size",
+                "value_dtype",
+                "flags",
+                "skip_comments",
+                "variables",
+                "time_slice",
+                "station_ids",
+                "member_cache",
+                "stats",
+            ],
+        )
+        if stats is None:
+            stats = TimeSeriesFetchStats()
+        result: (
+            list[xr.Dataset]
+            | NetcdfZipResponse
+            | dict[str, Any]
+            | str
+            | bytes
+            | Path
+            | IO[bytes]
+            | pd.DataFrame
         )
-        content = TimeSeries().execute(client=self.client, **non_none_kwargs)
+        if batch_size is not None:
+            result = self._get_timeseries_in_batches(
+                non_none_kwargs,
+                decoding,
+                chunk,
+                batch_size,
+                max_workers,
+                stats,
+            )
+        elif chunk is not None:
+            result = self._get_timeseries_in_windows(
+                non_none_kwargs, decoding, chunk, max_workers, stats
+            )
+        else:
+            result = self._fetch_timeseries(non_none_kwargs, decoding, stats)
+        return self._timeseries_output(result, decoding)
 
-        if document_format_value == "PI_NETCDF":
-            if not isinstance(content, bytes):
-                raise ValueError("Expected PI_NETCDF response content as bytes.")
-            return convert_netcdf_zip_response_to_xarray(content)
-        if document_format_value == "PI_JSON":
-            if not isinstance(content, dict):
-                raise ValueError("Expected PI_JSON response content as a dictionary.")
-            return content
-        if not isinstance(content, str):
-            raise ValueError(
-                f"Expected {document_format_value} response content as a string."
+    def iter_timeseries(
+        self,
+        *,
+        location_ids: list[str] | None = None,
+        parameter_ids: list[str] | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        **kwargs: Any,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream PI JSON time series from the FEWS web services.
+
+        The ``PI_JSON`` response body is streamed and parsed incrementally, and
+        each element of its ``timeSeries`` array (a dictionary with ``header``
+        and ``events``) is yielded as soon as it has been received. Results can
+        be processed while the rest of the response is still arriving, and
+        memory use stays close to the size of the largest series.
+
+        Partial (HTTP 206) responses are not continued; a warning is emitted
+        instead. Use :meth:`get_timeseries` for that.
+
+        Args:
+            location_ids: Optional list of FEWS location IDs to request.
+            parameter_ids: Optional list of FEWS parameter IDs to request.
+            start_time: Optional start of the requested period.
+            end_time: Optional end of the requested period.
+            **kwargs: Additional endpoint arguments accepted by the underlying
+                FEWS time series endpoint. ``document_format`` can only be
+                ``PI_JSON``.
+
+        Yields:
+            One PI JSON time series dictionary per series, in response order.
+
+        Raises:
+            ValueError: If another document format than ``PI_JSON`` is given.
+
+        Example:
+            ::
+
+                for series in client.iter_timeseries(
+                    parameter_ids=["H.obs"],
+                    start_time=datetime(2025, 3, 14, 10, 0, tzinfo=timezone.utc),
+                    end_time=datetime(2025, 3, 15, 0, 0, tzinfo=timezone.utc),
+                    filter_id="Hydrology",
+                ):
+                    print(series["header"]["locationId"], len(series["events"]))
+        """
+        endpoint_kwargs = self._streamed_timeseries_kwargs(locals().copy())
+        endpoint = TimeSeries()
+        with endpoint.stream(client=self.client, **endpoint_kwargs) as chunks:
+            if endpoint.status_code == HTTPStatus.PARTIAL_CONTENT:
+                self._warn_partial_timeseries_stream()
+            yield from iter_pi_json_series(chunks, endpoint.response_encoding)
+
+    def _fetch_timeseries(
+        self,
+        endpoint_kwargs: dict[str, Any],
+        decoding: _TimeSeriesDecoding,
+        stats: TimeSeriesFetchStats,
+    ) -> (
+        list[xr.Dataset]
+        | NetcdfZipResponse
+        | dict[str, Any]
+        | str
+        | bytes
+        | Path
+        | IO[bytes]
+        | pd.DataFrame
+    ):
+        """Fetch one time series request, continuing partial responses.
+
+        When FEWS answers with HTTP 206, the time window is split in two halves
+        that are fetched (and continued again if needed) and merged.
+        """
+        endpoint = TimeSeries()
+        endpoint.decode_text = decoding.decode_text
+        started = time.perf_counter()
+        content: Any
+        if decoding.downloads:
+            content = endpoint.download(
+                client=self.client, **decoding.download_kwargs(), **endpoint_kwargs
             )
-        return content
+        else:
+            content = endpoint.execute(client=self.client, **endpoint_kwargs)
+        partial = endpoint.status_code == HTTPStatus.PARTIAL_CONTENT
+        stats.record_response(
+            time.perf_counter() - started, endpoint.response_size, partial
+        )
+        if partial:
+            continuation_kwargs = self._split_partial_timeseries_kwargs(
+                endpoint_kwargs, decoding.document_format
+            )
+            if continuation_kwargs is not None:
+                self._close_timeseries_content(content)
+                stats.record_continuations(len(continuation_kwargs))
+                results = [
+                    self._fetch_timeseries(kwargs, decoding.for_continuation(), stats)
+                    for kwargs in continuation_kwargs
+                ]
+                return self._merge_timeseries_windows(results, decoding.document_format)
+        return self._timeseries_from_content(
+            content, decoding, endpoint.response_encoding
+        )
+
+    def _get_timeseries_in_batches(
+        self,
+        endpoint_kwargs: dict[str, Any],
+        decoding: _TimeSeriesDecoding,
+        chunk: timedelta | None,
+        batch_size: int,
+        max_workers: int,
+        stats: TimeSeriesFetchStats,
+    ) -> list[xr.Dataset] | NetcdfZipResponse | dict[str, Any]:
+        """Fetch location x parameter batches in waves and merge them in order."""
+        planner = self._plan_timeseries_batches(
+            endpoint_kwargs, decoding.document_format, batch_size
+        )
+
+        def fetch_batch(kwargs: dict[str, Any]) -> tuple[Any, TimeSeriesFetchStats]:
+            batch_stats = TimeSeriesFetchStats()
+            if chunk is None:
+                return (
+                    self._fetch_timeseries(kwargs, decoding, batch_stats),
+                    batch_stats,
+                )
+            results = [
+                self._fetch_timeseries(window, decoding, batch_stats)
+                for window in self._split_timeseries_kwargs(
+                    kwargs, chunk, decoding.document_format
+                )
+            ]
+            return (
+                self._merge_timeseries_windows(results, decoding.document_format),
+                batch_stats,
+            )
+
+        batch_results: list[Any] = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while not planner.done:
+                wave = list(executor.map(fetch_batch, planner.next_wave(max_workers)))
+                planner.record_wave(
+                    [
+                        (batch_stats.elapsed_seconds, batch_stats.response_bytes)
+                        for _, batch_stats in wave
+                    ]
+                )
+                for result, batch_stats in wave:
+                    batch_results.append(result)
+                    stats.merge(batch_stats)
+        return self._merge_timeseries_batches(batch_results, decoding.document_format)
+
+    def _get_timeseries_in_windows(
+        self,
+        endpoint_kwargs: dict[str, Any],
+        decoding: _TimeSeriesDecoding,
+        chunk: timedelta,
+        max_workers: int,
+        stats: TimeSeriesFetchStats,
+    ) -> list[xr.Dataset] | NetcdfZipResponse | dict[str, Any]:
+        """Fetch time series per time window in a thread pool and merge them."""
+        window_kwargs = self._split_timeseries_kwargs(
+            endpoint_kwargs, chunk, decoding.document_format
+        )
+
+        def fetch_window(kwargs: dict[str, Any]) -> Any:
+            return self._fetch_timeseries(kwargs, decoding, stats)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(fetch_window, window_kwargs))
+        return self._merge_timeseries_windows(results, decoding.document_format)
 
     def post_timeseries(
         self,
@@ -302,31 +2281,16 @@ class FewsWebServiceClient:
 
                 print(diag_xml)
         """
-        if pi_time_series_xml_content is None and pi_time_series_json_content is None:
-            raise ValueError(
-                "One of pi_time_series_xml_content or "
-                "pi_time_series_json_content must be provided."
-            )
-
-        request_body = self._collect_non_none_kwargs(
-            {
-                "piTimeSeriesXmlContent": pi_time_series_xml_content,
-                "piTimeSeriesJsonContent": pi_time_series_json_content,
-            }
-        )
-
-        endpoint_kwargs = self._collect_non_none_kwargs(
-            {
-                "body": request_body,
-                "filter_id": filter_id,
-                "convert_datum": convert_datum,
-            }
+        endpoint_kwargs = self._post_timeseries_kwargs(
+            pi_time_series_xml_content,
+            pi_time_series_json_content,
+            filter_id,
+            convert_datum,
         )
         content = PostTimeSeries().execute(client=self.client, **endpoint_kwargs)
-        if not isinstance(content, str):
-            raise ValueError("Expected POST timeseries response content as a string.")
-        return content
+        return self._text_from_content(content, "POST timeseries")
 
+    @_shared_result
     def get_filters(
         self,
         filter_id: str | None = None,
@@ -379,11 +2343,7 @@ class FewsWebServiceClient:
             }
         )
         content = Filters().execute(client=self.client, **endpoint_kwargs)
-        if isinstance(content, dict):
-            return PiFiltersResponse.model_validate(content).filters
-        if not isinstance(content, str):
-            raise ValueError("Expected filters response content as a string.")
-        return content
+        return self._filters_from_content(content)
 
     def post_runtask(
         self,
@@ -463,10 +2423,9 @@ class FewsWebServiceClient:
             }
         )
         content = PostRunTask().execute(client=self.client, **endpoint_kwargs)
-        if not isinstance(content, str):
-            raise ValueError("Expected POST runtask response content as a string.")
-        return content
+        return self._text_from_content(content, "POST runtask")
 
+    @_shared_result
     def get_taskruns(
         self,
         *,
@@ -486,7 +2445,8 @@ class FewsWebServiceClient:
         only_current: bool | None = None,
         document_format: str | None = "PI_JSON",
         document_version: str | None = None,
-    ) -> list[PiTaskRun] | str:
+        output: str | None = None,
+    ) -> list[PiTaskRun] | str | pl.DataFrame:
         """Get task runs for a FEWS workflow.
 
         Retrieves task runs from FEWS ``GET /taskruns`` for the specified
@@ -519,10 +2479,14 @@ class FewsWebServiceClient:
             only_current: Optional FEWS current-only filter.
             document_format: Response format. Defaults to ``PI_JSON``.
             document_version: Optional PI document version.
+            output: Pass ``"polars"`` to get a ``polars.DataFrame`` with one row
+                per task run, built column-wise from a ``PI_JSON`` response. See
+                :func:`fews_py_wrapper.polars.pi_records_to_polars`.
 
         Returns:
             A list of typed task-run descriptors for ``PI_JSON`` by default, or
             a string when a text-based format such as ``PI_XML`` is requested.
+            A ``polars.DataFrame`` with ``output="polars"``.
 
         Example:
             Retrieve the latest forecast task runs for a workflow.
@@ -559,6 +2523,7 @@ class FewsWebServiceClient:
                 )
                 print(taskruns_xml)
         """
+        self._validate_metadata_output(output, document_format)
         endpoint_kwargs = self._collect_non_none_kwargs(
             {
                 "workflow_id": workflow_id,
@@ -580,12 +2545,9 @@ class FewsWebServiceClient:
             }
         )
         content = Taskruns().execute(client=self.client, **endpoint_kwargs)
-        if isinstance(content, dict):
-            return PiTaskRunsResponse.model_validate(content).task_runs
-        if not isinstance(content, str):
-            raise ValueError("Expected taskruns response content as a string.")
-        return content
+        return self._taskruns_from_content(content, output)
 
+    @_shared_result
     def get_taskrunstatus(
         self,
         *,
@@ -638,6 +2600,7 @@ class FewsWebServiceClient:
         content = Taskrunstatus().execute(client=self.client, **endpoint_kwargs)
         return PiTaskRunStatusResponse.model_validate(content)
 
+    @_shared_result
     def get_whatiftemplates(
         self,
         *,
@@ -691,6 +2654,7 @@ class FewsWebServiceClient:
         content = WhatIfTemplates().execute(client=self.client, **endpoint_kwargs)
         return PiWhatIfTemplatesResponse.model_validate(content).templates
 
+    @_shared_result
     def get_whatifscenarios(
         self,
         *,
@@ -812,6 +2776,7 @@ class FewsWebServiceClient:
         """Backward-compatible alias for :meth:`post_runtask`."""
         return self.post_runtask(*args, **kwargs)
 
+    @_shared_result
     def get_workflows(
         self,
         *,
@@ -858,56 +2823,4 @@ class FewsWebServiceClient:
             }
         )
         content = Workflows().execute(client=self.client, **endpoint_kwargs)
-        if isinstance(content, dict):
-            return PiWorkflowsResponse.model_validate(content).workflows
-        if not isinstance(content, str):
-            raise ValueError("Expected workflows response content as a string.")
-        return content
-
-    def endpoint_arguments(self, endpoint: str) -> list[str]:
-        """Get the arguments for a specific FEWS web service endpoint.
-
-        Args:
-            endpoint: The name of the endpoint, options: ``timeseries``,
-                ``post_timeseries``, ``post_runtask``, ``taskruns``,
-                ``taskrunstatus``, ``whatiftemplates``, ``whatifscenarios``,
-                ``post_whatifscenarios``, ``filters``, and ``workflows``.
-
-        Returns:
-            The argument names for the specified endpoint.
-        """
-        if endpoint == "timeseries":
-            return TimeSeries().input_args()
-        elif endpoint == "post_timeseries":
-            return list(inspect.signature(self.post_timeseries).parameters)
-        elif endpoint == "post_runtask":
-            return list(inspect.signature(self.post_runtask).parameters)
-        elif endpoint == "taskruns":
-            return list(inspect.signature(self.get_taskruns).parameters)
-        elif endpoint == "taskrunstatus":
-            return list(inspect.signature(self.get_taskrunstatus).parameters)
-        elif endpoint == "whatiftemplates":
-            return list(inspect.signature(self.get_whatiftemplates).parameters)
-        elif endpoint == "whatifscenarios":
-            return list(inspect.signature(self.get_whatifscenarios).parameters)
-        elif endpoint == "post_whatifscenarios":
-            return list(inspect.signature(self.post_whatifscenarios).parameters)
-        elif endpoint == "filters":
-            return list(inspect.signature(self.get_filters).parameters)
-        elif endpoint == "workflows":
-            return list(inspect.signature(self.get_workflows).parameters)
-        else:
-            raise ValueError(f"Unknown endpoint: {endpoint}")
-
-    def _collect_non_none_kwargs(
-        self, local_kwargs: dict[str, Any], pop_kwargs: list[str] | None = None
-    ) -> dict[str, Any]:
-        """Collect only non-None keyword arguments."""
-        local_kwargs.pop("self", None)
-        for key in pop_kwargs or []:
-            local_kwargs.pop(key, None)
-        if "kwargs" in local_kwargs:
-            extra_kwargs = local_kwargs.pop("kwargs")
-            if isinstance(extra_kwargs, dict):
-                local_kwargs.update(extra_kwargs)
-        return {k: v for k, v in local_kwargs.items() if v is not None}
+        return self._workflows_from_content(content)
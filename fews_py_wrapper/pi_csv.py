@@ -0,0 +1,111 @@
+import csv
+import io
+from collections.abc import Hashable
+from typing import Any, Literal, cast
+
+import numpy as np
+import pandas as pd
+
+from fews_py_wrapper.pi_json import DATAFRAME_LAYOUTS
+
+__all__ = ["CSV_ENGINES", "pi_csv_to_dataframe"]
+
+CSV_ENGINES = ("c", "pyarrow")
+# Labels of the FEWS CSV header rows and the PI header fields they hold. The
+# "Time" row is the last header row and names the parameter of each column.
+PI_CSV_HEADER_ROWS = {
+    "Location Ids": "locationId",
+    "Time": "parameterId",
+    "Location Names": "stationName",
+}
+PI_CSV_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def pi_csv_to_dataframe(
+    content: bytes, layout: str = "long", engine: str = "c", encoding: str = "utf-8"
+) -> pd.DataFrame:
+    """Convert a FEWS PI CSV time series document to a pandas DataFrame.
+
+    The header rows at the top of the document (``Location Names``,
+    ``Location Ids`` and the ``Time`` row with the parameter IDs) become the
+    header fields ``stationName``, ``locationId`` and ``parameterId``; other
+    header rows keep their label as field name.
+
+    The ``long`` layout has one row per event with the header fields as
+    categorical columns, followed by ``time`` (timezone-aware UTC) and
+    ``value``. The ``wide`` layout has one row per time and one column per
+    series, with ``locationId``, ``parameterId`` and the other header fields
+    as column levels, matching the wide layout of
+    :func:`fews_py_wrapper.pi_json.pi_json_to_dataframe`. Empty cells become
+    ``NaN``.
+
+    The data rows are parsed straight from the response bytes with
+    ``pandas.read_csv``; pass ``engine="pyarrow"`` to use the multithreaded
+    pyarrow CSV reader, which requires ``pyarrow``. ``encoding`` is the
+    ASCII-compatible character encoding of ``content`` (the response charset).
+
+    Raises:
+        ValueError: If ``layout`` or ``engine`` is not supported, or the
+            document has no ``Time`` header row.
+    """
+    if layout not in DATAFRAME_LAYOUTS:
+        raise ValueError(
+            f"Unsupported layout '{layout}'. Supported layouts are: "
+            f"{', '.join(DATAFRAME_LAYOUTS)}."
+        )
+    if engine not in CSV_ENGINES:
+        raise ValueError(
+            f"Unsupported CSV engine '{engine}'. Supported engines are: "
+            f"{', '.join(CSV_ENGINES)}."
+        )
+    buffer = io.BytesIO(content)
+    header_rows = _read_header_rows(buffer, encoding)
+    series_count = len(header_rows["parameterId"])
+    dtypes: dict[Hashable, Any] = {"time": str}
+    dtypes.update({index: np.float64 for index in range(series_count)})
+    frame = pd.read_csv(
+        buffer,
+        header=None,
+        names=["time", *range(series_count)],
+        dtype=dtypes,
+        encoding=encoding,
+        engine=cast(Literal["c", "pyarrow"], engine),
+    )
+    times = pd.to_datetime(frame.pop("time"), format=PI_CSV_TIME_FORMAT, utc=True)
+    frame.index = pd.DatetimeIndex(times, name="time")
+    frame.columns = pd.MultiIndex.from_arrays(
+        list(header_rows.values()), names=list(header_rows)
+    )
+    if layout == "wide":
+        return frame
+    return _long_frame(frame, header_rows)
+
+
+def _read_header_rows(buffer: io.BytesIO, encoding: str) -> dict[str, list[str]]:
+    """Read the header rows and leave ``buffer`` at the first data row."""
+    rows: dict[str, list[str]] = {}
+    for line in iter(buffer.readline, b""):
+        label, *cells = next(csv.reader([line.decode(encoding)]))
+        rows[PI_CSV_HEADER_ROWS.get(label, label)] = cells
+        if label == "Time":
+            break
+    else:
+        raise ValueError("PI CSV document has no 'Time' header row.")
+    ordered = ["locationId", "parameterId"]
+    return {
+        name: rows[name]
+        for name in [*ordered, *(name for name in rows if name not in ordered)]
+        if name in rows
+    }
+
+
+def _long_frame(frame: pd.DataFrame, header_rows: dict[str, list[str]]) -> pd.DataFrame:
+    """Reshape a wide PI CSV frame to one row per event, column by column."""
+    time_count = len(frame.index)
+    columns: dict[str, Any] = {
+        name: pd.Categorical(values).take(np.repeat(np.arange(len(values)), time_count))
+        for name, values in header_rows.items()
+    }
+    columns["time"] = frame.index[np.tile(np.arange(time_count), len(frame.columns))]
+    columns["value"] = frame.to_numpy().ravel(order="F")
+    return pd.DataFrame(columns)
@@ -0,0 +1,551 @@
+import codecs
+import itertools
+import json
+import re
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Any, cast
+
+import numpy as np
+import pandas as pd
+import xarray as xr
+
+__all__ = [
+    "FLAG_MODES",
+    "PI_JSON_HEADER_COLUMNS",
+    "VALUE_DTYPES",
+    "iter_pi_json_series",
+    "pi_json_to_dataframe",
+    "pi_json_to_xarray",
+]
+
+PI_JSON_HEADER_COLUMNS = (
+    "locationId",
+    "parameterId",
+    "qualifierId",
+    "ensembleMemberIndex",
+)
+DATAFRAME_LAYOUTS = ("long", "wide")
+# Value precisions and flag handling of the compact decode options.
+VALUE_DTYPES = ("float32", "float64")
+FLAG_MODES = ("keep", "pack", "drop")
+# Free-text event fields that ``skip_comments`` removes from PI JSON events.
+PI_JSON_COMMENT_FIELDS = ("comment", "flagSource", "flagSourceColumn")
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_JSON_KEY = re.compile(r'("(?:[^"\\]|\\.)*")[ \t\n\r]*:')
+
+
+def pi_json_to_dataframe(
+    content: dict[str, Any],
+    layout: str = "long",
+    *,
+    value_dtype: str | None = None,
+    flags: str = "keep",
+) -> pd.DataFrame:
+    """Convert a FEWS PI JSON time series document to a pandas DataFrame.
+
+    The ``long`` layout has one row per event with the columns ``time``
+    (timezone-aware UTC), ``value``, ``flag`` and the header fields in
+    ``PI_JSON_HEADER_COLUMNS`` as categorical columns. Multiple qualifiers are
+    joined with ``","``. Missing values (``missVal``) become ``NaN``.
+
+    The ``wide`` layout has one row per time and one column per series, with
+    the header fields that are set for at least one series as column levels.
+    Responses with ``forecastDate`` headers, such as forecast archives, add a
+    ``forecastDate`` level (UTC) so that every forecast gets its own columns.
+
+    ``value_dtype="float32"`` parses values at single precision, halving the
+    size of the ``value`` column. Flags are stored as 8-bit integers, so
+    ``flags="pack"`` keeps them as they are; ``flags="drop"`` leaves out the
+    ``flag`` column and skips parsing it.
+
+    Event fields are gathered into flat arrays and parsed by NumPy and pandas
+    in bulk; header columns are built from category codes repeated per
+    series, instead of building one row object per event.
+
+    Raises:
+        ValueError: With ``layout="wide"``, if two series with the same header
+            fields have a value at the same time.
+    """
+    if layout not in DATAFRAME_LAYOUTS:
+        raise ValueError(
+            f"Unsupported layout '{layout}'. Supported layouts are: "
+            f"{', '.join(DATAFRAME_LAYOUTS)}."
+        )
+    validate_compact_options(value_dtype, flags)
+    events = flatten_pi_json_events(
+        content, value_dtype=value_dtype, parse_flags=flags != "drop"
+    )
+    lengths = events.lengths
+    headers = events.headers
+
+    columns: dict[str, Any] = {
+        name: _repeat_header_categorical(
+            [header_value(header, name) for header in headers], lengths
+        )
+        for name in PI_JSON_HEADER_COLUMNS
+    }
+    columns["time"] = pd.DatetimeIndex(events.times).tz_localize("UTC")
+    columns["value"] = events.values
+    if events.flags is not None:
+        columns["flag"] = events.flags
+    frame = pd.DataFrame(columns)
+    if layout == "long":
+        return frame
+    header_columns = [
+        name for name in PI_JSON_HEADER_COLUMNS if frame[name].notna().any()
+    ] or ["locationId"]
+    forecast_dates = [
+        _forecast_date(header, _time_zone_offset(content)) for header in headers
+    ]
+    if any(date is not None for date in forecast_dates):
+        frame["forecastDate"] = pd.DatetimeIndex(forecast_dates).repeat(lengths)
+        frame["forecastDate"] = frame["forecastDate"].dt.tz_localize("UTC")
+        header_columns.append("forecastDate")
+    duplicated = frame.duplicated(["time", *header_columns])
+    if duplicated.any():
+        row = frame[duplicated].iloc[0]
+        header = ", ".join(f"{name}={row[name]}" for name in header_columns)
+        raise ValueError(
+            f"Cannot use layout 'wide': several series with {header} have a "
+            f"value at {row['time']}."
+        )
+    return frame.pivot(index="time", columns=header_columns, values="value")
+
+
+def pi_json_to_xarray(
+    content: dict[str, Any], *, value_dtype: str | None = None
+) -> xr.Dataset:
+    """Convert a FEWS PI JSON time series document to an xarray Dataset.
+
+    The dataset follows the layout of FEWS ``PI_NETCDF`` responses: one
+    variable per parameter (and qualifier combination) on the dimensions
+    ``time`` and ``stations``, with ``station_id``, ``station_names``, ``lat``,
+    ``lon``, ``x``, ``y`` and ``z`` as station coordinates. Series with an
+    ``ensembleMemberIndex`` add a ``realization`` dimension and series with a
+    ``forecastDate`` add an ``analysis_time`` dimension (CF standard name
+    ``forecast_reference_time``). When only some series have these fields,
+    the others are placed at ``analysis_time`` ``NaT`` and at realization
+    ``0``, the deterministic member. Times are UTC and missing values are
+    ``NaN``.
+
+    All events are placed in preallocated arrays with NumPy fancy indexing,
+    using integer codes for station, time, member and forecast per event.
+    Variables are ``float64`` unless ``value_dtype="float32"`` is given.
+
+    Raises:
+        ValueError: If a series without ``ensembleMemberIndex`` and a series of
+            member ``0`` share parameter, location and forecast.
+    """
+    validate_compact_options(value_dtype)
+    events = flatten_pi_json_events(content, value_dtype=value_dtype, parse_flags=False)
+    headers = events.headers
+    time_zone = _time_zone_offset(content)
+
+    variable_names = [_variable_name(header) for header in headers]
+    variable_codes, variables = pd.factorize(np.array(variable_names, dtype=object))
+    station_codes, station_ids = pd.factorize(
+        np.array([header.get("locationId", "") for header in headers], dtype=object)
+    )
+    time_codes, times = pd.factorize(events.times, sort=True)
+
+    dims: list[str] = []
+    event_codes: list[np.ndarray] = []
+    coords: dict[str, Any] = {}
+    forecast_dates = [_forecast_date(header, time_zone) for header in headers]
+    if any(date is not None for date in forecast_dates):
+        # Series without a forecastDate keep their own NaT analysis time.
+        codes, analysis_times = pd.factorize(
+            pd.DatetimeIndex(forecast_dates), sort=True, use_na_sentinel=False
+        )
+        dims.append("analysis_time")
+        event_codes.append(np.repeat(codes, events.lengths))
+        coords["analysis_time"] = (
+            "analysis_time",
+            np.asarray(analysis_times, dtype="datetime64[ns]"),
+            {"standard_name": "forecast_reference_time"},
+        )
+    members = [header.get("ensembleMemberIndex") for header in headers]
+    if any(member is not None for member in members):
+        indices = [0 if member is None else int(member) for member in members]
+        if None in members and any(
+            member is not None and index == 0
+            for member, index in zip(members, indices, strict=True)
+        ):
+            _check_deterministic_member(headers, members)
+        codes, realizations = pd.factorize(np.array(indices), sort=True)
+        dims.append("realization")
+        event_codes.append(np.repeat(codes, events.lengths))
+        coords["realization"] = ("realization", np.asarray(realizations))
+    dims.extend(["time", "stations"])
+    event_codes.append(time_codes)
+    event_codes.append(np.repeat(station_codes, events.lengths))
+    shape = tuple(len(coords[dim][1]) for dim in dims[:-2]) + (
+        len(times),
+        len(station_ids),
+    )
+
+    event_variables = np.repeat(variable_codes, events.lengths)
+    data_vars: dict[str, Any] = {}
+    for code, name in enumerate(variables):
+        values = np.full(shape, np.nan, dtype=events.values.dtype)
+        selected = event_variables == code
+        values[tuple(codes[selected] for codes in event_codes)] = events.values[
+            selected
+        ]
+        header = headers[int(np.argmax(variable_codes == code))]
+        attrs = {"long_name": header.get("parameterId", name)}
+        if header.get("units"):
+            attrs["units"] = header["units"]
+        data_vars[str(name)] = (dims, values, attrs)
+
+    first_station_headers = [
+        headers[int(np.argmax(station_codes == code))]
+        for code in range(len(station_ids))
+    ]
+    coords["time"] = ("time", np.asarray(times, dtype="datetime64[ns]"))
+    coords["station_id"] = ("stations", np.asarray(station_ids, dtype=str))
+    for name in ("lat", "lon", "x", "y", "z"):
+        coords[name] = ("stations", _station_floats(first_station_headers, name))
+    data_vars["station_names"] = (
+        "stations",
+        np.array(
+            [header.get("stationName", "") for header in first_station_headers],
+            dtype=str,
+        ),
+    )
+    return xr.Dataset(data_vars, coords=coords)
+
+
+def _check_deterministic_member(
+    headers: list[dict[str, Any]], members: list[Any]
+) -> None:
+    """Raise if a series without member index collides with member ``0``."""
+    explicit = {
+        (_variable_name(header), header.get("locationId"), _forecast_key(header))
+        for header, member in zip(headers, members, strict=True)
+        if member is not None and int(member) == 0
+    }
+    for header, member in zip(headers, members, strict=True):
+        key = (_variable_name(header), header.get("locationId"), _forecast_key(header))
+        if member is None and key in explicit:
+            raise ValueError(
+                f"Series {key[0]!r} at location {key[1]!r} has no "
+                "ensembleMemberIndex and would overwrite ensemble member 0."
+            )
+
+
+def _forecast_key(header: dict[str, Any]) -> Any:
+    forecast_date = header.get("forecastDate")
+    if isinstance(forecast_date, dict):
+        return forecast_date.get("date"), forecast_date.get("time")
+    return forecast_date
+
+
+def iter_pi_json_series(
+    chunks: Iterable[bytes], encoding: str = "utf-8"
+) -> Iterator[dict[str, Any]]:
+    """Parse a FEWS PI JSON document incrementally, one series at a time.
+
+    ``chunks`` is any iterable of byte strings that together form a PI JSON
+    time series document, such as the body of a streamed HTTP response, and
+    ``encoding`` is their character encoding (the response charset).
+    Undecodable bytes are replaced, as for responses that are not streamed.
+    Every element of the ``timeSeries`` array is yielded as soon as it has
+    been received completely, so memory use stays close to the size of the
+    largest series instead of the whole document. Document-level fields such
+    as ``timeZone`` are not yielded.
+
+    Raises:
+        ValueError: If the chunks do not form a complete PI JSON object.
+    """
+    decoder = PiJsonSeriesDecoder(encoding=encoding)
+    for chunk in chunks:
+        yield from decoder.feed(chunk)
+    yield from decoder.close()
+
+
+@dataclass
+class PiJsonSeriesDecoder:
+    """Push parser that splits a PI JSON document into its ``timeSeries``.
+
+    Only the top-level object and the ``timeSeries`` array are scanned here;
+    each series is decoded by ``json.JSONDecoder.raw_decode``. A series that is
+    not complete yet is only retried once the unparsed text has doubled, which
+    keeps the total parse work linear in the document size.
+    """
+
+    document: dict[str, Any] = field(default_factory=dict)
+    encoding: str = "utf-8"
+    _text: str = ""
+    _position: int = 0
+    _pending: list[str] = field(default_factory=list)
+    _pending_length: int = 0
+    _state: str = "start"
+    _key: str = ""
+    _retry_length: int = 0
+    _json_decoder: json.JSONDecoder = field(default_factory=json.JSONDecoder)
+    _text_decoder: codecs.IncrementalDecoder = field(init=False)
+
+    def __post_init__(self) -> None:
+        self._text_decoder = codecs.getincrementaldecoder(self.encoding)(
+            errors="replace"
+        )
+
+    def feed(self, chunk: bytes) -> list[dict[str, Any]]:
+        """Add response bytes and return the series completed by them."""
+        text = self._text_decoder.decode(chunk)
+        self._pending.append(text)
+        self._pending_length += len(text)
+        unparsed_length = len(self._text) - self._position + self._pending_length
+        if unparsed_length < self._retry_length:
+            return []
+        return list(self._parse())
+
+    def close(self) -> list[dict[str, Any]]:
+        """Finish the document and return any remaining series."""
+        self._pending.append(self._text_decoder.decode(b"", final=True))
+        series = list(self._parse())
+        if self._state != "done":
+            raise ValueError("Incomplete PI JSON time series document.")
+        return series
+
+    def _parse(self) -> Iterator[dict[str, Any]]:
+        self._text = self._text[self._position :] + "".join(self._pending)
+        self._position = 0
+        self._pending = []
+        self._pending_length = 0
+        self._retry_length = 0
+        while self._state != "done":
+            self._skip_whitespace()
+            if self._position >= len(self._text):
+                return
+            char = self._text[self._position]
+            if self._state == "start":
+                self._expect(char, "{")
+                self._state = "key"
+            elif self._state in ("key", "series") and char == ",":
+                self._position += 1
+            elif self._state == "key" and char == "}":
+                self._position += 1
+                self._state = "done"
+            elif self._state == "series" and char == "]":
+                self._position += 1
+                self._state = "key"
+            elif self._state == "key":
+                self._expect(char, '"')
+                if not self._parse_key():
+                    return
+            elif self._state == "array":
+                self._expect(char, "[")
+                self._state = "series"
+            else:
+                value = self._decode_value()
+                if value is None:
+                    return
+                if self._state == "series":
+                    yield cast(dict[str, Any], value[0])
+                else:
+                    self.document[self._key] = value[0]
+                    self._state = "key"
+
+    def _parse_key(self) -> bool:
+        """Read ``"key":`` and pick the state for its value."""
+        match = _JSON_KEY.match(self._text, self._position - 1)
+        if match is None:
+            self._position -= 1
+            return False
+        self._key = json.loads(match.group(1))
+        self._position = match.end()
+        self._state = "array" if self._key == "timeSeries" else "value"
+        return True
+
+    def _decode_value(self) -> tuple[Any] | None:
+        """Decode the value at the current position once it is complete."""
+        try:
+            value, end = self._json_decoder.raw_decode(self._text, self._position)
+        except json.JSONDecodeError:
+            value, end = None, len(self._text)
+        # Only accept a value once the delimiter after it has arrived, as a
+        # number at the end of the received text may still be cut off.
+        delimiter = self._whitespace_end(end)
+        if self._text[delimiter : delimiter + 1] not in (",", "]", "}"):
+            self._retry_length = 2 * (len(self._text) - self._position)
+            return None
+        self._position = end
+        return (value,)
+
+    def _skip_whitespace(self) -> None:
+        self._position = self._whitespace_end(self._position)
+
+    def _whitespace_end(self, position: int) -> int:
+        match = cast(re.Match[str], _JSON_WHITESPACE.match(self._text, position))
+        return match.end()
+
+    def _expect(self, char: str, expected: str) -> None:
+        if char != expected:
+            raise ValueError(
+                f"Invalid PI JSON time series document: expected '{expected}' "
+                f"at position {self._position}, got '{char}'."
+            )
+        self._position += 1
+
+
+@dataclass
+class _PiJsonEvents:
+    """The events of a PI JSON document as flat arrays, in series order."""
+
+    headers: list[dict[str, Any]]
+    lengths: np.ndarray
+    times: np.ndarray
+    values: np.ndarray
+    flags: np.ndarray | None
+
+
+def flatten_pi_json_events(
+    content: dict[str, Any],
+    value_dtype: str | None = None,
+    parse_flags: bool = True,
+) -> _PiJsonEvents:
+    """Gather all events of a PI JSON document into flat NumPy arrays.
+
+    Values are parsed straight to ``value_dtype`` (``float64`` by default) and
+    flags are only parsed with ``parse_flags``. Event times are normally given
+    as separate ``date`` and ``time`` fields in the document time zone; events
+    without ``time`` carry an ISO 8601 date-time in ``date`` instead, in the
+    document time zone unless it has an offset of its own.
+    """
+    dtype = np.dtype(value_dtype or np.float64)
+    series = content.get("timeSeries") or []
+    headers = [item.get("header", {}) for item in series]
+    events = [item.get("events") or [] for item in series]
+    lengths = np.fromiter((len(item) for item in events), dtype=np.intp)
+    flat_events = list(itertools.chain.from_iterable(events))
+
+    time_zone = _time_zone_offset(content)
+    if all("time" in event for event in flat_events):
+        # Dates and times repeat across events, so only the distinct values are
+        # parsed, as ISO 8601 to accept fractional seconds such as 00:00:00.000.
+        date_codes, dates = pd.factorize(
+            np.array([event["date"] for event in flat_events], dtype=object)
+        )
+        time_codes, times = pd.factorize(
+            np.array([event["time"] for event in flat_events], dtype=object)
+        )
+        timestamps: Any = (
+            pd.to_datetime(dates, format="ISO8601").to_numpy()[date_codes]
+            + pd.to_timedelta(times).to_numpy()[time_codes]
+            - time_zone.to_timedelta64()
+        )
+    else:
+        timestamps = pd.DatetimeIndex(
+            [_event_timestamp(event, time_zone) for event in flat_events]
+        )
+
+    values = np.array(
+        [event.get("value", "NaN") for event in flat_events],
+        dtype=dtype,
+    )
+    miss_values = np.repeat(
+        np.array(
+            [float(header.get("missVal", "NaN")) for header in headers],
+            dtype=dtype,
+        ),
+        lengths,
+    )
+    values[values == miss_values] = np.nan
+    flags = (
+        np.array([event.get("flag", 0) for event in flat_events], dtype=np.int8)
+        if parse_flags
+        else None
+    )
+    return _PiJsonEvents(
+        headers=headers,
+        lengths=lengths,
+        times=np.asarray(timestamps, dtype="datetime64[ns]"),
+        values=values,
+        flags=flags,
+    )
+
+
+def _event_timestamp(event: dict[str, Any], time_zone: pd.Timedelta) -> pd.Timestamp:
+    """Return the naive UTC time of one event, with or without a ``time`` field."""
+    if "time" in event:
+        return pd.Timestamp(f"{event['date']}T{event['time']}") - time_zone
+    timestamp = pd.Timestamp(event["date"])
+    if timestamp.tzinfo is None:
+        return timestamp - time_zone
+    return timestamp.tz_convert("UTC").tz_localize(None)
+
+
+def validate_compact_options(value_dtype: str | None, flags: str = "keep") -> None:
+    """Raise a ``ValueError`` for unsupported compact decode options."""
+    if value_dtype is not None and value_dtype not in VALUE_DTYPES:
+        raise ValueError(
+            f"Unsupported value_dtype '{value_dtype}'. Supported value dtypes are: "
+            f"{', '.join(VALUE_DTYPES)}."
+        )
+    if flags not in FLAG_MODES:
+        raise ValueError(
+            f"Unsupported flags '{flags}'. Supported flag modes are: "
+            f"{', '.join(FLAG_MODES)}."
+        )
+
+
+def drop_pi_json_event_fields(
+    content: dict[str, Any], fields: Iterable[str]
+) -> dict[str, Any]:
+    """Remove ``fields`` from every event of a PI JSON document, in place."""
+    fields = tuple(fields)
+    if not fields:
+        return content
+    for series in content.get("timeSeries") or []:
+        for event in series.get("events") or []:
+            for name in fields:
+                event.pop(name, None)
+    return content
+
+
+def _time_zone_offset(content: dict[str, Any]) -> pd.Timedelta:
+    """Return the offset of the document time zone from UTC."""
+    return pd.Timedelta(hours=float(content.get("timeZone") or 0.0))
+
+
+def _forecast_date(
+    header: dict[str, Any], time_zone: pd.Timedelta
+) -> pd.Timestamp | None:
+    """Return the forecast date of a series header in UTC, if any."""
+    forecast_date = header.get("forecastDate")
+    if not forecast_date:
+        return None
+    return pd.Timestamp(f"{forecast_date['date']}T{forecast_date['time']}") - time_zone
+
+
+def _variable_name(header: dict[str, Any]) -> str:
+    """Name a series variable like FEWS does in PI NetCDF files."""
+    parts = [header.get("parameterId", "value"), *(header.get("qualifierId") or [])]
+    return re.sub(r"\W", "_", "_".join(str(part) for part in parts))
+
+
+def _station_floats(headers: list[dict[str, Any]], field: str) -> np.ndarray:
+    """Return a numeric header field per station, ``NaN`` where it is missing."""
+    return np.array([header.get(field, "NaN") for header in headers], dtype=float)
+
+
+def header_value(header: dict[str, Any], name: str) -> str | None:
+    """Return a header field as a string, joining qualifier lists."""
+    value = header.get(name)
+    if isinstance(value, list):
+        value = ",".join(str(item) for item in value)
+    return str(value) if value not in (None, "") else None
+
+
+def _repeat_header_categorical(
+    values: list[str | None], lengths: np.ndarray
+) -> pd.Categorical:
+    """Build a categorical column that repeats one header value per event."""
+    per_series = pd.Categorical(values)
+    return pd.Categorical.from_codes(
+        cast(Any, np.repeat(per_series.codes, lengths)),
+        categories=per_series.categories,
+    )
@@ -0,0 +1,128 @@
+import io
+import xml.etree.ElementTree as ET
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any
+
+import numpy as np
+import pandas as pd
+
+__all__ = ["PiXmlSeries", "iter_pi_xml_series"]
+
+
+@dataclass
+class PiXmlSeries:
+    """One time series of a FEWS PI XML document.
+
+    Attributes:
+        header: Header fields with the same shape as a PI JSON header: element
+            text as strings, elements with attributes (such as ``timeStep`` or
+            ``startDate``) as dictionaries and repeated elements (such as
+            ``qualifierId``) as lists.
+        times: Event times as UTC ``datetime64[ns]`` values.
+        values: Event values as ``float64``, ``NaN`` where equal to ``missVal``.
+        flags: Event flags as ``int8``.
+    """
+
+    header: dict[str, Any]
+    times: np.ndarray
+    values: np.ndarray
+    flags: np.ndarray
+
+
+def iter_pi_xml_series(
+    source: bytes | str | Path | IO[bytes],
+) -> Iterator[PiXmlSeries]:
+    """Parse a FEWS PI XML time series document one series at a time.
+
+    The document is read incrementally with ``xml.etree.ElementTree.iterparse``
+    and every ``series`` element is removed from the tree once its events
+    have been collected, so memory use stays close to the size of the largest
+    series instead of the whole document tree.
+
+    Args:
+        source: The document as bytes, a file path or a binary file object.
+
+    Yields:
+        A :class:`PiXmlSeries` per ``series`` element, in document order.
+    """
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    time_zone = pd.Timedelta(0)
+    header: dict[str, Any] = {}
+    dates: list[str] = []
+    times: list[str] = []
+    values: list[str] = []
+    flags: list[str] = []
+    local_names: dict[str, str] = {}
+    root: ET.Element | None = None
+    for event, element in ET.iterparse(source, events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = element
+            continue
+        tag = local_names.get(element.tag)
+        if tag is None:
+            tag = local_names[element.tag] = _local_name(element.tag)
+        if tag == "event":
+            dates.append(element.get("date", ""))
+            times.append(element.get("time", ""))
+            values.append(element.get("value", "NaN"))
+            flags.append(element.get("flag", "0"))
+            element.clear()
+        elif tag == "header":
+            header = _parse_header(element)
+        elif tag == "timeZone" and element.text:
+            time_zone = pd.Timedelta(hours=float(element.text))
+        elif tag == "series":
+            yield _build_series(header, dates, times, values, flags, time_zone)
+            header, dates, times, values, flags = {}, [], [], [], []
+            # Series are children of the root, which only keeps the few that
+            # the parser has read ahead once finished ones are detached.
+            element.clear()
+            if root is not None and element in root:
+                root.remove(element)
+
+
+def _build_series(
+    header: dict[str, Any],
+    dates: list[str],
+    times: list[str],
+    values: list[str],
+    flags: list[str],
+    time_zone: pd.Timedelta,
+) -> PiXmlSeries:
+    """Convert the collected event attributes of one series to arrays."""
+    timestamps = pd.to_datetime(
+        np.char.add(
+            np.char.add(np.array(dates, dtype=str), "T"), np.array(times, dtype=str)
+        ),
+        format="%Y-%m-%dT%H:%M:%S",
+    )
+    value_array = np.array(values, dtype=np.float64)
+    value_array[value_array == float(header.get("missVal", "NaN"))] = np.nan
+    return PiXmlSeries(
+        header=header,
+        times=np.asarray(timestamps - time_zone, dtype="datetime64[ns]"),
+        values=value_array,
+        flags=np.array(flags, dtype=np.int8),
+    )
+
+
+def _parse_header(element: ET.Element) -> dict[str, Any]:
+    """Convert a PI XML ``header`` element to a PI JSON style dictionary."""
+    header: dict[str, Any] = {}
+    for child in element:
+        name = _local_name(child.tag)
+        value: Any = dict(child.attrib) if child.attrib else (child.text or "")
+        if name == "qualifierId":
+            header.setdefault(name, []).append(value)
+        else:
+            header[name] = value
+    return header
+
+
+def _local_name(tag: str) -> str:
+    """Strip the XML namespace from an element tag."""
+    return tag.rsplit("}", 1)[-1]
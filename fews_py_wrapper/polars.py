@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import importlib.util
+import types
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, Union, get_args, get_origin
+
+import numpy as np
+import xarray as xr
+from pydantic import BaseModel
+
+from fews_py_wrapper._tables import (
+    LabelColumn,
+    empty_netcdf_table_columns,
+    netcdf_table_columns,
+    pi_json_table_columns,
+)
+
+if TYPE_CHECKING:
+    import polars as pl
+
+__all__ = [
+    "netcdf_datasets_to_polars",
+    "pi_json_to_polars",
+    "pi_records_to_polars",
+]
+
+
+def pi_json_to_polars(
+    content: dict[str, Any],
+    *,
+    value_dtype: str | None = None,
+    flags: str = "keep",
+) -> pl.DataFrame:
+    """Convert a FEWS PI JSON time series document to a ``polars.DataFrame``.
+
+    The frame has the columns of :func:`fews_py_wrapper.arrow.pi_json_to_arrow`:
+    the header fields in ``PI_JSON_HEADER_COLUMNS`` as categoricals, ``time``
+    as a UTC datetime, ``value`` (null where equal to ``missVal``) and
+    ``flag``. Columns are built from the parsed NumPy arrays, without pandas
+    or per-event Python objects. ``value_dtype`` and ``flags`` work as in
+    :func:`fews_py_wrapper.pi_json.pi_json_to_dataframe`.
+
+    Requires the optional ``polars`` dependency.
+    """
+    _require_polars()
+    return _polars_frame(
+        pi_json_table_columns(content, value_dtype=value_dtype, flags=flags)
+    )
+
+
+def netcdf_datasets_to_polars(datasets: Iterable[xr.Dataset]) -> pl.DataFrame:
+    """Convert FEWS NetCDF member datasets to a single ``polars.DataFrame``.
+
+    The frame has the columns of
+    :func:`fews_py_wrapper.arrow.netcdf_datasets_to_arrow`, one row per value
+    of every variable on the ``time`` and ``stations`` dimensions.
+
+    Requires the optional ``polars`` dependency.
+
+    Raises:
+        ValueError: If a member has a series variable but no ``station_id``.
+    """
+    _require_polars()
+    import polars as pl
+
+    frames = [_polars_frame(columns) for columns in netcdf_table_columns(datasets)]
+    if not frames:
+        return _polars_frame(empty_netcdf_table_columns())
+    return pl.concat(frames, how="diagonal_relaxed")
+
+
+def pi_records_to_polars(
+    records: list[dict[str, Any]], model: type[BaseModel]
+) -> pl.DataFrame:
+    """Convert PI JSON metadata records to a ``polars.DataFrame`` column-wise.
+
+    ``records`` are the raw entries of a PI JSON metadata response, such as
+    the ``locations`` of a locations response, and ``model`` is the matching
+    PI model, such as :class:`~fews_py_wrapper.models.PiLocation`. Every
+    string, number or boolean field of ``model`` becomes a column named by
+    its PI JSON key (for example ``locationId``); nested fields such as
+    ``attributes`` are left out. Numbers and booleans sent as strings are
+    parsed. Records are not validated against ``model``, which keeps
+    responses with many entries fast to load.
+
+    Requires the optional ``polars`` dependency.
+    """
+    _require_polars()
+    import polars as pl
+
+    dtypes = _record_dtypes(model)
+    frame = pl.from_dicts(
+        records, schema=dict.fromkeys(dtypes, pl.String), strict=False
+    )
+    return frame.with_columns(
+        (pl.col(name).str.to_lowercase() == "true")
+        if dtype == pl.Boolean
+        else pl.col(name).cast(dtype)
+        for name, dtype in dtypes.items()
+        if dtype != pl.String
+    )
+
+
+def _require_polars() -> None:
+    """Raise an ``ImportError`` with install instructions without polars."""
+    if importlib.util.find_spec("polars") is None:
+        raise ImportError(
+            "Polars output requires polars. Install it with "
+            "`pip install fews-py-wrapper[polars]`."
+        )
+
+
+def _polars_frame(columns: dict[str, Any]) -> pl.DataFrame:
+    """Build a frame from long-layout NumPy columns, column by column."""
+    import polars as pl
+
+    series: list[pl.Series] = []
+    for name, column in columns.items():
+        if isinstance(column, LabelColumn):
+            series.append(_categorical_series(name, column))
+        elif np.issubdtype(column.dtype, np.datetime64):
+            series.append(pl.Series(name, column).dt.replace_time_zone("UTC"))
+        elif np.issubdtype(column.dtype, np.floating):
+            series.append(pl.Series(name, column, nan_to_null=True))
+        else:
+            series.append(pl.Series(name, column))
+    return pl.DataFrame(series)
+
+
+def _categorical_series(name: str, column: LabelColumn) -> pl.Series:
+    """Expand a label column to a categorical series, null where missing."""
+    import polars as pl
+
+    if not column.labels:
+        return pl.repeat(
+            None, len(column.codes), dtype=pl.Categorical, eager=True
+        ).alias(name)
+    codes = pl.Series(name, column.codes, dtype=pl.Int32)
+    if (column.codes < 0).any():
+        codes = pl.select(pl.when(codes >= 0).then(codes)).to_series()
+    labels = pl.Series(name, column.labels, dtype=pl.String).cast(pl.Categorical)
+    return labels.gather(codes).alias(name)
+
+
+def _record_dtypes(model: type[BaseModel]) -> dict[str, pl.DataType]:
+    """Return the PI JSON key and polars type of every scalar model field."""
+    import polars as pl
+
+    scalar_dtypes: dict[Any, pl.DataType] = {
+        str: pl.String(),
+        float: pl.Float64(),
+        int: pl.Int64(),
+        bool: pl.Boolean(),
+    }
+    dtypes: dict[str, pl.DataType] = {}
+    for name, field in model.model_fields.items():
+        annotation = field.annotation
+        if get_origin(annotation) in (Union, types.UnionType):
+            options = [arg for arg in get_args(annotation) if arg is not type(None)]
+            annotation = options[0] if len(options) == 1 else None
+        if annotation in scalar_dtypes:
+            dtypes[field.alias or name] = scalar_dtypes[annotation]
+    return dtypes
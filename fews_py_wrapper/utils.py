@@ -1,20 +1,79 @@
+import atexit
+import contextlib
+import importlib.util
 import inspect
 import io
+import json
+import multiprocessing
+import shutil
+import tempfile
+import threading
+import weakref
 import zipfile
-from datetime import datetime, timezone
+from collections import OrderedDict, deque
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import Any, Callable
+from typing import IO, Any, Callable, Hashable, cast
 
+import netCDF4
+import numpy as np
 import xarray as xr
+from xarray.backends import NetCDF4DataStore
+
+from fews_py_wrapper.pi_json import validate_compact_options
 
 __all__ = [
     "format_datetime",
     "convert_netcdf_zip_response_to_xarray",
+    "open_netcdf_zip_response_lazily",
+    "NetcdfZipResponse",
+    "NetcdfMemberCache",
+    "concat_netcdf_time_chunks",
+    "concat_netcdf_station_batches",
+    "concat_netcdf_zip_responses",
+    "merge_netcdf_datasets",
+    "merge_pi_json_time_chunks",
+    "split_time_window",
     "format_time_args",
     "get_function_arg_names",
 ]
 
+# The netCDF4/HDF5 libraries are not thread-safe; NetCDF members are decoded
+# one at a time even when requests are fetched concurrently.
+_NETCDF_DECODE_LOCK = threading.Lock()
+NETCDF_DECODE_EXECUTORS = ("thread", "process")
+# CF attributes that mark a NetCDF variable as quality flags.
+_NETCDF_FLAG_ATTRIBUTES = ("flag_values", "flag_masks", "flag_meanings")
+# Fill value of packed uint8 flags where a flag is missing.
+PACKED_FLAG_FILL_VALUE = 255
+# PI JSON header fields that identify a series across time windows.
+PI_JSON_SERIES_IDENTITY_FIELDS = (
+    "moduleInstanceId",
+    "parameterId",
+    "locationId",
+    "qualifierId",
+    "ensembleId",
+    "ensembleMemberId",
+    "ensembleMemberIndex",
+    "forecastDate",
+    "timeStep",
+)
+# FEWS time series types, the middle part of PI_NETCDF member file names.
+_FEWS_TIME_SERIES_TYPES = frozenset(
+    {
+        "externalhistorical",
+        "externalforecasting",
+        "simulatedhistorical",
+        "simulatedforecasting",
+        "temporary",
+    }
+)
+
 
 def format_datetime(dt: datetime, time_format: str = "%Y-%m-%dT%H:%M:%SZ") -> str:
     """Format a datetime object to a string suitable for FEWS web services."""
@@ -24,44 +83,928 @@ def format_datetime(dt: datetime, time_format: str = "%Y-%m-%dT%H:%M:%SZ") -> st
     return dt.strftime(time_format)
 
 
-def convert_netcdf_zip_response_to_xarray(response_content: bytes) -> list[xr.Dataset]:
+def convert_netcdf_zip_response_to_xarray(
+    response_content: bytes | str | Path | IO[bytes],
+    *,
+    in_memory: bool = True,
+    max_workers: int = 1,
+    executor: str = "thread",
+    value_dtype: str | None = None,
+    flags: str = "keep",
+    skip_comments: bool = False,
+    variables: Iterable[str] | None = None,
+    time_slice: slice | None = None,
+    station_ids: Iterable[str] | None = None,
+    cache: "NetcdfMemberCache | None" = None,
+) -> list[xr.Dataset]:
     """Convert FEWS NetCDF ZIP content to xarray datasets.
 
     ZIP responses are returned as one loaded dataset per NetCDF member, in the
-    same order as the ZIP archive.
+    same order as the ZIP archive. ``response_content`` is the ZIP archive as
+    bytes, a file path or a binary file object, such as a response downloaded
+    with ``TimeSeries.download``; files are read member by member instead of
+    being loaded at once. Members are decoded straight from memory; set
+    ``in_memory=False`` to extract them to a temporary directory first.
+    The ``source`` encoding of each dataset is its member file name.
+
+    With ``max_workers`` greater than one, members are decoded concurrently.
+    The ``"process"`` executor decodes members in parallel in worker
+    processes, which are started on first use and reused by later calls;
+    members are read from the archive as workers become free, and decoded
+    datasets are pickled back. The ``"thread"`` executor is mostly serialized:
+    netCDF4 is not thread-safe, so only ZIP inflation and CF decoding overlap
+    with reading other members.
+
+    ``variables``, ``time_slice`` and ``station_ids`` select what is read from
+    each member; everything else is never loaded. ``variables`` are variable
+    names or FEWS parameter IDs (the ``originalParameterId`` of a member);
+    variables on the ``time`` and ``stations`` dimensions that are not listed,
+    including flag and comment variables, are skipped, as are members without
+    any of them.
+    ``time_slice`` is an inclusive ``slice`` of times (timezone-aware
+    datetimes are converted to UTC) and ``station_ids`` are the ``station_id``
+    values to keep.
+
+    The compact options are applied to each member as soon as it is decoded,
+    so only one member is held at full size. ``value_dtype`` casts the
+    floating-point series variables, such as ``"float32"``. Flag variables
+    (with CF ``flag_values``/``flag_meanings`` attributes or a name ending in
+    ``flag``) are kept with ``flags="keep"``, stored as ``uint8`` with
+    ``flags="pack"`` (``PACKED_FLAG_FILL_VALUE`` where missing) or removed
+    with ``flags="drop"``. ``skip_comments`` removes text variables on the
+    ``time`` dimension, such as comments and flag sources.
+
+    With a :class:`NetcdfMemberCache`, members that are byte-identical to a
+    member decoded before with the same options are taken from the cache
+    instead of being extracted and decoded again.
     """
-    datasets = _load_netcdf_member_datasets(response_content)
-    if not datasets:
-        raise ValueError("FEWS PI_NETCDF response did not contain any NetCDF datasets.")
+    if executor not in NETCDF_DECODE_EXECUTORS:
+        raise ValueError(
+            f"Unsupported executor '{executor}'. Supported executors are: "
+            f"{', '.join(NETCDF_DECODE_EXECUTORS)}."
+        )
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1.")
+    if max_workers > 1 and not in_memory:
+        raise ValueError("Parallel decoding requires in_memory=True.")
+    return _load_netcdf_member_datasets(
+        response_content,
+        in_memory=in_memory,
+        max_workers=max_workers,
+        executor=executor,
+        options=_netcdf_decode_options(
+            value_dtype=value_dtype,
+            flags=flags,
+            skip_comments=skip_comments,
+            variables=variables,
+            time_slice=time_slice,
+            station_ids=station_ids,
+        ),
+        cache=cache,
+    )
+
+
+def open_netcdf_zip_response_lazily(
+    response_content: bytes | str | Path | IO[bytes],
+    *,
+    spill_dir: str | Path | None = None,
+    chunks: dict[str, int] | str | None = None,
+    value_dtype: str | None = None,
+    flags: str = "keep",
+    skip_comments: bool = False,
+    variables: Iterable[str] | None = None,
+    time_slice: slice | None = None,
+    station_ids: Iterable[str] | None = None,
+) -> list[xr.Dataset]:
+    """Open FEWS NetCDF ZIP content as lazy, dask-backed xarray datasets.
+
+    The NetCDF members are written to spill files and opened with dask chunks,
+    so data is only read when it is computed. ``response_content`` is the ZIP
+    archive as bytes, a file path or a binary file object. Members are
+    returned in ZIP order. Spill files are written to a new directory under
+    ``spill_dir``, or under the system temporary directory without it. ``chunks``
+    is passed to ``xr.open_dataset`` and defaults to the on-disk chunking of
+    each variable. The subset and compact options of
+    :func:`convert_netcdf_zip_response_to_xarray` are applied lazily.
+
+    Each spill file is deleted once its dataset and every lazy object derived
+    from it, such as a selected variable, have been garbage collected, and at
+    the latest when the interpreter exits. The directory is deleted with its
+    last file. Load or compute the data you keep before dropping the datasets.
+
+    Requires the optional ``dask`` dependency.
+    """
+    if importlib.util.find_spec("dask") is None:
+        raise ImportError(
+            "Lazy NetCDF decoding requires dask. Install it with "
+            "`pip install fews-py-wrapper[lazy]`."
+        )
+    options = _netcdf_decode_options(
+        value_dtype=value_dtype,
+        flags=flags,
+        skip_comments=skip_comments,
+        variables=variables,
+        time_slice=time_slice,
+        station_ids=station_ids,
+    )
+    try:
+        with zipfile.ZipFile(_zip_source(response_content)) as zip_file:
+            netcdf_members = _netcdf_zip_members(zip_file)
+            if spill_dir is not None:
+                Path(spill_dir).mkdir(parents=True, exist_ok=True)
+            response_dir = Path(
+                tempfile.mkdtemp(prefix="fews_py_wrapper_", dir=spill_dir)
+            )
+            paths = [
+                _write_zip_member_to_temp_path(zip_file, member, response_dir, index)
+                for index, member in enumerate(netcdf_members)
+            ]
+    except zipfile.BadZipFile as exc:
+        raise ValueError(
+            "Expected FEWS PI_NETCDF content as a ZIP archive containing NetCDF files."
+        ) from exc
+
+    datasets: list[xr.Dataset] = []
+    with _NETCDF_DECODE_LOCK:
+        for path in paths:
+            store = _SpillStore.open(str(path))
+            weakref.finalize(store, _remove_spill_file, store._manager, path)
+            dataset = options.select(
+                xr.open_dataset(store, chunks={} if chunks is None else chunks)
+            )
+            if dataset is not None:
+                datasets.append(options.compact(dataset))
+    if not paths:
+        response_dir.rmdir()
     return datasets
 
 
-def _load_netcdf_member_datasets(response_content: bytes) -> list[xr.Dataset]:
-    """Load each NetCDF member from a FEWS ZIP response."""
+class _SpillStore(NetCDF4DataStore):
+    """A NetCDF4 store of a lazy spill file that can be weakly referenced.
+
+    Every lazy array opened from the store references it, so the store is
+    only garbage collected once nothing can read the spill file anymore.
+    """
+
+
+def _remove_spill_file(manager: Any, path: Path) -> None:
+    """Close and delete a spill file, and its directory once that is empty."""
+    manager.close()
+    path.unlink(missing_ok=True)
+    with contextlib.suppress(OSError):
+        path.parent.rmdir()
+
+
+class NetcdfZipResponse(Mapping[str, xr.Dataset]):
+    """The NetCDF members of a FEWS PI_NETCDF ZIP response, decoded on access.
+
+    Only the ZIP directory is read up front. The response maps each member
+    file name, in ZIP order, to its dataset, which is decoded the first time
+    it is accessed and cached; ``list(response.values())`` decodes every
+    member like :func:`convert_netcdf_zip_response_to_xarray`. Members can
+    also be looked up by FEWS parameter ID with :meth:`for_parameter`.
+
+    ``response_content`` is the ZIP archive as bytes, a file path or a binary
+    file object, which stays open until :meth:`close` is called (or the
+    response is used as a context manager). The compact options and
+    ``time_slice``, ``station_ids`` and ``cache`` options of
+    :func:`convert_netcdf_zip_response_to_xarray` are applied to every
+    decoded member.
+    """
+
+    def __init__(
+        self,
+        response_content: bytes | str | Path | IO[bytes],
+        *,
+        value_dtype: str | None = None,
+        flags: str = "keep",
+        skip_comments: bool = False,
+        time_slice: slice | None = None,
+        station_ids: Iterable[str] | None = None,
+        cache: "NetcdfMemberCache | None" = None,
+    ) -> None:
+        options = _netcdf_decode_options(
+            value_dtype=value_dtype,
+            flags=flags,
+            skip_comments=skip_comments,
+            variables=None,
+            time_slice=time_slice,
+            station_ids=station_ids,
+        )
+        self._init(_NetcdfZipArchive(response_content, options, cache))
+
+    def _init(self, members: "_NetcdfZipArchive | _ConcatenatedNetcdfMembers") -> None:
+        self._members = members
+        self._decoded: dict[str, xr.Dataset] = {}
+        self._parameter_ids: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def _concat(
+        cls, responses: list["NetcdfZipResponse"], dim: str
+    ) -> "NetcdfZipResponse":
+        """Combine the responses of time windows or location batches.
+
+        Members with the same file name are concatenated along ``dim`` when
+        they are decoded.
+        """
+        response = cls.__new__(cls)
+        response._init(
+            _ConcatenatedNetcdfMembers([item._members for item in responses], dim=dim)
+        )
+        return response
+
+    def __getitem__(self, filename: str) -> xr.Dataset:
+        if filename not in self._members.filenames:
+            raise KeyError(filename)
+        with self._lock:
+            dataset = self._decoded.get(filename)
+            if dataset is None:
+                dataset = self._decoded[filename] = cast(
+                    xr.Dataset, self._members.decode(filename)
+                )
+        return dataset
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._members.filenames)
+
+    def __len__(self) -> int:
+        return len(self._members.filenames)
+
+    def __repr__(self) -> str:
+        return f"<NetcdfZipResponse members={len(self)} decoded={len(self._decoded)}>"
+
+    @property
+    def parameter_ids(self) -> list[str]:
+        """The FEWS parameter IDs of the members, in order of first appearance.
+
+        Parameter IDs are read from FEWS member file names
+        (``<parameterId>_<time series type>_<time step>.nc``). Members with
+        other names are decoded to read the parameter of their series
+        variable, falling back to the file name without extension.
+        """
+        return list(dict.fromkeys(self._parameter_id(name) for name in self))
+
+    def for_parameter(self, parameter_id: str) -> list[xr.Dataset]:
+        """Return the decoded members of one FEWS parameter, in ZIP order.
+
+        Raises:
+            KeyError: If no member holds ``parameter_id``.
+        """
+        datasets = [
+            self[filename]
+            for filename in self
+            if self._parameter_id(filename) == parameter_id
+        ]
+        if not datasets:
+            raise KeyError(parameter_id)
+        return datasets
+
+    def close(self) -> None:
+        """Close the ZIP archives; decoded members stay available."""
+        self._members.close()
+
+    def __enter__(self) -> "NetcdfZipResponse":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _parameter_id(self, filename: str) -> str:
+        parameter_id = self._parameter_ids.get(filename)
+        if parameter_id is None:
+            parameter_id = _netcdf_member_parameter_id(filename)
+            if parameter_id is None:
+                dataset = self[filename]
+                names = netcdf_series_variables(dataset)
+                parameter_id = (
+                    netcdf_parameter_id(dataset, names[0])
+                    if len(names) == 1
+                    else Path(filename).stem
+                )
+            self._parameter_ids[filename] = parameter_id
+        return parameter_id
+
+
+class _NetcdfZipArchive:
+    """The NetCDF members of one ZIP archive, decoded one at a time."""
+
+    def __init__(
+        self,
+        response_content: bytes | str | Path | IO[bytes],
+        options: "_NetcdfDecodeOptions",
+        cache: "NetcdfMemberCache | None" = None,
+    ) -> None:
+        self._content = response_content
+        self._cache = cache
+        try:
+            self._zip_file = zipfile.ZipFile(_zip_source(response_content))
+            members = _netcdf_zip_members(self._zip_file)
+        except zipfile.BadZipFile as exc:
+            raise ValueError(
+                "Expected FEWS PI_NETCDF content as a ZIP archive containing "
+                "NetCDF files."
+            ) from exc
+        self._members = {member.filename: member for member in members}
+        self.filenames: list[str] = list(self._members)
+        self._options = options
+
+    def decode(self, filename: str) -> xr.Dataset | None:
+        """Decode one member, or return ``None`` if the archive lacks it."""
+        member = self._members.get(filename)
+        if member is None:
+            return None
+        if self._cache is not None:
+            dataset = self._cache.get(member, self._options)
+            if dataset is not None:
+                return dataset
+        content = self._zip_file.read(member)
+        with _NETCDF_DECODE_LOCK:
+            dataset = _open_netcdf_bytes(content, member.filename, self._options)
+        if self._cache is not None and dataset is not None:
+            self._cache.put(member, self._options, dataset)
+        return dataset
+
+    def close(self) -> None:
+        self._zip_file.close()
+        if isinstance(self._content, io.IOBase):
+            self._content.close()
+
+
+class _ConcatenatedNetcdfMembers:
+    """Members of several ZIP archives, concatenated per file name on decode."""
+
+    def __init__(
+        self,
+        parts: "list[_NetcdfZipArchive | _ConcatenatedNetcdfMembers]",
+        dim: str,
+    ) -> None:
+        self._parts = parts
+        self._dim = dim
+        self.filenames: list[str] = list(
+            dict.fromkeys(name for part in parts for name in part.filenames)
+        )
+
+    def decode(self, filename: str) -> xr.Dataset | None:
+        """Decode a member from every part that has it and concatenate them."""
+        datasets = [
+            dataset
+            for part in self._parts
+            if (dataset := part.decode(filename)) is not None
+        ]
+        if not datasets:
+            return None
+        if self._dim == "time":
+            return _concat_datasets_along_time(datasets)
+        return _concat_datasets_along_stations(datasets)
+
+    def close(self) -> None:
+        for part in self._parts:
+            part.close()
+
+
+class NetcdfMemberCache:
+    """Bounded LRU cache of decoded NetCDF members, keyed by ZIP entry.
+
+    Polling FEWS for the same forecasts returns ZIP archives whose members are
+    mostly byte-identical between polls. Members are cached by file name,
+    CRC-32 and size, together with the options they were decoded with, so an
+    unchanged member is served from the cache instead of being extracted and
+    decoded again. Once the cached datasets exceed ``max_bytes``, the least
+    recently used members are evicted; larger members are not cached.
+
+    Cached members are returned as shallow copies: adding variables or
+    attributes does not affect the cache, but the value arrays are shared and
+    must not be modified in place. The cache is safe to share between threads.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024) -> None:
+        if max_bytes < 0:
+            raise ValueError("max_bytes must not be negative.")
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self._entries: OrderedDict[Hashable, xr.Dataset] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Remove all cached members."""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def get(
+        self, member: zipfile.ZipInfo, options: "_NetcdfDecodeOptions"
+    ) -> xr.Dataset | None:
+        """Return a copy of the cached member, or ``None`` on a miss."""
+        key = _netcdf_member_cache_key(member, options)
+        with self._lock:
+            dataset = self._entries.get(key)
+            if dataset is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return dataset.copy(deep=False)
+
+    def put(
+        self,
+        member: zipfile.ZipInfo,
+        options: "_NetcdfDecodeOptions",
+        dataset: xr.Dataset,
+    ) -> None:
+        """Cache a decoded member, evicting the least recently used ones."""
+        nbytes = dataset.nbytes
+        if nbytes > self.max_bytes:
+            return
+        key = _netcdf_member_cache_key(member, options)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.nbytes -= previous.nbytes
+            self._entries[key] = dataset.copy(deep=False)
+            self.nbytes += nbytes
+            while self.nbytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.nbytes -= evicted.nbytes
+
+
+def _netcdf_member_cache_key(
+    member: zipfile.ZipInfo, options: "_NetcdfDecodeOptions"
+) -> Hashable:
+    """Identify a ZIP member's content and how it was decoded."""
+    time_slice = options.time_slice
+    return (
+        member.filename,
+        member.CRC,
+        member.file_size,
+        options.value_dtype,
+        options.flags,
+        options.skip_comments,
+        options.variables,
+        None if time_slice is None else (time_slice.start, time_slice.stop),
+        options.station_ids,
+    )
+
+
+def concat_netcdf_zip_responses(
+    responses: list[NetcdfZipResponse], dim: str
+) -> NetcdfZipResponse:
+    """Combine lazy responses of time windows (``"time"``) or location batches.
+
+    Members with the same file name are concatenated along ``dim`` when they
+    are accessed, like :func:`concat_netcdf_time_chunks` and
+    :func:`concat_netcdf_station_batches` do for decoded members.
+    """
+    if dim not in ("time", "stations"):
+        raise ValueError(
+            f"Unsupported dim '{dim}'. Supported dims are: time, stations."
+        )
+    return NetcdfZipResponse._concat(responses, dim)
+
+
+def _netcdf_member_parameter_id(filename: str) -> str | None:
+    """Return the parameter ID of a FEWS member file name, if it follows the
+    ``<parameterId>_<time series type>_<time step>.nc`` pattern."""
+    parts = Path(filename).stem.rsplit("_", 2)
+    if len(parts) == 3 and parts[1] in _FEWS_TIME_SERIES_TYPES:
+        return parts[0]
+    return None
+
+
+def _netcdf_zip_members(zip_file: zipfile.ZipFile) -> list[zipfile.ZipInfo]:
+    """Return the NetCDF members of a FEWS ZIP response in archive order."""
+    netcdf_members = [
+        member
+        for member in zip_file.infolist()
+        if not member.is_dir()
+        and member.filename.lower().endswith((".nc", ".nc4", ".cdf"))
+    ]
+    if not netcdf_members:
+        raise ValueError("ZIP response did not contain any .nc files.")
+    return netcdf_members
+
+
+def _zip_source(
+    response_content: bytes | str | Path | IO[bytes],
+) -> str | Path | IO[bytes]:
+    """Return what ``zipfile.ZipFile`` reads a FEWS ZIP response from."""
+    if isinstance(response_content, bytes):
+        return io.BytesIO(response_content)
+    return response_content
+
+
+def _load_netcdf_member_datasets(
+    response_content: bytes | str | Path | IO[bytes],
+    in_memory: bool = True,
+    max_workers: int = 1,
+    executor: str = "thread",
+    options: "_NetcdfDecodeOptions | None" = None,
+    cache: "NetcdfMemberCache | None" = None,
+) -> list[xr.Dataset]:
+    """Load each NetCDF member from a FEWS ZIP response.
+
+    Members that ``options`` selects no variables from are left out. Members
+    found in ``cache`` are not read from the archive.
+    """
+    options = options or _NetcdfDecodeOptions()
     try:
-        with zipfile.ZipFile(io.BytesIO(response_content)) as zip_file:
-            netcdf_members = [
-                member
-                for member in zip_file.infolist()
-                if not member.is_dir()
-                and member.filename.lower().endswith((".nc", ".nc4", ".cdf"))
+        with zipfile.ZipFile(_zip_source(response_content)) as zip_file:
+            netcdf_members = _netcdf_zip_members(zip_file)
+            datasets: list[xr.Dataset | None] = [
+                None if cache is None else cache.get(member, options)
+                for member in netcdf_members
             ]
-            if not netcdf_members:
-                raise ValueError("ZIP response did not contain any .nc files.")
-
-            datasets: list[xr.Dataset] = []
-            with TemporaryDirectory() as temp_dir:
-                for index, member in enumerate(netcdf_members):
-                    extracted_path = _write_zip_member_to_temp_path(
-                        zip_file, member, Path(temp_dir), index
-                    )
-                    with xr.open_dataset(extracted_path) as dataset:
-                        datasets.append(dataset.load())
-            return datasets
+            missing = [
+                index for index, dataset in enumerate(datasets) if dataset is None
+            ]
+            members = [netcdf_members[index] for index in missing]
+            if max_workers > 1 and len(members) > 1:
+                decoded = _decode_netcdf_members_in_parallel(
+                    zip_file, members, max_workers, executor, options
+                )
+            else:
+                with _NETCDF_DECODE_LOCK:
+                    if in_memory:
+                        decoded = [
+                            _open_netcdf_bytes(
+                                zip_file.read(member), member.filename, options
+                            )
+                            for member in members
+                        ]
+                    else:
+                        decoded = _open_netcdf_members_from_temp_dir(
+                            zip_file, members, options
+                        )
     except zipfile.BadZipFile as exc:
         raise ValueError(
             "Expected FEWS PI_NETCDF content as a ZIP archive containing NetCDF files."
         ) from exc
+    for index, dataset in zip(missing, decoded, strict=True):
+        if cache is not None and dataset is not None:
+            cache.put(netcdf_members[index], options, dataset)
+        datasets[index] = dataset
+    for member, dataset in zip(netcdf_members, datasets, strict=True):
+        if dataset is not None:
+            # Time windows and location batches are matched by member name.
+            dataset.encoding["source"] = member.filename
+    return [dataset for dataset in datasets if dataset is not None]
+
+
+def _decode_netcdf_members_in_parallel(
+    zip_file: zipfile.ZipFile,
+    members: list[zipfile.ZipInfo],
+    max_workers: int,
+    executor: str,
+    options: "_NetcdfDecodeOptions",
+) -> list[xr.Dataset | None]:
+    """Decode NetCDF members concurrently, keeping the ZIP member order."""
+    max_workers = min(max_workers, len(members))
+    if executor == "process":
+        return _decode_netcdf_members_in_processes(
+            zip_file, members, max_workers, options
+        )
+
+    def decode_member(member: zipfile.ZipInfo) -> xr.Dataset | None:
+        content = zip_file.read(member)
+        with _NETCDF_DECODE_LOCK:
+            dataset = _open_netcdf_bytes(
+                content, member.filename, options, decode_cf=False
+            )
+        if dataset is None:
+            return None
+        return options.compact(xr.decode_cf(dataset))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as thread_pool:
+        return list(thread_pool.map(decode_member, members))
+
+
+def _decode_netcdf_members_in_processes(
+    zip_file: zipfile.ZipFile,
+    members: list[zipfile.ZipInfo],
+    max_workers: int,
+    options: "_NetcdfDecodeOptions",
+) -> list[xr.Dataset | None]:
+    """Decode NetCDF members in the shared worker processes.
+
+    Members are read from the archive just before they are submitted, with at
+    most two per worker waiting, so reading overlaps decoding and the archive
+    is never held in memory at once.
+    """
+    pending: deque[Future[xr.Dataset | None]] = deque()
+    decoded: list[xr.Dataset | None] = []
+    with _NETCDF_PROCESS_POOL.acquire(max_workers) as process_pool:
+        try:
+            for member in members:
+                if len(pending) >= 2 * max_workers:
+                    decoded.append(pending.popleft().result())
+                pending.append(
+                    process_pool.submit(
+                        _open_netcdf_bytes,
+                        zip_file.read(member),
+                        member.filename,
+                        options,
+                    )
+                )
+            decoded.extend(future.result() for future in pending)
+        except BrokenProcessPool:
+            _NETCDF_PROCESS_POOL.discard(process_pool)
+            raise
+        finally:
+            for future in pending:
+                future.cancel()
+    return decoded
+
+
+class _SharedProcessPool:
+    """Worker processes shared by all process-mode decodes.
+
+    The pool is started on first use and reused afterwards. When more workers
+    are asked for, a larger pool replaces it for new decodes; the old pool is
+    only shut down once the last decode using it has released it. Workers are
+    spawned rather than forked, so they never inherit a held lock or HDF5
+    state.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pool: ProcessPoolExecutor | None = None
+        self._workers = 0
+        self._users: dict[ProcessPoolExecutor, int] = {}
+
+    @contextlib.contextmanager
+    def acquire(self, max_workers: int) -> Iterator[ProcessPoolExecutor]:
+        """Use a pool with at least ``max_workers`` workers."""
+        retired = None
+        with self._lock:
+            if self._pool is None or self._workers < max_workers:
+                if self._pool is not None and self._pool not in self._users:
+                    retired = self._pool
+                self._pool = ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+                self._workers = max_workers
+            pool = self._pool
+            self._users[pool] = self._users.get(pool, 0) + 1
+        if retired is not None:
+            retired.shutdown(wait=False)
+        try:
+            yield pool
+        finally:
+            self._release(pool)
+
+    def discard(self, pool: ProcessPoolExecutor) -> None:
+        """Stop handing out ``pool``, such as after a worker crashed."""
+        with self._lock:
+            if pool is not self._pool:
+                return
+            self._pool = None
+            self._workers = 0
+            in_use = pool in self._users
+        if not in_use:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self) -> None:
+        """Shut down the current pool once it is no longer in use."""
+        with self._lock:
+            pool = self._pool
+        if pool is not None:
+            self.discard(pool)
+
+    def _release(self, pool: ProcessPoolExecutor) -> None:
+        with self._lock:
+            self._users[pool] -= 1
+            if self._users[pool]:
+                return
+            del self._users[pool]
+            if pool is self._pool:
+                return
+        pool.shutdown(wait=False)
+
+
+_NETCDF_PROCESS_POOL = _SharedProcessPool()
+
+
+def _shutdown_netcdf_process_pool() -> None:
+    """Shut down the shared worker processes once they are no longer in use."""
+    _NETCDF_PROCESS_POOL.shutdown()
+
+
+atexit.register(_shutdown_netcdf_process_pool)
+
+
+def _open_netcdf_bytes(
+    content: bytes,
+    name: str,
+    options: "_NetcdfDecodeOptions | None" = None,
+    decode_cf: bool = True,
+) -> xr.Dataset | None:
+    """Decode one NetCDF file held in memory into a loaded dataset.
+
+    Only the subset selected by ``options`` is read. Without ``decode_cf`` the
+    raw data is returned and the compact options are left to the caller.
+    """
+    options = options or _NetcdfDecodeOptions()
+    nc_dataset = netCDF4.Dataset(name, mode="r", memory=content)
+    with xr.open_dataset(
+        xr.backends.NetCDF4DataStore(nc_dataset), decode_cf=decode_cf
+    ) as dataset:
+        selected = options.select(dataset)
+        if selected is None:
+            return None
+        selected = selected.load()
+    return options.compact(selected) if decode_cf else selected
+
+
+def _open_netcdf_members_from_temp_dir(
+    zip_file: zipfile.ZipFile,
+    members: list[zipfile.ZipInfo],
+    options: "_NetcdfDecodeOptions",
+) -> list[xr.Dataset | None]:
+    """Extract NetCDF members to a temporary directory and load them."""
+    datasets: list[xr.Dataset | None] = []
+    with TemporaryDirectory() as temp_dir:
+        for index, member in enumerate(members):
+            extracted_path = _write_zip_member_to_temp_path(
+                zip_file, member, Path(temp_dir), index
+            )
+            with xr.open_dataset(extracted_path) as dataset:
+                selected = options.select(dataset)
+                datasets.append(
+                    None if selected is None else options.compact(selected.load())
+                )
+    return datasets
+
+
+@dataclass(frozen=True)
+class _NetcdfDecodeOptions:
+    """What is read from each NetCDF member and how it is stored.
+
+    :meth:`select` picks variables, time steps and stations of a lazily
+    opened member before any data is read; :meth:`compact` casts, packs or
+    drops the variables of the decoded member.
+    """
+
+    value_dtype: str | None = None
+    flags: str = "keep"
+    skip_comments: bool = False
+    variables: frozenset[str] | None = None
+    time_slice: slice | None = None
+    station_ids: frozenset[str] | None = None
+
+    def select(self, dataset: xr.Dataset) -> xr.Dataset | None:
+        """Subset a member lazily; ``None`` when no variable is selected."""
+        if self.variables is not None:
+            series = [
+                str(name)
+                for name, variable in dataset.data_vars.items()
+                if {"time", "stations"} <= set(variable.dims)
+            ]
+            unselected = [
+                name
+                for name in series
+                if name not in self.variables
+                and netcdf_parameter_id(dataset, name) not in self.variables
+            ]
+            if len(unselected) == len(series):
+                return None
+            dataset = dataset.drop_vars(unselected)
+        indexers: dict[str, Any] = {}
+        if self.time_slice is not None and "time" in dataset.dims:
+            times = _decoded_values(dataset, "time")
+            start, stop = (
+                _naive_utc_datetime64(self.time_slice.start),
+                _naive_utc_datetime64(self.time_slice.stop),
+            )
+            selected = np.ones(times.shape, dtype=bool)
+            if start is not None:
+                selected &= times >= start
+            if stop is not None:
+                selected &= times <= stop
+            indexers["time"] = _selected_positions(selected)
+        if self.station_ids is not None and "stations" in dataset.dims:
+            if "station_id" not in dataset.variables:
+                raise ValueError("Selecting stations requires a station_id variable.")
+            labels = [
+                decode_label(item) for item in _decoded_values(dataset, "station_id")
+            ]
+            indexers["stations"] = _selected_positions(
+                np.isin(labels, list(self.station_ids))
+            )
+        return dataset.isel(indexers) if indexers else dataset
+
+    def compact(self, dataset: xr.Dataset) -> xr.Dataset:
+        """Cast the values and pack or drop the flags and comments of a member."""
+        if (self.value_dtype, self.flags, self.skip_comments) == (None, "keep", False):
+            return dataset
+        dropped: list[Hashable] = []
+        updated: dict[Hashable, xr.DataArray] = {}
+        for name, variable in dataset.data_vars.items():
+            role = _netcdf_variable_role(str(name), variable)
+            if (role == "flag" and self.flags == "drop") or (
+                role == "comment" and self.skip_comments
+            ):
+                dropped.append(name)
+            elif role == "flag" and self.flags == "pack":
+                updated[name] = _pack_netcdf_flags(variable)
+            elif (
+                role == "value"
+                and self.value_dtype is not None
+                and variable.dtype != self.value_dtype
+            ):
+                updated[name] = variable.astype(self.value_dtype)
+        return dataset.drop_vars(dropped).assign(updated)
+
+
+def _netcdf_decode_options(
+    *,
+    value_dtype: str | None,
+    flags: str,
+    skip_comments: bool,
+    variables: Iterable[str] | None,
+    time_slice: slice | None,
+    station_ids: Iterable[str] | None,
+) -> _NetcdfDecodeOptions:
+    """Validate the subset and compact options of a NetCDF decode."""
+    validate_compact_options(value_dtype, flags)
+    validate_time_slice(time_slice)
+    return _NetcdfDecodeOptions(
+        value_dtype=value_dtype,
+        flags=flags,
+        skip_comments=skip_comments,
+        variables=_label_set(variables),
+        time_slice=time_slice,
+        station_ids=_label_set(station_ids),
+    )
+
+
+def validate_time_slice(time_slice: slice | None) -> None:
+    """Raise a ``ValueError`` unless ``time_slice`` is a slice without a step."""
+    if time_slice is not None and (
+        not isinstance(time_slice, slice) or time_slice.step is not None
+    ):
+        raise ValueError("time_slice must be a slice of times without a step.")
+
+
+def _label_set(labels: Iterable[str] | None) -> frozenset[str] | None:
+    """Return the labels as a set, treating a single string as one label."""
+    if labels is None:
+        return None
+    return frozenset([labels] if isinstance(labels, str) else labels)
+
+
+def _decoded_values(dataset: xr.Dataset, name: str) -> np.ndarray:
+    """Read and CF-decode a single (coordinate) variable of a member."""
+    return xr.decode_cf(dataset[[name]])[name].values
+
+
+def _naive_utc_datetime64(value: Any) -> np.datetime64 | None:
+    """Convert a time bound to the naive UTC ``datetime64`` of NetCDF times."""
+    if value is None:
+        return None
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return np.datetime64(value, "ns")
+
+
+def _selected_positions(selected: np.ndarray) -> slice | np.ndarray:
+    """Return selected positions, as a slice when they are consecutive."""
+    positions = np.flatnonzero(selected)
+    if positions.size and positions[-1] - positions[0] + 1 == positions.size:
+        return slice(int(positions[0]), int(positions[-1]) + 1)
+    return positions
+
+
+def _netcdf_variable_role(name: str, variable: xr.DataArray) -> str | None:
+    """Classify a variable on the ``time`` dimension as value, flag or comment."""
+    if "time" not in variable.dims:
+        return None
+    lowered = name.lower()
+    if variable.dtype.kind in "OSU" or lowered.endswith(
+        ("comment", "comments", "flagsource", "flag_source")
+    ):
+        return "comment"
+    if (
+        any(attr in variable.attrs for attr in _NETCDF_FLAG_ATTRIBUTES)
+        or str(variable.attrs.get("standard_name", "")).endswith("status_flag")
+        or lowered.endswith(("flag", "flags"))
+    ):
+        return "flag"
+    if variable.dtype.kind == "f":
+        return "value"
+    return None
+
+
+def _pack_netcdf_flags(variable: xr.DataArray) -> xr.DataArray:
+    """Store FEWS quality flags (0-9) as ``uint8`` instead of floats."""
+    packed = variable.fillna(PACKED_FLAG_FILL_VALUE).astype(np.uint8)
+    packed.encoding["_FillValue"] = PACKED_FLAG_FILL_VALUE
+    return packed
 
 
 def _write_zip_member_to_temp_path(
@@ -73,10 +1016,409 @@ def _write_zip_member_to_temp_path(
     """Write a ZIP member to a controlled path under the temp directory."""
     extracted_path = temp_dir / f"member_{index}.nc"
     with zip_file.open(member) as src, extracted_path.open("wb") as dst:
-        dst.write(src.read())
+        shutil.copyfileobj(src, dst)
     return extracted_path
 
 
+def split_time_window(
+    start_time: datetime, end_time: datetime, chunk: timedelta
+) -> list[tuple[datetime, datetime]]:
+    """Split an inclusive time window into consecutive windows of at most ``chunk``.
+
+    Adjacent windows share their boundary timestamp, because FEWS treats both
+    ``start_time`` and ``end_time`` as inclusive. Merge helpers drop the
+    duplicated boundary values again.
+    """
+    if chunk <= timedelta(0):
+        raise ValueError("chunk must be a positive timedelta.")
+    if end_time < start_time:
+        raise ValueError("end_time must not be before start_time.")
+
+    windows: list[tuple[datetime, datetime]] = []
+    window_start = start_time
+    while True:
+        window_end = min(window_start + chunk, end_time)
+        windows.append((window_start, window_end))
+        if window_end >= end_time:
+            return windows
+        window_start = window_end
+
+
+def concat_netcdf_time_chunks(chunks: list[list[xr.Dataset]]) -> list[xr.Dataset]:
+    """Concatenate NetCDF member datasets fetched for consecutive time windows.
+
+    Members are matched across windows by their ZIP member file name (the
+    ``source`` encoding set when decoding) and concatenated along ``time``;
+    datasets without one are matched by data variable layout and position.
+    Stations are aligned on ``station_id`` first, and windows that return
+    different stations are merged with :func:`merge_netcdf_datasets`.
+    Timestamps returned by more than one window are kept once. Members are
+    returned in the order they were first seen.
+    """
+    return [
+        _concat_datasets_along_time(datasets)
+        for datasets in _group_netcdf_members(chunks)
+    ]
+
+
+def concat_netcdf_station_batches(
+    batches: list[list[xr.Dataset]],
+) -> list[xr.Dataset]:
+    """Concatenate NetCDF member datasets fetched for batches of locations.
+
+    Members are matched across batches like :func:`concat_netcdf_time_chunks`
+    does and concatenated along ``stations`` in batch order, aligning
+    differing time axes with an outer join. Members are returned in the order
+    they were first seen.
+    """
+    return [
+        _concat_datasets_along_stations(datasets)
+        for datasets in _group_netcdf_members(batches)
+    ]
+
+
+def _group_netcdf_members(
+    chunks: list[list[xr.Dataset]],
+) -> list[list[xr.Dataset]]:
+    """Group member datasets of several ZIP responses by member file name."""
+    grouped: dict[tuple[str | tuple[str, ...], int], list[xr.Dataset]] = {}
+    for datasets in chunks:
+        occurrences: dict[str | tuple[str, ...], int] = {}
+        for dataset in datasets:
+            source = dataset.encoding.get("source")
+            key: str | tuple[str, ...] = (
+                Path(source).name
+                if source
+                else tuple(str(name) for name in dataset.data_vars)
+            )
+            occurrence = occurrences.get(key, 0)
+            occurrences[key] = occurrence + 1
+            grouped.setdefault((key, occurrence), []).append(dataset)
+    return list(grouped.values())
+
+
+def _netcdf_station_ids(dataset: xr.Dataset) -> list[Any] | None:
+    """Return the ``station_id`` values of a dataset, if it has stations."""
+    if "stations" not in dataset.dims or "station_id" not in dataset.variables:
+        return None
+    return cast(list[Any], dataset["station_id"].values.tolist())
+
+
+def _align_netcdf_stations(datasets: list[xr.Dataset]) -> list[xr.Dataset] | None:
+    """Reorder the stations of each dataset to those of the first.
+
+    Returns ``None`` when the datasets do not all hold the same stations.
+    """
+    first = _netcdf_station_ids(datasets[0])
+    if first is None:
+        return datasets
+    if len(set(first)) != len(first):
+        return None
+    aligned = [datasets[0]]
+    for dataset in datasets[1:]:
+        station_ids = _netcdf_station_ids(dataset)
+        if station_ids == first:
+            aligned.append(dataset)
+            continue
+        if station_ids is None or sorted(station_ids) != sorted(first):
+            return None
+        positions = {station_id: i for i, station_id in enumerate(station_ids)}
+        aligned.append(
+            dataset.isel(stations=[positions[station_id] for station_id in first])
+        )
+    return aligned
+
+
+def _concat_datasets_along_time(datasets: list[xr.Dataset]) -> xr.Dataset:
+    """Concatenate datasets along time and drop duplicated timestamps."""
+    if len(datasets) == 1 or "time" not in datasets[0].dims:
+        return datasets[0]
+    aligned = _align_netcdf_stations(datasets)
+    if aligned is None:
+        return merge_netcdf_datasets(datasets)
+    combined = xr.concat(
+        aligned,
+        dim="time",
+        data_vars="minimal",
+        coords="minimal",
+        compat="override",
+        join="outer",
+        combine_attrs="drop_conflicts",
+    )
+    duplicated = combined.get_index("time").duplicated(keep="first")
+    if duplicated.any():
+        combined = combined.isel(time=~duplicated)
+    return combined
+
+
+def _concat_datasets_along_stations(datasets: list[xr.Dataset]) -> xr.Dataset:
+    """Concatenate datasets along the stations dimension."""
+    if len(datasets) == 1 or "stations" not in datasets[0].dims:
+        return datasets[0]
+    return xr.concat(
+        datasets,
+        dim="stations",
+        data_vars="minimal",
+        coords="minimal",
+        compat="override",
+        join="outer",
+        combine_attrs="drop_conflicts",
+    )
+
+
+def merge_netcdf_datasets(datasets: list[xr.Dataset]) -> xr.Dataset:
+    """Merge FEWS NetCDF member datasets into a single dataset.
+
+    The union of all stations (matched by ``station_id``, in order of first
+    appearance) and all ``time`` values (sorted) is computed once, and every
+    variable is preallocated on that index and filled from each member in
+    turn. Where members overlap, the first non-missing value wins. Variables
+    without a
+    ``stations`` or ``time`` dimension, and the dataset attributes, are taken
+    from the first member that has them.
+    """
+    if not datasets:
+        raise ValueError("At least one dataset is required to merge.")
+
+    station_index: dict[Any, int] = {}
+    member_positions: list[dict[str, np.ndarray]] = []
+    for dataset in datasets:
+        positions: dict[str, np.ndarray] = {}
+        if "stations" in dataset.dims:
+            if "station_id" not in dataset.variables:
+                raise ValueError(
+                    "Merging NetCDF datasets requires a station_id variable."
+                )
+            positions["stations"] = np.array(
+                [
+                    station_index.setdefault(station_id, len(station_index))
+                    for station_id in dataset["station_id"].values.tolist()
+                ],
+                dtype=np.intp,
+            )
+        member_positions.append(positions)
+
+    member_times = [
+        dataset["time"].values for dataset in datasets if "time" in dataset.dims
+    ]
+    merged_sizes = {"stations": len(station_index)}
+    variables: dict[Any, xr.Variable | _MergedVariable] = {}
+    if member_times:
+        times = np.unique(np.concatenate(member_times))
+        merged_sizes["time"] = len(times)
+        variables["time"] = xr.Variable(
+            "time", times, attrs=dict(datasets[0]["time"].attrs)
+        )
+        for dataset, positions in zip(datasets, member_positions, strict=True):
+            if "time" in dataset.dims:
+                positions["time"] = np.searchsorted(times, dataset["time"].values)
+
+    coord_names: set[Any] = set()
+    for dataset, positions in zip(datasets, member_positions, strict=True):
+        coord_names.update(dataset.coords)
+        for name, variable in dataset.variables.items():
+            if name == "time" and member_times:
+                continue
+            if not positions.keys() & set(variable.dims):
+                variables.setdefault(name, variable.copy(deep=False))
+                continue
+            merged = variables.get(name)
+            if merged is None:
+                merged = variables[name] = _MergedVariable.allocate(
+                    variable, merged_sizes
+                )
+            if not isinstance(merged, _MergedVariable):
+                raise ValueError(
+                    f"Cannot merge variable {name!r}: its dimensions differ "
+                    "between members."
+                )
+            merged.fill(variable, positions, name)
+
+    merged_dataset = xr.Dataset(
+        {
+            name: merged.to_variable()
+            if isinstance(merged, _MergedVariable)
+            else merged
+            for name, merged in variables.items()
+        },
+        attrs=dict(datasets[0].attrs),
+    )
+    return merged_dataset.set_coords(
+        [name for name in coord_names if name in merged_dataset.variables]
+    )
+
+
+@dataclass
+class _MergedVariable:
+    """A variable preallocated on the merged station/time index."""
+
+    dims: tuple[Hashable, ...]
+    values: np.ndarray
+    filled: np.ndarray
+    attrs: dict[Any, Any]
+    original_dtype: np.dtype | None = None
+
+    @classmethod
+    def allocate(
+        cls, variable: xr.Variable, merged_sizes: dict[str, int]
+    ) -> "_MergedVariable":
+        shape = tuple(
+            merged_sizes.get(str(dim), size) for dim, size in variable.sizes.items()
+        )
+        dtype = variable.dtype
+        original_dtype = None
+        if dtype.kind in "fc":
+            values = np.full(shape, np.nan, dtype=dtype)
+        elif dtype.kind in "mM":
+            values = np.full(shape, np.datetime64("NaT"), dtype=dtype)
+        elif dtype.kind in "biu":
+            # Integers have no missing value; fall back to float unless every
+            # position ends up filled.
+            values = np.full(shape, np.nan)
+            original_dtype = dtype
+        else:
+            values = np.zeros(shape, dtype=dtype)
+        return cls(
+            dims=variable.dims,
+            values=values,
+            filled=np.zeros(shape, dtype=bool),
+            attrs=dict(variable.attrs),
+            original_dtype=original_dtype,
+        )
+
+    def fill(
+        self, variable: xr.Variable, positions: dict[str, np.ndarray], name: Any
+    ) -> None:
+        """Copy the not yet filled values of one member."""
+        if variable.dims != self.dims:
+            variable = variable.transpose(*self.dims)
+        indexer = []
+        for dim, size, merged_size in zip(
+            self.dims, variable.shape, self.values.shape, strict=True
+        ):
+            if dim in positions:
+                indexer.append(positions[str(dim)])
+            elif size == merged_size:
+                indexer.append(np.arange(size))
+            else:
+                raise ValueError(
+                    f"Cannot merge variable {name!r}: dimension {dim!r} has "
+                    f"conflicting sizes {merged_size} and {size}."
+                )
+        target = np.ix_(*indexer)
+        new_values = ~self.filled[target] & ~variable.isnull().values
+        if not new_values.any():
+            return
+        source = variable.values
+        merged_values = self.values[target]
+        merged_values[new_values] = source[new_values]
+        self.values[target] = merged_values
+        self.filled[target] |= new_values
+
+    def to_variable(self) -> xr.Variable:
+        values = self.values
+        if self.original_dtype is not None and self.filled.all():
+            values = values.astype(self.original_dtype)
+        return xr.Variable(self.dims, values, attrs=self.attrs)
+
+
+# Dimensions a FEWS NetCDF time series variable may have.
+NETCDF_SERIES_DIMENSIONS = frozenset(
+    {"analysis_time", "realization", "time", "stations"}
+)
+
+
+def netcdf_series_variables(dataset: xr.Dataset) -> list[str]:
+    """Return the names of the time series variables of a NetCDF member.
+
+    Flag and comment variables annotate a series and are not series themselves.
+    """
+    return [
+        str(name)
+        for name, variable in dataset.data_vars.items()
+        if {"time", "stations"} <= set(variable.dims)
+        and set(variable.dims) <= NETCDF_SERIES_DIMENSIONS
+        and _netcdf_variable_role(str(name), variable) not in ("flag", "comment")
+    ]
+
+
+def netcdf_parameter_id(dataset: xr.Dataset, name: str) -> str:
+    """Return the FEWS parameter ID of a NetCDF series variable."""
+    original = dataset.attrs.get("originalParameterId")
+    if original and len(netcdf_series_variables(dataset)) == 1:
+        return str(original)
+    return name
+
+
+def decode_label(value: Any) -> str:
+    """Decode a fixed-width NetCDF byte string label."""
+    if isinstance(value, bytes):
+        return value.decode().strip()
+    return str(value)
+
+
+def merge_pi_json_time_chunks(chunks: list[dict[str, Any]]) -> dict[str, Any]:
+    """Merge PI JSON documents fetched for consecutive time windows.
+
+    Series are matched by their header, ignoring the window-specific
+    ``startDate`` and ``endDate``. Event lists are concatenated in window order
+    and events with a date and time already seen for that series are dropped.
+    """
+    if not chunks:
+        raise ValueError("Expected at least one PI_JSON document to merge.")
+
+    merged = {key: value for key, value in chunks[0].items() if key != "timeSeries"}
+    series_by_key: dict[str, dict[str, Any]] = {}
+    for content in chunks:
+        for series in content.get("timeSeries", []):
+            header = series.get("header", {})
+            key = _pi_json_series_key(header)
+            existing = series_by_key.get(key)
+            if existing is None:
+                existing = {**series, "header": dict(header)}
+                if "events" in series:
+                    existing["events"] = list(series["events"])
+                series_by_key[key] = existing
+                continue
+            if "events" in series:
+                existing.setdefault("events", []).extend(series["events"])
+            if "endDate" in header:
+                existing["header"]["endDate"] = header["endDate"]
+
+    for series in series_by_key.values():
+        if "events" in series:
+            series["events"] = _drop_duplicate_pi_json_events(series["events"])
+    merged["timeSeries"] = list(series_by_key.values())
+    return merged
+
+
+def _pi_json_series_key(header: dict[str, Any]) -> str:
+    """Build a stable identity for a PI JSON series header.
+
+    Only the fields in ``PI_JSON_SERIES_IDENTITY_FIELDS`` identify a series;
+    metadata such as ``creationDate`` may differ between time windows.
+    """
+    return json.dumps(
+        [header.get(field) for field in PI_JSON_SERIES_IDENTITY_FIELDS],
+        sort_keys=True,
+    )
+
+
+def _drop_duplicate_pi_json_events(
+    events: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Keep the first event for each date and time."""
+    seen: set[tuple[Any, Any]] = set()
+    unique_events: list[dict[str, Any]] = []
+    for event in events:
+        timestamp = (event.get("date"), event.get("time"))
+        if timestamp in seen:
+            continue
+        seen.add(timestamp)
+        unique_events.append(event)
+    return unique_events
+
+
 def format_time_args(*args: None | datetime) -> list[None | str]:
     """Format a list of datetime arguments to strings suitable for web services."""
     formatted_args: list[str | None] = []
@@ -1,7 +1,9 @@
+import asyncio
+import inspect
 import json
 from enum import Enum
 from typing import Any
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import httpx
 import pytest
@@ -56,8 +58,13 @@ def mock_endpoint_function(
     return mock_response
 
 
+async def mock_async_endpoint_function(**kwargs):
+    return mock_endpoint_function(**kwargs)
+
+
 class MockEndpoint(ApiEndpoint):
     endpoint_function = staticmethod(mock_endpoint_function)
+    async_endpoint_function = staticmethod(mock_async_endpoint_function)
 
 
 @pytest.fixture
@@ -99,6 +106,17 @@ def test_execute_method(mock_api_endpoint):
     assert xml_response == "<TimeSeries />"
 
 
+def test_execute_async_method(mock_api_endpoint):
+    client = Mock()
+    response = asyncio.run(
+        mock_api_endpoint.execute_async(client=client, test_enum=True, status_code=200)
+    )
+    assert response == {"taskruns": []}
+
+    with pytest.raises(requests.HTTPError):
+        asyncio.run(mock_api_endpoint.execute_async(client=client, status_code=500))
+
+
 def test_execute_honors_declared_charset(mock_api_endpoint):
     client = Mock()
 
@@ -125,6 +143,114 @@ def test_execute_replaces_invalid_utf8_sequences(mock_api_endpoint):
     assert response == "\ufffdabc"
 
 
+def test_execute_returns_raw_text_bytes_without_decode_text(mock_api_endpoint):
+    mock_api_endpoint.decode_text = False
+
+    response = mock_api_endpoint.execute(
+        client=Mock(),
+        status_code=200,
+        response_content="<TimeSeries />",
+        content_type="application/xml",
+    )
+
+    assert response == b"<TimeSeries />"
+
+
+class MockStreamEndpoint(MockEndpoint):
+    request_kwargs_function = staticmethod(
+        lambda **kwargs: {"method": "get", "url": "/download", "params": kwargs}
+    )
+
+
+def _streaming_client(status_code: int = 200) -> Client:
+    client = Client(base_url="http://mock-url.com")
+    client.set_httpx_client(
+        httpx.Client(
+            base_url="http://mock-url.com",
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(status_code, content=b"zip-bytes" * 10)
+            ),
+        )
+    )
+    return client
+
+
+def test_download_writes_response_to_path(tmp_path):
+    endpoint = MockStreamEndpoint()
+    download_path = tmp_path / "response.zip"
+
+    result = endpoint.download(client=_streaming_client(), download_path=download_path)
+
+    assert result == download_path
+    assert download_path.read_bytes() == b"zip-bytes" * 10
+    assert endpoint.response_size == 90
+    assert endpoint.status_code == 200
+
+
+@pytest.mark.parametrize("spool_size", [0, 1024])
+def test_download_spools_response(spool_size):
+    endpoint = MockStreamEndpoint()
+
+    with endpoint.download(client=_streaming_client(), spool_size=spool_size) as file:
+        assert file.read() == b"zip-bytes" * 10
+
+
+def test_download_raises_for_error_status(tmp_path):
+    with pytest.raises(requests.HTTPError, match="status code 500: zip-bytes"):
+        MockStreamEndpoint().download(client=_streaming_client(500))
+
+
+def test_download_keeps_existing_file_on_error_status(tmp_path):
+    download_path = tmp_path / "response.zip"
+    download_path.write_bytes(b"previous")
+
+    with pytest.raises(requests.HTTPError):
+        MockStreamEndpoint().download(
+            client=_streaming_client(500), download_path=download_path
+        )
+
+    assert download_path.read_bytes() == b"previous"
+    assert list(tmp_path.iterdir()) == [download_path]
+
+
+def test_download_spools_to_disk_with_zero_spool_size():
+    endpoint = MockStreamEndpoint()
+
+    with endpoint.download(client=_streaming_client(), spool_size=0) as file:
+        assert not hasattr(file, "_rolled")
+
+
+@pytest.mark.parametrize("status_code", [200, 500])
+def test_download_async_writes_response_to_path(tmp_path, status_code):
+    client = Client(base_url="http://mock-url.com")
+    client.set_async_httpx_client(
+        httpx.AsyncClient(
+            base_url="http://mock-url.com",
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(status_code, content=b"zip-bytes" * 10)
+            ),
+        )
+    )
+    download_path = tmp_path / "response.zip"
+    download_path.write_bytes(b"previous")
+    endpoint = MockStreamEndpoint()
+
+    if status_code == 200:
+        result = asyncio.run(
+            endpoint.download_async(client=client, download_path=download_path)
+        )
+        assert result == download_path
+        assert download_path.read_bytes() == b"zip-bytes" * 10
+        assert endpoint.response_size == 90
+    else:
+        with pytest.raises(requests.HTTPError):
+            asyncio.run(
+                endpoint.download_async(client=client, download_path=download_path)
+            )
+        assert download_path.read_bytes() == b"previous"
+    assert list(tmp_path.iterdir()) == [download_path]
+
+
 class MockPartialContentEndpoint(MockEndpoint):
     success_status_codes = frozenset({200, 206})
 
@@ -141,6 +267,7 @@ def test_execute_allows_partial_content_for_configured_endpoints():
     )
 
     assert response == {"timeSeries": []}
+    assert endpoint.status_code == 206
 
 
 def test_input_args(mock_api_endpoint):
@@ -176,3 +303,18 @@ def test_convert_bools(mock_api_endpoint):
     assert mock_api_endpoint._convert_bools(False) == "false"
     with pytest.raises(ValueError, match="Expected boolean value, got 123"):
         mock_api_endpoint._convert_bools(123)
+
+
+def test_call_plan_is_compiled_once_per_endpoint():
+    class PlannedEndpoint(MockEndpoint):
+        pass
+
+    with patch(
+        "fews_py_wrapper._api.base.inspect.signature", wraps=inspect.signature
+    ) as signature_mock:
+        first = PlannedEndpoint().update_input_kwargs({"test_enum": True})
+        second = PlannedEndpoint().update_input_kwargs({"test_enum": False})
+        assert "test_enum" in PlannedEndpoint().input_args()
+
+    assert signature_mock.call_count == 1
+    assert (first["test_enum"], second["test_enum"]) == (TestEnum.TRUE, TestEnum.FALSE)
@@ -33,12 +33,12 @@ def test_format_time_args():
             " got <class 'str'>"
         ),
     ):
-        endpoint._format_time_args(kwargs)
+        endpoint._prepare_kwargs(kwargs)
 
     kwargs = {
         "start_time": datetime(2023, 1, 1, 12, 0, 0, tzinfo=timezone("UTC")),
     }
-    formatted_kwargs = endpoint._format_time_args(kwargs)
+    formatted_kwargs = endpoint._prepare_kwargs(kwargs)
     assert formatted_kwargs["start_time"] == "2023-01-01T12:00:00Z"
 
 
@@ -51,7 +51,7 @@ def test_format_external_forecast_times():
         ]
     }
 
-    formatted_kwargs = endpoint._format_time_args(kwargs)
+    formatted_kwargs = endpoint._prepare_kwargs(kwargs)
 
     assert formatted_kwargs["external_forecast_times"] == [
         "2023-01-01T12:00:00Z",
@@ -154,7 +154,7 @@ def test_taskruns_format_time_args_rejects_non_datetime_values():
             " got <class 'str'>"
         ),
     ):
-        Taskruns()._format_time_args({"start_forecast_time": "2025-03-18T15:00:00Z"})
+        Taskruns()._prepare_kwargs({"start_forecast_time": "2025-03-18T15:00:00Z"})
 
 
 def test_taskruns_execute_returns_json_as_dict_and_formats_times():
@@ -0,0 +1,143 @@
+import numpy as np
+import pytest
+import xarray as xr
+
+from fews_py_wrapper.pi_json import PI_JSON_HEADER_COLUMNS
+from fews_py_wrapper.utils import convert_netcdf_zip_response_to_xarray
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from fews_py_wrapper.arrow import (  # noqa: E402
+    netcdf_datasets_to_arrow,
+    pi_json_to_arrow,
+    write_parquet_dataset,
+)
+
+
+@pytest.fixture
+def pi_json_document() -> dict:
+    return {
+        "timeZone": "0.0",
+        "timeSeries": [
+            {
+                "header": {
+                    "locationId": location_id,
+                    "parameterId": "H.obs",
+                    "missVal": "-999.0",
+                },
+                "events": [
+                    {"date": date, "time": "23:00:00", "value": value, "flag": "0"}
+                    for date, value in zip(
+                        ["2025-03-14", "2025-03-15"], values, strict=True
+                    )
+                ],
+            }
+            for location_id, values in [("A", ["1.5", "-999.0"]), ("B", ["2", "3"])]
+        ],
+    }
+
+
+def test_pi_json_to_arrow(pi_json_document):
+    table = pi_json_to_arrow(pi_json_document)
+
+    assert table.column_names == [*PI_JSON_HEADER_COLUMNS, "time", "value", "flag"]
+    assert pa.types.is_dictionary(table.schema.field("locationId").type)
+    assert table.schema.field("time").type == pa.timestamp("ns", tz="UTC")
+    assert table["locationId"].to_pylist() == ["A", "A", "B", "B"]
+    assert table["qualifierId"].null_count == 4
+    assert table["value"].to_pylist() == [1.5, None, 2.0, 3.0]
+    assert table["flag"].type == pa.int8()
+
+
+def test_netcdf_datasets_to_arrow(netcdf_zip_response):
+    datasets = convert_netcdf_zip_response_to_xarray(netcdf_zip_response)
+
+    table = netcdf_datasets_to_arrow(datasets)
+
+    variable = datasets[0]["H_simulated"]
+    assert table.num_rows == variable.size
+    assert table["locationId"].unique().to_pylist() == ["Amanzimtoti_River_level"]
+    assert table["parameterId"].unique().to_pylist() == ["H_simulated"]
+    assert table["value"].type == pa.float32()
+    np.testing.assert_array_equal(table["value"].to_numpy(), variable.values.ravel())
+    assert table["time"].to_pylist()[0].isoformat() == "2025-03-14T10:00:00+00:00"
+
+
+def test_netcdf_datasets_to_arrow_ensemble_forecast():
+    dataset = xr.Dataset(
+        {
+            "Q_fs": (
+                ("analysis_time", "realization", "time", "stations"),
+                np.arange(8, dtype=np.float64).reshape(1, 2, 2, 2),
+            )
+        },
+        coords={
+            "analysis_time": np.array(["2025-03-14T00:00"], dtype="datetime64[ns]"),
+            "realization": [0, 1],
+            "time": np.array(
+                ["2025-03-14T01:00", "2025-03-14T02:00"], dtype="datetime64[ns]"
+            ),
+            "station_id": ("stations", [b"A", b"B"]),
+        },
+    )
+
+    table = netcdf_datasets_to_arrow([dataset])
+
+    assert table.num_rows == 8
+    assert table["ensembleMemberIndex"].to_pylist()[::2] == ["0", "0", "1", "1"]
+    assert table["locationId"].to_pylist()[:2] == ["A", "B"]
+    assert table["forecastDate"].null_count == 0
+    assert table["value"].to_pylist() == list(range(8))
+
+
+def test_netcdf_datasets_to_arrow_skips_flag_and_comment_variables():
+    dataset = xr.Dataset(
+        {
+            "H_obs": (("time", "stations"), np.array([[1.5]], dtype=np.float32)),
+            "H_obs_flag": (("time", "stations"), np.array([[0]], dtype=np.uint8)),
+            "H_obs_comment": (("time", "stations"), np.array([["checked"]])),
+        },
+        coords={
+            "time": np.array(["2025-03-14T10:00"], dtype="datetime64[ns]"),
+            "station_id": ("stations", [b"A"]),
+        },
+    )
+
+    table = netcdf_datasets_to_arrow([dataset])
+
+    assert table["parameterId"].to_pylist() == ["H_obs"]
+    assert table["value"].to_pylist() == [1.5]
+
+
+def test_netcdf_datasets_to_arrow_without_series():
+    table = netcdf_datasets_to_arrow([])
+
+    assert table.num_rows == 0
+    assert table.column_names == [*PI_JSON_HEADER_COLUMNS, "time", "value"]
+
+
+def test_write_parquet_dataset(pi_json_document, tmp_path):
+    table = pi_json_to_arrow(pi_json_document)
+
+    root = write_parquet_dataset(table, tmp_path / "timeseries")
+
+    files = sorted(
+        path.relative_to(root).parent.as_posix() for path in root.rglob("*.parquet")
+    )
+    assert files == [
+        "parameterId=H.obs/locationId=A/date=2025-03-14",
+        "parameterId=H.obs/locationId=A/date=2025-03-15",
+        "parameterId=H.obs/locationId=B/date=2025-03-14",
+        "parameterId=H.obs/locationId=B/date=2025-03-15",
+    ]
+    written = pq.read_table(root)
+    assert sorted(written["value"].drop_null().to_pylist()) == [1.5, 2.0, 3.0]
+    assert written["value"].null_count == 1
+
+
+def test_write_parquet_dataset_rejects_missing_columns(pi_json_document, tmp_path):
+    table = pi_json_to_arrow(pi_json_document)
+
+    with pytest.raises(ValueError, match="missing column\\(s\\): stationName"):
+        write_parquet_dataset(table, tmp_path, partition_by=["stationName"])
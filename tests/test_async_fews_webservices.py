@@ -0,0 +1,414 @@
+import asyncio
+import inspect
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+import xarray as xr
+
+from fews_py_wrapper.async_fews_webservices import AsyncFewsWebServiceClient
+from fews_py_wrapper.fews_webservices import (
+    FewsWebServiceClient,
+    ResponseCache,
+    TimeSeriesFetchStats,
+    TransportConfig,
+)
+from fews_py_wrapper.models import PiLocation, PiTaskRunStatusResponse
+
+
+@pytest.fixture
+def async_client() -> AsyncFewsWebServiceClient:
+    client = AsyncFewsWebServiceClient(base_url="http://mock-url.com")
+    client.client = Mock()
+    return client
+
+
+def test_async_client_mirrors_sync_public_methods():
+    sync_methods = {
+        name
+        for name in dir(FewsWebServiceClient)
+        if not name.startswith("_") and callable(getattr(FewsWebServiceClient, name))
+    }
+    for name in sync_methods - {"authenticate", "endpoint_arguments"}:
+        method = getattr(AsyncFewsWebServiceClient, name)
+        assert asyncio.iscoroutinefunction(method) or inspect.isasyncgenfunction(method)
+
+
+def test_async_get_timeseries_decodes_netcdf_zip(
+    async_client: AsyncFewsWebServiceClient,
+    multi_member_netcdf_zip_response: bytes,
+):
+    with patch(
+        "fews_py_wrapper._api.endpoints.TimeSeries.execute_async",
+        new=AsyncMock(return_value=multi_member_netcdf_zip_response),
+    ) as execute_mock:
+        result = asyncio.run(
+            async_client.get_timeseries(
+                location_ids=["Amanzimtoti_River_level"],
+                parameter_ids=["H.obs"],
+                start_time=datetime(2025, 3, 14, 10, 0, tzinfo=timezone.utc),
+            )
+        )
+
+    assert isinstance(result, list)
+    assert len(result) == 21
+    assert all(isinstance(dataset, xr.Dataset) for dataset in result)
+    called_kwargs = execute_mock.call_args.kwargs
+    assert called_kwargs["document_format"] == "PI_NETCDF"
+    assert called_kwargs["location_ids"] == ["Amanzimtoti_River_level"]
+    assert "end_time" not in called_kwargs
+
+
+def test_async_get_timeseries_chunks_time_windows(
+    async_client: AsyncFewsWebServiceClient,
+    netcdf_zip_response: bytes,
+):
+    with patch(
+        "fews_py_wrapper._api.endpoints.TimeSeries.execute_async",
+        new=AsyncMock(return_value=netcdf_zip_response),
+    ) as execute_mock:
+        result = asyncio.run(
+            async_client.get_timeseries(
+                start_time=datetime(2025, 3, 14, tzinfo=timezone.utc),
+                end_time=datetime(2025, 3, 17, tzinfo=timezone.utc),
+                chunk=timedelta(days=1),
+                max_workers=2,
+            )
+        )
+
+    assert execute_mock.call_count == 3
+    assert len(result) == 1
+    assert result[0].sizes["time"] == 7
+
+
+def test_async_get_timeseries_continues_partial_content(
+    async_client: AsyncFewsWebServiceClient,
+):
+    async def endpoint_function(*, client, **kwargs):
+        window = datetime.fromisoformat(kwargs["end_time"]) - datetime.fromisoformat(
+            kwargs["start_time"]
+        )
+        return httpx.Response(
+            status_code=206 if window > timedelta(days=1) else 200,
+            json={"timeSeries": []},
+            headers={"content-type": "application/json"},
+        )
+
+    stats = TimeSeriesFetchStats()
+    with patch(
+        "fews_py_wrapper._api.endpoints.TimeSeries.async_endpoint_function",
+        side_effect=endpoint_function,
+    ):
+        result = asyncio.run(
+            async_client.get_timeseries(
+                start_time=datetime(2025, 3, 14, tzinfo=timezone.utc),
+                end_time=datetime(2025, 3, 18, tzinfo=timezone.utc),
+                document_format="PI_JSON",
+                stats=stats,
+            )
+        )
+
+    assert result == {"timeSeries": []}
+    assert stats.requests == 7
+    assert stats.continuation_requests == 6
+
+
+def test_async_get_timeseries_batches_limit_concurrent_requests(
+    async_client: AsyncFewsWebServiceClient,
+):
+    in_flight = 0
+    max_in_flight = 0
+
+    async def slow_timeseries(endpoint, *, client, **kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"timeSeries": []}
+
+    with patch(
+        "fews_py_wrapper._api.endpoints.TimeSeries.execute_async",
+        new=slow_timeseries,
+    ):
+        result = asyncio.run(
+            async_client.get_timeseries(
+                location_ids=["A", "B"],
+                parameter_ids=[f"{i}" * 1500 for i in range(4)],
+                start_time=datetime(2025, 3, 14, tzinfo=timezone.utc),
+                end_time=datetime(2025, 3, 16, tzinfo=timezone.utc),
+                document_format="PI_JSON",
+                chunk=timedelta(days=1),
+                batch_size=1,
+                max_workers=3,
+            )
+        )
+
+    assert result == {"timeSeries": []}
+    assert max_in_flight == 3
+
+
+def test_async_get_timeseries_rejects_non_pi_formats(
+    async_client: AsyncFewsWebServiceClient,
+):
+    with pytest.raises(ValueError, match="Unsupported timeseries document_format"):
+        asyncio.run(async_client.get_timeseries(document_format="NOT_PI"))
+
+
+def test_async_calls_run_concurrently(async_client: AsyncFewsWebServiceClient):
+    in_flight = 0
+    max_in_flight = 0
+
+    async def slow_status(endpoint, *, client, **kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"code": "C", "description": "done", "taskRunId": kwargs["task_id"]}
+
+    async def run_all() -> list[PiTaskRunStatusResponse]:
+        return await asyncio.gather(
+            *(async_client.get_taskrunstatus(task_id=f"task{i}") for i in range(5))
+        )
+
+    with patch(
+        "fews_py_wrapper._api.endpoints.Taskrunstatus.execute_async",
+        new=slow_status,
+    ):
+        statuses = asyncio.run(run_all())
+
+    assert [status.task_run_id for status in statuses] == [f"task{i}" for i in range(5)]
+    assert max_in_flight == 5
+
+
+def test_async_get_locations_returns_typed_models(
+    async_client: AsyncFewsWebServiceClient,
+):
+    with patch(
+        "fews_py_wrapper._api.endpoints.Locations.execute_async",
+        new=AsyncMock(
+            return_value={"locations": [{"locationId": "A", "lat": "1", "lon": "2"}]}
+        ),
+    ):
+        result = asyncio.run(async_client.get_locations())
+
+    assert isinstance(result[0], PiLocation)
+    assert result[0].location_id == "A"
+
+
+def test_async_metadata_validation_runs_off_the_event_loop(
+    async_client: AsyncFewsWebServiceClient,
+):
+    validation_threads = []
+    locations_from_content = async_client._locations_from_content
+    model_validate = PiTaskRunStatusResponse.model_validate
+
+    def record_thread(validate, *args):
+        validation_threads.append(threading.get_ident())
+        return validate(*args)
+
+    async def run():
+        loop_thread = threading.get_ident()
+        await async_client.get_locations()
+        await async_client.get_taskrunstatus(task_id="SA107_00000001")
+        return loop_thread
+
+    with (
+        patch(
+            "fews_py_wrapper._api.endpoints.Locations.execute_async",
+            new=AsyncMock(return_value={"locations": []}),
+        ),
+        patch(
+            "fews_py_wrapper._api.endpoints.Taskrunstatus.execute_async",
+            new=AsyncMock(return_value={"code": "C", "description": "Completed"}),
+        ),
+        patch.object(
+            async_client,
+            "_locations_from_content",
+            new=partial(record_thread, locations_from_content),
+        ),
+        patch.object(
+            PiTaskRunStatusResponse,
+            "model_validate",
+            new=partial(record_thread, model_validate),
+        ),
+    ):
+        loop_thread = asyncio.run(run())
+
+    assert len(validation_threads) == 2
+    assert loop_thread not in validation_threads
+
+
+def test_async_get_locations_output_polars(async_client: AsyncFewsWebServiceClient):
+    pl = pytest.importorskip("polars")
+    with patch(
+        "fews_py_wrapper._api.endpoints.Locations.execute_async",
+        new=AsyncMock(
+            return_value={"locations": [{"locationId": "A", "lat": "1", "lon": "2"}]}
+        ),
+    ):
+        result = asyncio.run(async_client.get_locations(output="polars"))
+
+    assert isinstance(result, pl.DataFrame)
+    assert result.select("locationId", "lat", "lon").row(0) == ("A", 1.0, 2.0)
+
+
+def test_async_post_runtask_returns_task_id(async_client: AsyncFewsWebServiceClient):
+    with patch(
+        "fews_py_wrapper._api.endpoints.PostRunTask.execute_async",
+        new=AsyncMock(return_value="SA107_00000001"),
+    ) as execute_mock:
+        task_id = asyncio.run(
+            async_client.post_runtask(
+                workflow_id="ImportObscape",
+                pi_parameters_xml_content="<modelParameters />",
+            )
+        )
+
+    assert task_id == "SA107_00000001"
+    assert execute_mock.call_args.kwargs["body"] == {
+        "piParametersXmlContent": "<modelParameters />"
+    }
+
+
+def test_async_iter_timeseries_streams_series(timeseries_response):
+    client = AsyncFewsWebServiceClient(base_url="http://mock-url.com")
+    client.client.set_async_httpx_client(
+        httpx.AsyncClient(
+            base_url="http://mock-url.com",
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(
+                    200, content=json.dumps(timeseries_response).encode()
+                )
+            ),
+        )
+    )
+
+    async def collect() -> list:
+        return [series async for series in client.iter_timeseries()]
+
+    assert asyncio.run(collect()) == timeseries_response["timeSeries"]
+
+
+def test_async_client_prewarms_connections_on_enter():
+    methods: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        methods.append(request.method)
+        return httpx.Response(200)
+
+    async def enter() -> None:
+        client = AsyncFewsWebServiceClient(
+            base_url="http://mock-url.com", transport=TransportConfig(prewarm=4)
+        )
+        client.client.set_async_httpx_client(
+            httpx.AsyncClient(
+                base_url="http://mock-url.com", transport=httpx.MockTransport(handler)
+            )
+        )
+        async with client:
+            pass
+
+    asyncio.run(enter())
+
+    assert methods == ["HEAD"] * 4
+
+
+def test_async_batch_limits_concurrency_and_keeps_order(
+    async_client: AsyncFewsWebServiceClient,
+):
+    in_flight = 0
+    max_in_flight = 0
+
+    async def slow_status(endpoint, *, client, **kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.02 if kwargs["task_id"] == "task0" else 0.01)
+        in_flight -= 1
+        if kwargs["task_id"] == "bad":
+            raise ValueError("boom")
+        return {"code": "C", "description": "done", "taskRunId": kwargs["task_id"]}
+
+    async def run_all() -> tuple[list, list]:
+        statuses = await async_client.map(
+            async_client.get_taskrunstatus,
+            [{"task_id": f"task{i}"} for i in range(6)],
+            max_workers=2,
+        )
+        completed = [
+            item
+            async for item in async_client.as_completed(
+                [partial(async_client.get_taskrunstatus, task_id="bad")],
+                return_exceptions=True,
+            )
+        ]
+        return statuses, completed
+
+    with patch(
+        "fews_py_wrapper._api.endpoints.Taskrunstatus.execute_async",
+        new=slow_status,
+    ):
+        statuses, completed = asyncio.run(run_all())
+        with pytest.raises(ValueError, match="boom"):
+            asyncio.run(
+                async_client.batch(
+                    [partial(async_client.get_taskrunstatus, task_id="bad")]
+                )
+            )
+
+    assert [status.task_run_id for status in statuses] == [f"task{i}" for i in range(6)]
+    assert max_in_flight == 2
+    assert completed[0][0] == 0
+    assert isinstance(completed[0][1], ValueError)
+
+
+def test_async_coalesce_shares_concurrent_identical_calls():
+    client = AsyncFewsWebServiceClient(base_url="http://mock-url.com", coalesce=True)
+    client.client = Mock()
+    calls = 0
+
+    async def slow_locations(endpoint, *, client, **kwargs):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"locations": [{"locationId": "A", "lat": "1", "lon": "2"}]}
+
+    async def run_all() -> list:
+        return await asyncio.gather(
+            *(client.get_locations() for _ in range(4)),
+            client.get_locations(output=None),
+        )
+
+    with patch(
+        "fews_py_wrapper._api.endpoints.Locations.execute_async",
+        new=slow_locations,
+    ):
+        results = asyncio.run(run_all())
+        asyncio.run(run_all())
+
+    assert calls == 2
+    assert all(result is results[0] for result in results)
+    assert client._in_flight == {}
+
+
+def test_async_response_cache_reuses_metadata_results():
+    client = AsyncFewsWebServiceClient(
+        base_url="http://mock-url.com", cache=ResponseCache()
+    )
+    client.client = Mock()
+
+    with patch(
+        "fews_py_wrapper._api.endpoints.Parameters.execute_async",
+        new=AsyncMock(return_value={"timeSeriesParameters": []}),
+    ) as execute_mock:
+        first = asyncio.run(client.get_parameters())
+        second = asyncio.run(client.get_parameters())
+
+    assert first is second
+    assert execute_mock.call_count == 1
@@ -1,19 +1,34 @@
+import copy
 import json
 import os
+import threading
 import time
 import xml.etree.ElementTree as ET
+from collections.abc import Callable
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
+from functools import partial
 from pathlib import Path
+from typing import Any
 from unittest.mock import Mock, patch
 from uuid import uuid4
 
 import dotenv
+import httpx
+import pandas as pd
 import pytest
 import xarray as xr
 from pydantic import ValidationError
 
-from fews_py_wrapper.fews_webservices import FewsWebServiceClient
+from fews_py_wrapper.fews_webservices import (
+    MAX_TIMESERIES_QUERY_LENGTH,
+    TIMESERIES_BATCH_TARGET_SECONDS,
+    FewsWebServiceClient,
+    ResponseCache,
+    TimeSeriesFetchStats,
+    TransportConfig,
+    _TimeSeriesBatchPlanner,
+)
 from fews_py_wrapper.models import (
     PiFilter,
     PiLocation,
@@ -25,6 +40,7 @@ from fews_py_wrapper.models import (
     PiWhatIfTemplate,
     PiWorkflow,
 )
+from fews_py_wrapper.utils import NetcdfMemberCache, NetcdfZipResponse
 
 dotenv.load_dotenv()
 
@@ -284,6 +300,27 @@ def _wait_for_task_run_description(
     )
 
 
+@pytest.fixture
+def mock_url_client() -> Callable[..., FewsWebServiceClient]:
+    """Create clients whose requests are answered by an httpx mock handler."""
+
+    def create(
+        handler: Callable[[httpx.Request], httpx.Response] | None = None,
+        **kwargs: Any,
+    ) -> FewsWebServiceClient:
+        client = FewsWebServiceClient(base_url="http://mock-url.com", **kwargs)
+        if handler is not None:
+            client.client.set_httpx_client(
+                httpx.Client(
+                    base_url="http://mock-url.com",
+                    transport=httpx.MockTransport(handler),
+                )
+            )
+        return client
+
+    return create
+
+
 @pytest.mark.integration
 class TestFewsWebServiceClient:
     @pytest.fixture
@@ -767,6 +804,689 @@ class TestFewsWebServiceClientWithMocking:
 
         assert result == csv_response
 
+    def test_get_timeseries_chunks_pi_json_time_windows(
+        self,
+        fews_webservice_client_with_mock: FewsWebServiceClient,
+        sample_timeseries_response,
+    ):
+        events = sample_timeseries_response["timeSeries"][0]["events"]
+
+        def execute_window(*, client, **kwargs):
+            window_start = kwargs["start_time"].strftime("%Y-%m-%d %H:%M:%S")
+            window_end = kwargs["end_time"].strftime("%Y-%m-%d %H:%M:%S")
+            content = json.loads(json.dumps(sample_timeseries_response))
+            content["timeSeries"][0]["events"] = [
+                event
+                for event in events
+                if window_start <= f"{event['date']} {event['time']}" <= window_end
+            ]
+            return content
+
+        with patch(
+            "fews_py_wrapper._api.endpoints.TimeSeries.execute",
+            side_effect=execute_window,
+        ) as execute_mock:
+            result = fews_webservice_client_with_mock.get_timeseries(
+                location_ids=["Pinetwon_Club_Lane_rain"],
+                parameter_ids=["P.obs.rate"],
+                start_time=datetime(2025, 3, 14, 10, 0, 0, tzinfo=timezone.utc),
+                end_time=datetime(2025, 3, 15, 0, 0, 0, tzinfo=timezone.utc),
+                document_format="PI_JSON",
+                chunk=timedelta(hours=4),
+                max_workers=2,
+            )
+
+        assert execute_mock.call_count == 4
+        assert all(
+            "chunk" not in call.kwargs and "max_workers" not in call.kwargs
+            for call in execute_mock.call_args_list
+        )
+        assert isinstance(result, dict)
+        assert result["timeSeries"][0]["events"] == events
+
+    def test_get_timeseries_chunks_pi_netcdf_time_windows(
+        self,
+        fews_webservice_client_with_mock: FewsWebServiceClient,
+        netcdf_zip_response: bytes,
+    ):
+        with patch(
+            "fews_py_wrapper._api.endpoints.TimeSeries.execute",
+            return_value=netcdf_zip_response,
+        ) as execute_mock:
+            result = fews_webservice_client_with_mock.get_timeseries(
+                location_ids=["Amanzimtoti_River_level"],
+                parameter_ids=["H.obs"],
+                start_time=datetime(2025, 3, 14, 0, 0, 0, tzinfo=timezone.utc),
+                end_time=datetime(2025, 3, 16, 0, 0, 0, tzinfo=timezone.utc),
+                chunk=timedelta(days=1),
+            )
+
+        assert execute_mock.call_count == 2
+        assert isinstance(result, list)
+        assert len(result) == 1
+        assert result[0].sizes["time"] == 7
+
+    def test_get_timeseries_output_members(
+        self,
+        fews_webservice_client_with_mock: FewsWebServiceClient,
+        netcdf_zip_response: bytes,
+    ):
+        with (
+            patch(
+                "fews_py_wrapper._api.endpoints.TimeSeries.execute",
+                return_value=netcdf_zip_response,
+            ),
+            patch(
+                "fews_py_wrapper.fews_webservices.convert_netcdf_zip_response_to_xarray"
+            ) as convert_mock,
+        ):
+            result = fews_webservice_client_with_mock.get_timeseries(
+                start_time=datetime(2025, 3, 14, 0, 0, 0, tzinfo=timezone.utc),
+                end_time=datetime(2025, 3, 16, 0, 0, 0, tzinfo=timezone.utc),
+                chunk=timedelta(days=1),
+                output="members",
+            )
+
+        convert_mock.assert_not_called()
+        assert isinstance(result, NetcdfZipResponse)
+        assert result.parameter_ids == ["H_simulated"]
+        (member,) = result.for_parameter("H_simulated")
+        assert member.sizes["time"] == 7
+        result.close()
+
+        with pytest.raises(ValueError, match="variables cannot be combined"):
+            fews_webservice_client_with_mock.get_timeseries(
+                output="members", variables=["H_simulated"]
+            )
+        with pytest.raises(ValueError, match="not supported for PI_JSON"):
+            fews_webservice_client_with_mock.get_timeseries(
+                document_format="PI_JSON", output="members"
+            )
+
+    def test_get_timeseries_member_cache(
+        self,
+        fews_webservice_client_with_mock: FewsWebServiceClient,
+        multi_member_netcdf_zip_response: bytes,
+    ):
+        cache = NetcdfMemberCache()
+        with patch(
+            "fews_py_wrapper._api.endpoints.TimeSeries.execute",
+            return_value=multi_member_netcdf_zip_response,
+        ):
+            first = fews_webservice_client_with_mock.get_timeseries(member_cache=cache)
+            with patch("fews_py_wrapper.utils._open_netcdf_bytes") as open_mock:
+                second = fews_webservice_client_with_mock.get_timeseries(
+                    member_cache=cache
+                )
+
+        open_mock.assert_not_called()
+        assert (cache.hits, cache.misses) == (21, 21)
+        for dataset, expected in zip(second, first, strict=True):
+            xr.testing.assert_identical(dataset, expected)
+        with pytest.raises(ValueError, match="member_cache is only supported"):
+            fews_webservice_client_with_mock.get_timeseries(
+                lazy=True, member_cache=cache
+            )
+
+    def test_get_timeseries_passes_decode_workers(
+        self,
+        fews_webservice_client_with_mock: FewsWebServiceClient,
+        multi_member_netcdf_zip_response: bytes,
+    ):
+        with (
+            patch(
+                "fews_py_wrapper._api.endpoints.TimeSeries.execute",
+                return_value=multi_member_netcdf_zip_response,
+            ) as execute_mock,
+            patch(
+                "fews_py_wrapper.fews_webservices.convert_netcdf_zip_response_to_xarray",
+                return_value=[],
+            ) as convert_mock,
+        ):
+            fews_webservice_client_with_mock.get_timeseries(decode_workers=8)
+
+        assert "decode_workers" not in execute_mock.call_args.kwargs
+        assert convert_mock.call_args.kwargs == {
+            "max_workers": 8,
+            "value_dtype": None,
+            "flags": "keep",
+            "skip_comments": False,
+            "variables": None,
+            "time_slice": None,
+            "station_ids": None,
+            "cache": None,
+        }
+
+    def test_get_timeseries_lazy_returns_dask_backed_datasets(
+        self,
+        fews_webservice_client_with_mock: FewsWebServiceClient,
+        netcdf_zip_response: bytes,
+        tmp_path: Path,
+    ):
+        pytest.importorskip("dask")
+        with patch(
+            "fews_py_wrapper._api.endpoints.TimeSeries.execute",
+            return_value=netcdf_zip_response,
+        ) as execute_mock:
+            result = fews_webservice_client_with_mock.get_timeseries(
+                start_time=datetime(2025, 3, 14, 0, 0, 0, tzinfo=timezone.utc),
+                end_time=datetime(2025, 3, 16, 0, 0, 0, tzinfo=timezone.utc),
+                chunk=timedelta(days=1),
+                lazy=True,
+                spill_dir=tmp_path,
+            )
+
+        assert "lazy" not in execute_mock.call_args.kwargs
+        assert "spill_dir" not in execute_mock.call_args.kwargs
+        assert result[0]["H_simulated"].chunks is not None
+        assert result[0].sizes["time"] == 7
+
+    def test_get_timeseries_lazy_requires_pi_netcdf(
+        self,
+        fews_webservice_client_with_mock: FewsWebServiceClient,
+    ):
+        with pytest.raises(ValueError, match="lazy is only supported for PI_NETCDF"):
+            fews_webservice_client_with_mock.get_timeseries(
+                document_format="PI_JSON", lazy=True
+            )
+
+    def test_get_timeseries_merge_returns_single_dataset(
+        self,
+        fews_webservice_client_with_mock: FewsWebServiceClient,
+        multi_member_netcdf_zip_response: bytes,
+    ):
+        with patch(
+            "fews_py_wrapper._api.endpoints.TimeSeries.execute",
+            return_value=multi_member_netcdf_zip_response,
+        ) as execute_mock:
+            result = fews_webservice_client_with_mock.get_timeseries(merge=True)
+
+        assert "merge" not in execute_mock.call_args.kwargs
+        assert isinstance(result, xr.Dataset)
+        assert result.sizes["stations"] == 361
+
+    def test_get_timeseries_merge_validation(
+        self,
+        fews_webservice_client_with_mock: FewsWebServiceClient,
+    ):
+        with pytest.raises(ValueError, match="merge is only supported for PI_NETCDF"):
+            fews_webservice_client_with_mock.get_timeseries(
+                document_format="PI_JSON", merge=True
+            )
+        with pytest.raises(ValueError, match="merge cannot be combined with lazy"):
+            fews_webservice_client_with_mock.get_timeseries(merge=True, lazy=True)
+
+    def test_get_timeseries_output_pandas(
+        self,
+        fews_webservice_client_with_mock: FewsWebServiceClient,
+        sample_timeseries_response,
+    ):
+        with patch(
+            "fews_py_wrapper._api.endpoints.TimeSeries.execute",
+            return_value=sample_timeseries_response,
+        ) as execute_mock:
+            result = fews_webservice_client_with_mock.get_timeseries(
+                document_format="PI_JSON", output="pandas", layout="wide"
+            )
+
+        assert "output" not in execute_mock.call_args.kwargs
+        assert "layout" not in execute_mock.call_args.kwargs
+        assert isinstance(result, pd.DataFrame)
+        assert result.columns.tolist() == [("Pinetwon_Club_Lane_rain", "P.obs.rate")]
+
+    def test_get_timeseries_output_xarray(
+        self,
+        fews_webservice_client_with_mock: FewsWebServiceClient,
+        sample_timeseries_response,
+    ):
+        with patch(
+            "fews_py_wrapper._api.endpoints.TimeSeries.execute",
+            return_value=sample_timeseries_response,
+        ):
+            result = fews_webservice_client_with_mock.get_timeseries(
+                document_format="PI_JSON", output="xarray"
+            )
+
+        assert isinstance(result, xr.Dataset)
+        assert result["P_obs_rate"].dims == ("time", "stations")
+        assert result["station_id"].values.tolist() == ["Pinetwon_Club_Lane_rain"]
+
+    @pytest.mark.parametrize("to_path", [False, True])
+    def test_get_timeseries_output_numpy(
+        self, mock_url_client, post_timeseries_xml_content, tmp_path, to_path
+    ):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(
+                200,
+                content=post_timeseries_xml_content.encode(),
+                headers={"content-type": "application/xml"},
+            )
+
+        client = mock_url_client(handler)
+        download_path = tmp_path / "response.xml" if to_path else None
+
+        result = client.get_timeseries(
+            document_format="PI_XML", output="numpy", download_path=download_path
+        )
+        series = list(result)
+
+        assert requests[0].url.params["documentFormat"] == "PI_XML"
+        assert "output" not in requests[0].url.params
+        assert [item.header["locationId"] for item in series] == [
+            "Amanzimtoti_River_level"
+        ]
+        assert series[0].values.tolist() == [0.214, 0.211, 0.209]
+        if download_path is not None:
+            assert download_path.read_text() == post_timeseries_xml_content
+
+    def test_get_timeseries_output_arrow(
+        self,
+        fews_webservice_client_with_mock: FewsWebServiceClient,
+        sample_timeseries_response,
+        netcdf_zip_response: bytes,
+    ):
+        pa = pytest.importorskip("pyarrow")
+        with patch(
+            "fews_py_wrapper._api.endpoints.TimeSeries.execute",
+            side_effect=[sample_timeseries_response, netcdf_zip_response],
+        ) as execute_mock:
+            from_json = fews_webservice_client_with_mock.get_timeseries(
+                document_format="PI_JSON", output="arrow"
+            )
+            from_netcdf = fews_webservice_client_with_mock.get_timeseries(
+                output="arrow"
+            )
+
+        assert "output" not in execute_mock.call_args.kwargs
+        assert isinstance(from_json, pa.Table)
+        assert from_json["locationId"].unique().to_pylist() == [
+            "Pinetwon_Club_Lane_rain"
+        ]
+        assert isinstance(from_netcdf, pa.Table)
+        assert from_netcdf["parameterId"].unique().to_pylist() == ["H_simulated"]
+
+    def test_get_timeseries_output_polars(
+        self,
+        fews_webservice_client_with_mock: FewsWebServiceClient,
+        sample_timeseries_response,
+        netcdf_zip_response: bytes,
+    ):
+        pl = pytest.importorskip("polars")
+        with patch(
+            "fews_py_wrapper._api.endpoints.TimeSeries.execute",
+            side_effect=[sample_timeseries_response, netcdf_zip_response],
+        ) as execute_mock:
+            from_json = fews_webservice_client_with_mock.get_timeseries(
+                document_format="PI_JSON", output="polars"
+            )
+            from_netcdf = fews_webservice_client_with_mock.get_timeseries(
+                output="polars"
+            )
+
+        assert "output" not in execute_mock.call_args.kwargs
+        assert isinstance(from_json, pl.DataFrame)
+        assert from_json["locationId"].unique().to_list() == ["Pinetwon_Club_Lane_rain"]
+        assert isinstance(from_netcdf, pl.DataFrame)
+        assert from_netcdf["parameterId"].unique().to_list() == ["H_simulated"]
+
+    def test_get_timeseries_compact_options(
+        self,
+        fews_webservice_client_with_mock: FewsWebServiceClient,
+        sample_timeseries_response,
+    ):
+        events = sample_timeseries_response["timeSeries"][0]["events"]
+        events[0].update(comment="checked", flagSource="RR")
+        with patch(
+            "fews_py_wrapper._api.endpoints.TimeSeries.execute",
+            side_effect=lambda **_: copy.deepcopy(sample_timeseries_response),
+        ):
+            frame = fews_webservice_client_with_mock.get_timeseries(
+                document_format="PI_JSON",
+                output="pandas",
+                value_dtype="float32",
+                flags="drop",
+            )
+            raw = fews_webservice_client_with_mock.get_timeseries(
+                document_format="PI_JSON", flags="drop", skip_comments=True
+            )
+
+        assert frame["value"].dtype == "float32"
+        assert "flag" not in frame.columns
+        assert raw["timeSeries"][0]["events"][0].keys() == {"date", "time", "value"}
+
+        with pytest.raises(ValueError, match="require an output for PI_JSON"):
+            fews_webservice_client_with_mock.get_timeseries(
+                document_format="PI_JSON", value_dtype="float32"
+            )
+        with pytest.raises(ValueError, match="not PI_XML"):
+            fews_webservice_client_with_mock.get_timeseries(
+                document_format="PI_XML", skip_comments=True
+            )
+        with pytest.raises(ValueError, match="Unsupported flags 'bits'"):
+            fews_webservice_client_with_mock.get_timeseries(flags="bits")
+        with pytest.raises(ValueError, match="station_ids are only supported"):
+            fews_webservice_client_with_mock.get_timeseries(
+                document_format="PI_JSON", output="pandas", variables=["H_obs"]
+            )
+
+    def test_get_timeseries_output_pandas_from_csv(
+        self,
+        fews_webservice_client_with_mock: FewsWebServiceClient,
+    ):
+        content = (
+            "Location Names,Rivière Amanzimtoti\n"
+            "Location Ids,Amanzimtoti_River_level\n"
+            "Time,H.obs\n"
+            "2099-03-14 10:00:00,0.214\n"
+        ).encode("latin-1")
+        with patch(
+            "fews_py_wrapper._api.endpoints.TimeSeries.endpoint_function",
+            return_value=httpx.Response(
+                200,
+                content=content,
+                headers={"content-type": "text/csv; charset=ISO-8859-1"},
+            ),
+        ) as endpoint_mock:
+            result = fews_webservice_client_with_mock.get_timeseries(
+                document_format="PI_CSV", output="pandas", csv_engine="c"
+            )
+
+        assert "csv_engine" not in endpoint_mock.call_args.kwargs
+        assert isinstance(result, pd.DataFrame)
+        assert result["stationName"].tolist() == ["Rivière Amanzimtoti"]
+        assert result["value"].tolist() == [0.214]
+
+    def test_iter_timeseries_streams_series(
+        self, mock_url_client, sample_timeseries_response
+    ):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(
+                206, content=json.dumps(sample_timeseries_response).encode()
+            )
+
+        client = mock_url_client(handler)
+
+        with pytest.warns(UserWarning, match="partial"):
+            series = list(client.iter_timeseries(location_ids=["loc"]))
+
+        assert series == sample_timeseries_response["timeSeries"]
+        assert requests[0].url.params["documentFormat"] == "PI_JSON"
+        assert requests[0].url.params["locationIds"] == "loc"
+        with pytest.raises(ValueError, match="only supports PI_JSON"):
+            next(client.iter_timeseries(document_format="PI_XML"))
+
+    def test_iter_timeseries_decodes_response_charset(
+        self, mock_url_client, sample_timeseries_response
+    ):
+        sample_timeseries_response["timeSeries"][0]["header"]["stationName"] = "Zürich"
+        content = json.dumps(sample_timeseries_response, ensure_ascii=False)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                content=content.encode("latin-1"),
+                headers={"content-type": "application/json; charset=ISO-8859-1"},
+            )
+
+        client = mock_url_client(handler)
+
+        series = list(client.iter_timeseries(location_ids=["loc"]))
+
+        assert series == sample_timeseries_response["timeSeries"]
+
+    @pytest.mark.parametrize("to_path", [False, True])
+    def test_get_timeseries_streams_netcdf_to_file(
+        self, mock_url_client, multi_member_netcdf_zip_response, tmp_path, to_path
+    ):
+        client = mock_url_client(
+            lambda request: httpx.Response(
+                200,
+                content=multi_member_netcdf_zip_response,
+                headers={"content-type": "application/zip"},
+            )
+        )
+        download_path = tmp_path / "response.zip"
+        stats = TimeSeriesFetchStats()
+
+        if to_path:
+            result = client.get_timeseries(download_path=download_path, stats=stats)
+            assert download_path.read_bytes() == multi_member_netcdf_zip_response
+        else:
+            result = client.get_timeseries(spool_size=0, stats=stats)
+
+        assert len(result) == 21
+        assert stats.response_bytes == len(multi_member_netcdf_zip_response)
+
+    def test_get_timeseries_download_validation(
+        self,
+        fews_webservice_client_with_mock: FewsWebServiceClient,
+        tmp_path,
+    ):
+        with pytest.raises(ValueError, match="only supported for PI_NETCDF"):
+            fews_webservice_client_with_mock.get_timeseries(
+                document_format="PI_JSON", spool_size=1024
+            )
+        with pytest.raises(ValueError, match="spool_size must not be negative"):
+            fews_webservice_client_with_mock.get_timeseries(spool_size=-1)
+        with pytest.raises(ValueError, match="cannot be combined with chunk"):
+            fews_webservice_client_with_mock.get_timeseries(
+                download_path=tmp_path / "response.zip", chunk=timedelta(days=1)
+            )
+
+    def test_get_timeseries_output_validation(
+        self,
+        fews_webservice_client_with_mock: FewsWebServiceClient,
+    ):
+        with pytest.raises(ValueError, match="Unsupported output 'excel'"):
+            fews_webservice_client_with_mock.get_timeseries(output="excel")
+        with pytest.raises(
+            ValueError, match="output='pandas' is not supported for PI_NETCDF"
+        ):
+            fews_webservice_client_with_mock.get_timeseries(output="pandas")
+        with pytest.raises(ValueError, match="output cannot be combined with merge"):
+            fews_webservice_client_with_mock.get_timeseries(output="arrow", merge=True)
+        with pytest.raises(ValueError, match="Unsupported layout 'tall'"):
+            fews_webservice_client_with_mock.get_timeseries(
+                document_format="PI_JSON", output="pandas", layout="tall"
+            )
+        with pytest.raises(ValueError, match="Unsupported CSV engine 'python'"):
+            fews_webservice_client_with_mock.get_timeseries(
+                document_format="PI_CSV", output="pandas", csv_engine="python"
+            )
+
+    def test_get_timeseries_continues_partial_content(
+        self,
+        fews_webservice_client_with_mock: FewsWebServiceClient,
+        sample_timeseries_response,
+    ):
+        events = sample_timeseries_response["timeSeries"][0]["events"]
+
+        def endpoint_function(*, client, **kwargs):
+            window_start = datetime.fromisoformat(kwargs["start_time"])
+            window_end = datetime.fromisoformat(kwargs["end_time"])
+            window_events = [
+                event
+                for event in events
+                if window_start
+                <= datetime.fromisoformat(f"{event['date']}T{event['time']}Z")
+                <= window_end
+            ]
+            partial = window_end - window_start > timedelta(hours=4)
+            content = json.loads(json.dumps(sample_timeseries_response))
+            content["timeSeries"][0]["events"] = (
+                window_events[: len(window_events) // 2] if partial else window_events
+            )
+            return httpx.Response(
+                status_code=206 if partial else 200,
+                json=content,
+                headers={"content-type": "application/json"},
+            )
+
+        stats = TimeSeriesFetchStats()
+        with patch(
+            "fews_py_wrapper._api.endpoints.TimeSeries.endpoint_function",
+            side_effect=endpoint_function,
+        ):
+            result = fews_webservice_client_with_mock.get_timeseries(
+                location_ids=["Pinetwon_Club_Lane_rain"],
+                parameter_ids=["P.obs.rate"],
+                start_time=datetime(2025, 3, 14, 10, 0, 0, tzinfo=timezone.utc),
+                end_time=datetime(2025, 3, 15, 0, 0, 0, tzinfo=timezone.utc),
+                document_format="PI_JSON",
+                stats=stats,
+            )
+
+        assert result["timeSeries"][0]["events"] == events
+        assert stats.requests == 7
+        assert stats.partial_responses == 3
+        assert stats.continuation_requests == 6
+
+    def test_get_timeseries_warns_when_partial_content_cannot_continue(
+        self,
+        fews_webservice_client_with_mock: FewsWebServiceClient,
+    ):
+        partial_response = httpx.Response(
+            status_code=206,
+            json={"timeSeries": []},
+            headers={"content-type": "application/json"},
+        )
+        stats = TimeSeriesFetchStats()
+        with (
+            patch(
+                "fews_py_wrapper._api.endpoints.TimeSeries.endpoint_function",
+                return_value=partial_response,
+            ),
+            pytest.warns(UserWarning, match="start_time and end_time were not"),
+        ):
+            result = fews_webservice_client_with_mock.get_timeseries(
+                document_format="PI_JSON", stats=stats
+            )
+
+        assert result == {"timeSeries": []}
+        assert stats.partial_responses == 1
+        assert stats.continuation_requests == 0
+
+    def test_get_timeseries_chunk_requires_time_window(
+        self,
+        fews_webservice_client_with_mock: FewsWebServiceClient,
+    ):
+        with pytest.raises(ValueError, match="start_time and end_time are required"):
+            fews_webservice_client_with_mock.get_timeseries(
+                start_time=datetime(2025, 3, 14, 0, 0, 0, tzinfo=timezone.utc),
+                chunk=timedelta(days=1),
+            )
+        with pytest.raises(ValueError, match="chunk is not supported for PI_XML"):
+            fews_webservice_client_with_mock.get_timeseries(
+                start_time=datetime(2025, 3, 14, 0, 0, 0, tzinfo=timezone.utc),
+                end_time=datetime(2025, 3, 16, 0, 0, 0, tzinfo=timezone.utc),
+                document_format="PI_XML",
+                chunk=timedelta(days=1),
+            )
+
+    def test_get_timeseries_batches_location_ids_in_input_order(
+        self,
+        fews_webservice_client_with_mock: FewsWebServiceClient,
+        sample_timeseries_response,
+    ):
+        location_ids = [f"location_{index}" for index in range(5)]
+
+        def execute_batch(*, client, **kwargs):
+            content = json.loads(json.dumps(sample_timeseries_response))
+            template = content.pop("timeSeries")[0]
+            content["timeSeries"] = [
+                {**template, "header": {**template["header"], "locationId": location}}
+                for location in reversed(kwargs["location_ids"])
+            ]
+            return content
+
+        with patch(
+            "fews_py_wrapper._api.endpoints.TimeSeries.execute",
+            side_effect=execute_batch,
+        ) as execute_mock:
+            result = fews_webservice_client_with_mock.get_timeseries(
+                location_ids=location_ids,
+                parameter_ids=["P.obs.rate"],
+                document_format="PI_JSON",
+                batch_size=2,
+            )
+
+        assert [
+            call.kwargs["location_ids"] for call in execute_mock.call_args_list
+        ] == [
+            ["location_0", "location_1"],
+            ["location_2", "location_3"],
+            ["location_4"],
+        ]
+        assert [series["header"]["locationId"] for series in result["timeSeries"]] == [
+            "location_1",
+            "location_0",
+            "location_3",
+            "location_2",
+            "location_4",
+        ]
+
+    def test_get_timeseries_batches_concatenate_netcdf_stations(
+        self,
+        fews_webservice_client_with_mock: FewsWebServiceClient,
+        netcdf_zip_response: bytes,
+    ):
+        with patch(
+            "fews_py_wrapper._api.endpoints.TimeSeries.execute",
+            return_value=netcdf_zip_response,
+        ) as execute_mock:
+            result = fews_webservice_client_with_mock.get_timeseries(
+                location_ids=["A", "B", "C"],
+                batch_size=1,
+                max_workers=3,
+            )
+
+        assert execute_mock.call_count == 3
+        assert len(result) == 1
+        assert result[0].sizes["stations"] == 3
+        assert result[0].sizes["time"] == 7
+
+    def test_timeseries_batch_planner_respects_query_length(self):
+        location_ids = [f"{index:04d}" + "x" * 500 for index in range(40)]
+        planner = _TimeSeriesBatchPlanner(
+            {"location_ids": location_ids, "parameter_ids": ["H.obs", "Q.obs"]},
+            batch_size=100,
+        )
+
+        batches = []
+        while not planner.done:
+            batches.extend(planner.next_wave(4))
+
+        assert [
+            location for batch in batches for location in batch["location_ids"]
+        ] == location_ids
+        assert all(batch["parameter_ids"] == ["H.obs", "Q.obs"] for batch in batches)
+        assert all(
+            planner._query_length("locationIds", batch["location_ids"])
+            <= MAX_TIMESERIES_QUERY_LENGTH
+            for batch in batches
+        )
+        assert len(batches) > 1
+
+    def test_timeseries_batch_planner_adapts_to_measurements(self):
+        planner = _TimeSeriesBatchPlanner(
+            {"location_ids": [str(index) for index in range(1000)]}, batch_size=64
+        )
+
+        planner.record_wave([(TIMESERIES_BATCH_TARGET_SECONDS * 4, 0)])
+        assert planner.batch_size == 16
+        assert len(planner.next_wave(1)[0]["location_ids"]) == 16
+
+        planner.record_wave([(0.0, 0)])
+        planner.record_wave([(0.0, 0)])
+        planner.record_wave([(0.0, 0)])
+        assert planner.batch_size == 64
+
     def test_post_timeseries_with_xml_content(
         self,
         fews_webservice_client_with_mock: FewsWebServiceClient,
@@ -1335,6 +2055,61 @@ class TestFewsWebServiceClientWithMocking:
             with pytest.raises(ValidationError, match="parameterType"):
                 fews_webservice_client_with_mock.get_parameters()
 
+    def test_get_metadata_output_polars(
+        self, fews_webservice_client_with_mock: FewsWebServiceClient
+    ):
+        """Test metadata calls return polars frames keyed by PI JSON names."""
+        pl = pytest.importorskip("polars")
+        locations = {
+            "locations": [
+                {"locationId": "Adams_K1_rain", "lat": "-30.036255", "attributes": []}
+            ]
+        }
+        parameters = {"timeSeriesParameters": [{"id": "P_obs", "usesDatum": "false"}]}
+        taskruns = {"taskRuns": [{"id": "SA107_14", "status": "pending"}]}
+
+        with (
+            patch(
+                "fews_py_wrapper._api.endpoints.Locations.execute",
+                return_value=locations,
+            ),
+            patch(
+                "fews_py_wrapper._api.endpoints.Parameters.execute",
+                return_value=parameters,
+            ),
+            patch(
+                "fews_py_wrapper.fews_webservices.Taskruns.execute",
+                return_value=taskruns,
+            ),
+        ):
+            location_frame = fews_webservice_client_with_mock.get_locations(
+                output="polars"
+            )
+            parameter_frame = fews_webservice_client_with_mock.get_parameters(
+                output="polars"
+            )
+            taskrun_frame = fews_webservice_client_with_mock.get_taskruns(
+                workflow_id="ImportObscape", output="polars"
+            )
+
+        assert isinstance(location_frame, pl.DataFrame)
+        assert location_frame["lat"].to_list() == [pytest.approx(-30.036255)]
+        assert "attributes" not in location_frame.columns
+        assert parameter_frame["usesDatum"].to_list() == [False]
+        assert taskrun_frame["id"].to_list() == ["SA107_14"]
+
+    def test_get_metadata_output_validation(
+        self, fews_webservice_client_with_mock: FewsWebServiceClient
+    ):
+        with pytest.raises(ValueError, match="Unsupported output 'pandas'"):
+            fews_webservice_client_with_mock.get_locations(output="pandas")
+        with pytest.raises(
+            ValueError, match="output='polars' requires document_format='PI_JSON'"
+        ):
+            fews_webservice_client_with_mock.get_taskruns(
+                workflow_id="ImportObscape", document_format="PI_XML", output="polars"
+            )
+
     def test_location_attribute_requires_exactly_one_value_field(self):
         with pytest.raises(ValidationError):
             PiLocationAttribute(name="stationOwner", text="eThekwini", number=1.0)
@@ -1472,3 +2247,290 @@ class TestFewsWebServiceClientWithMocking:
             client=fews_webservice_client_with_mock.client,
             document_format="PI_JSON",
         )
+
+
+class TestFewsWebServiceClientTransport:
+    def test_transport_config_is_shared_by_client_requests(self, mock_url_client):
+        transport = TransportConfig(
+            max_connections=8,
+            max_keepalive_connections=4,
+            keepalive_expiry=30.0,
+            connect_timeout=2.0,
+            read_timeout=60.0,
+        )
+
+        client = mock_url_client(transport=transport)
+        authenticated = mock_url_client(
+            authenticate=True, token="token", transport=transport
+        )
+
+        for fews_client in (client, authenticated):
+            httpx_client = fews_client.client.get_httpx_client()
+            assert httpx_client.timeout == httpx.Timeout(
+                connect=2.0, read=60.0, write=None, pool=None
+            )
+            pool = httpx_client._transport._pool
+            assert (pool._max_connections, pool._max_keepalive_connections) == (8, 4)
+            assert pool._keepalive_expiry == 30.0
+        with pytest.raises(ValueError, match="read_timeout must not be negative"):
+            TransportConfig(read_timeout=-1)
+        with (
+            patch(
+                "fews_py_wrapper.fews_webservices.importlib.util.find_spec"
+            ) as find_spec,
+            pytest.raises(ImportError, match="fews-py-wrapper\\[http2\\]"),
+        ):
+            find_spec.return_value = None
+            mock_url_client(transport=TransportConfig(http2=True))
+
+    def test_prewarm_opens_connections_up_to_keepalive_limit(self, mock_url_client):
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(405)
+
+        client = mock_url_client(
+            handler, transport=TransportConfig(max_keepalive_connections=3)
+        )
+
+        client.prewarm(10)
+
+        assert len(requests) == 3
+        assert {request.method for request in requests} == {"HEAD"}
+        with pytest.raises(ValueError, match="connections must not be negative"):
+            client.prewarm(-1)
+
+    def test_authenticate_swaps_client_with_ready_connection_pool(
+        self, mock_url_client
+    ):
+        client = mock_url_client()
+        previous = client.client
+
+        client.authenticate(token="token", verify_ssl=True)
+
+        assert client.client is not previous
+        assert client.client._client is not None
+        assert not previous.get_httpx_client().is_closed
+
+
+class TestFewsWebServiceClientBatch:
+    def test_batch_runs_mixed_calls_concurrently_in_input_order(self, mock_url_client):
+        client = mock_url_client()
+        lock = threading.Lock()
+        in_flight = 0
+        max_in_flight = 0
+
+        def slow_status(endpoint, *, client, task_id, **kwargs):
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            time.sleep(0.05 if task_id == "task0" else 0.01)
+            with lock:
+                in_flight -= 1
+            return {"code": "C", "description": "done", "taskRunId": task_id}
+
+        with (
+            patch(
+                "fews_py_wrapper.fews_webservices.Taskrunstatus.execute",
+                new=slow_status,
+            ),
+            patch(
+                "fews_py_wrapper.fews_webservices.Locations.execute",
+                return_value={
+                    "locations": [{"locationId": "A", "lat": "1", "lon": "2"}]
+                },
+            ),
+        ):
+            statuses = client.map(
+                client.get_taskrunstatus,
+                [{"task_id": f"task{i}"} for i in range(6)],
+                max_workers=3,
+            )
+            locations, status = client.batch(
+                [client.get_locations, partial(client.get_taskrunstatus, task_id="x")]
+            )
+
+        assert [status.task_run_id for status in statuses] == [
+            f"task{i}" for i in range(6)
+        ]
+        assert max_in_flight == 3
+        assert locations[0].location_id == "A"
+        assert status.task_run_id == "x"
+
+    def test_batch_exceptions_and_as_completed(self, mock_url_client):
+        client = mock_url_client()
+
+        def fail() -> None:
+            raise ValueError("boom")
+
+        calls = [lambda: 1, fail, lambda: 3]
+
+        with pytest.raises(ValueError, match="boom"):
+            client.batch(calls)
+        results = client.batch(calls, return_exceptions=True)
+        assert results[0] == 1 and results[2] == 3
+        assert isinstance(results[1], ValueError)
+        completed = dict(client.as_completed(calls, return_exceptions=True))
+        assert sorted(completed) == [0, 1, 2]
+        assert client.batch([]) == []
+
+
+class TestFewsWebServiceClientCoalescing:
+    def test_coalesce_shares_concurrent_identical_calls(self, mock_url_client):
+        client = mock_url_client(coalesce=True)
+        calls: list[dict] = []
+
+        def slow_execute(endpoint, *, client, **kwargs):
+            calls.append(kwargs)
+            time.sleep(0.05)
+            return {"timeSeries": []}
+
+        start = datetime(2025, 3, 14, tzinfo=timezone.utc)
+        get = partial(client.get_timeseries, document_format="PI_JSON")
+        with patch(
+            "fews_py_wrapper.fews_webservices.TimeSeries.execute", new=slow_execute
+        ):
+            results = client.batch(
+                [
+                    partial(get, location_ids=["A"], start_time=start),
+                    partial(
+                        get,
+                        location_ids=("A",),
+                        start_time=start.astimezone(timezone(timedelta(hours=2))),
+                    ),
+                    partial(get, location_ids=["B"], start_time=start),
+                    partial(
+                        get,
+                        location_ids=["A"],
+                        start_time=start,
+                        stats=TimeSeriesFetchStats(),
+                    ),
+                ],
+                max_workers=4,
+            )
+
+            assert len(calls) == 3
+            assert results[0] is results[1]
+            assert results[2] is not results[0] and results[3] is not results[0]
+            assert client._in_flight == {}
+
+            client.coalesce = False
+            client.batch([get] * 2, max_workers=2)
+            assert len(calls) == 5
+
+    def test_coalesce_shares_exceptions(self, mock_url_client):
+        client = mock_url_client(coalesce=True)
+        calls = 0
+
+        def failing_execute(endpoint, *, client, **kwargs):
+            nonlocal calls
+            calls += 1
+            time.sleep(0.05)
+            raise ValueError("unavailable")
+
+        with patch(
+            "fews_py_wrapper.fews_webservices.Parameters.execute", new=failing_execute
+        ):
+            results = client.batch(
+                [client.get_parameters] * 3, max_workers=3, return_exceptions=True
+            )
+
+        assert calls == 1
+        assert all(isinstance(result, ValueError) for result in results)
+        assert client._in_flight == {}
+
+    def test_coalesce_does_not_share_series_iterators(
+        self, mock_url_client, post_timeseries_xml_content
+    ):
+        requests = []
+
+        def slow_response(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            time.sleep(0.05)
+            return httpx.Response(
+                200,
+                content=post_timeseries_xml_content.encode(),
+                headers={"content-type": "application/xml"},
+            )
+
+        client = mock_url_client(slow_response, coalesce=True)
+
+        def read_series() -> list:
+            return list(client.get_timeseries(document_format="PI_XML", output="numpy"))
+
+        results = client.batch([read_series, read_series], max_workers=2)
+
+        assert len(requests) == 2
+        for series in results:
+            assert [item.header["locationId"] for item in series] == [
+                "Amanzimtoti_River_level"
+            ]
+
+
+class TestFewsWebServiceClientResponseCache:
+    def test_response_cache_reuses_results_per_method_ttl(self, mock_url_client):
+        cache = ResponseCache(ttl={"get_locations": 0.05})
+        client = mock_url_client(cache=cache)
+        requests: list[str] = []
+
+        def execute(endpoint, *, client, **kwargs):
+            requests.append(type(endpoint).__name__)
+            if type(endpoint).__name__ == "Locations":
+                return {"locations": [{"locationId": "A", "lat": "1", "lon": "2"}]}
+            return {"timeSeriesParameters": []}
+
+        with (
+            patch("fews_py_wrapper.fews_webservices.Locations.execute", new=execute),
+            patch("fews_py_wrapper.fews_webservices.Parameters.execute", new=execute),
+        ):
+            parameters = client.get_parameters()
+            assert client.get_parameters() is parameters
+            locations = client.get_locations()
+            assert client.get_locations() is locations
+            time.sleep(0.06)
+            client.get_locations()
+            client.authenticate(token="token", verify_ssl=True)
+            client.get_parameters()
+
+        assert requests == ["Parameters", "Locations", "Locations", "Parameters"]
+        assert (cache.hits, len(cache)) == (2, 3)
+        assert cache.nbytes > 0
+        cache.clear("get_locations")
+        assert len(cache) == 2
+        cache.clear()
+        assert (len(cache), cache.nbytes) == (0, 0)
+
+    def test_response_cache_evicts_least_recently_used_by_size(self, mock_url_client):
+        requests: list[str] = []
+
+        def execute(endpoint, *, client, location_ids, **kwargs):
+            requests.append(location_ids[0])
+            size = 50_000 if location_ids[0] == "big" else 1000
+            return {"timeSeries": [], "padding": location_ids[0] * size}
+
+        # Each small result takes about 1.4 kB, so two of them fit.
+        cache = ResponseCache(
+            max_bytes=3500, ttl={"get_timeseries": 60}, max_entry_bytes=3500
+        )
+        client = mock_url_client(cache=cache)
+        get = partial(client.get_timeseries, document_format="PI_JSON")
+        with patch("fews_py_wrapper.fews_webservices.TimeSeries.execute", new=execute):
+            for location_id in ["A", "B", "A", "C", "A", "B", "big", "big"]:
+                get(location_ids=[location_id])
+            get(location_ids=["A"], stats=TimeSeriesFetchStats())
+
+        assert requests == ["A", "B", "C", "B", "big", "big", "A"]
+        assert len(cache) == 2
+        assert cache.nbytes <= cache.max_bytes
+
+    def test_response_cache_validation(self):
+        with pytest.raises(ValueError, match="Unsupported cached method"):
+            ResponseCache(ttl={"post_runtask": 60})
+        with pytest.raises(ValueError, match="Unsupported cached method"):
+            ResponseCache(ttl={"get_taskrunstatus": 60})
+        with pytest.raises(
+            ValueError, match="ttl of get_locations must not be negative"
+        ):
+            ResponseCache(ttl={"get_locations": -1})
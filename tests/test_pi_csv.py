@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fews_py_wrapper.pi_csv import pi_csv_to_dataframe
+
+PI_CSV_DOCUMENT = b"""Location Names,Amanzimtoti River,Durban Bay
+Location Ids,Amanzimtoti_River_level,Durban_level
+Time,H.obs,H.obs
+2025-03-14 10:00:00,0.214,1.5
+2025-03-14 11:00:00,,1.6
+"""
+
+
+def test_pi_csv_to_dataframe_long():
+    frame = pi_csv_to_dataframe(PI_CSV_DOCUMENT)
+
+    assert list(frame.columns) == [
+        "locationId",
+        "parameterId",
+        "stationName",
+        "time",
+        "value",
+    ]
+    assert frame["locationId"].dtype == "category"
+    assert (
+        frame["locationId"].tolist()
+        == ["Amanzimtoti_River_level"] * 2 + ["Durban_level"] * 2
+    )
+    assert frame["stationName"].tolist()[-1] == "Durban Bay"
+    assert frame["time"].iloc[1] == pd.Timestamp("2025-03-14T11:00:00Z")
+    np.testing.assert_array_equal(frame["value"], [0.214, np.nan, 1.5, 1.6])
+
+
+def test_pi_csv_to_dataframe_wide():
+    frame = pi_csv_to_dataframe(PI_CSV_DOCUMENT, layout="wide")
+
+    assert list(frame.columns.names) == ["locationId", "parameterId", "stationName"]
+    assert frame.index.name == "time"
+    assert str(frame.index.tz) == "UTC"
+    assert frame.dtypes.eq(np.float64).all()
+    assert frame[("Durban_level", "H.obs", "Durban Bay")].tolist() == [1.5, 1.6]
+
+
+def test_pi_csv_to_dataframe_pyarrow_engine():
+    pytest.importorskip("pyarrow")
+
+    frame = pi_csv_to_dataframe(PI_CSV_DOCUMENT, layout="wide", engine="pyarrow")
+
+    pd.testing.assert_frame_equal(
+        frame, pi_csv_to_dataframe(PI_CSV_DOCUMENT, layout="wide")
+    )
+
+
+@pytest.mark.parametrize("engine", ["c", "pyarrow"])
+def test_pi_csv_to_dataframe_encoding(engine):
+    if engine == "pyarrow":
+        pytest.importorskip("pyarrow")
+    content = PI_CSV_DOCUMENT.decode().replace("Durban Bay", "Baie de Durban é")
+
+    frame = pi_csv_to_dataframe(
+        content.encode("latin-1"), layout="wide", engine=engine, encoding="latin-1"
+    )
+
+    assert frame.columns.get_level_values("stationName")[-1] == "Baie de Durban é"
+    assert frame[("Durban_level", "H.obs", "Baie de Durban é")].tolist() == [1.5, 1.6]
+
+
+def test_pi_csv_to_dataframe_validation():
+    with pytest.raises(ValueError, match="Unsupported CSV engine 'python'"):
+        pi_csv_to_dataframe(PI_CSV_DOCUMENT, engine="python")
+    with pytest.raises(ValueError, match="no 'Time' header row"):
+        pi_csv_to_dataframe(b"Location Ids,A\n")
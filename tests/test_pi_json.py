@@ -0,0 +1,239 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fews_py_wrapper.pi_json import (
+    PI_JSON_HEADER_COLUMNS,
+    iter_pi_json_series,
+    pi_json_to_dataframe,
+    pi_json_to_xarray,
+)
+
+
+def _series(location_id: str, qualifiers: list[str], member: str, values: list[str]):
+    return {
+        "header": {
+            "locationId": location_id,
+            "parameterId": "H.obs",
+            "qualifierId": qualifiers,
+            "ensembleMemberIndex": member,
+            "missVal": "-999.0",
+        },
+        "events": [
+            {"date": "2025-03-14", "time": f"1{hour}:00:00", "value": value}
+            for hour, value in enumerate(values)
+        ],
+    }
+
+
+@pytest.fixture
+def ensemble_document() -> dict:
+    return {
+        "timeZone": "2.0",
+        "timeSeries": [
+            _series("A", ["max", "daily"], "0", ["1.5", "-999.0"]),
+            _series("A", ["max", "daily"], "1", ["2.5", "3.5"]),
+            _series("B", [], "0", ["4.0"]),
+        ],
+    }
+
+
+def test_pi_json_to_dataframe_long(timeseries_response):
+    frame = pi_json_to_dataframe(timeseries_response)
+
+    events = timeseries_response["timeSeries"][0]["events"]
+    assert len(frame) == len(events)
+    assert list(frame.columns) == [*PI_JSON_HEADER_COLUMNS, "time", "value", "flag"]
+    assert all(frame[name].dtype == "category" for name in PI_JSON_HEADER_COLUMNS)
+    assert frame["locationId"].iloc[0] == "Pinetwon_Club_Lane_rain"
+    assert frame["time"].iloc[0] == pd.Timestamp("2025-03-14T10:00:00Z")
+    assert frame["value"].isna().all()
+    assert frame["flag"].dtype == np.int8
+
+
+def test_pi_json_to_dataframe_ensemble_members_and_time_zone(ensemble_document):
+    frame = pi_json_to_dataframe(ensemble_document)
+
+    assert frame["qualifierId"].tolist()[:4] == ["max,daily"] * 4
+    assert frame["qualifierId"].isna().tolist()[-1]
+    assert frame["ensembleMemberIndex"].tolist() == ["0", "0", "1", "1", "0"]
+    assert frame["time"].iloc[0] == pd.Timestamp("2025-03-14T08:00:00Z")
+    np.testing.assert_array_equal(frame["value"], [1.5, np.nan, 2.5, 3.5, 4.0])
+
+
+def test_pi_json_to_dataframe_wide(ensemble_document):
+    frame = pi_json_to_dataframe(ensemble_document, layout="wide")
+
+    assert list(frame.columns.names) == list(PI_JSON_HEADER_COLUMNS)
+    assert frame.shape == (2, 3)
+    assert frame[("A", "H.obs", "max,daily", "1")].tolist() == [2.5, 3.5]
+
+
+def test_pi_json_to_dataframe_wide_forecast_archive(ensemble_document):
+    first = _series("A", [], "0", ["1.0", "2.0"])
+    second = _series("A", [], "0", ["3.0", "4.0"])
+    first["header"]["forecastDate"] = {"date": "2025-03-14", "time": "09:00:00"}
+    second["header"]["forecastDate"] = {"date": "2025-03-14", "time": "10:00:00"}
+
+    frame = pi_json_to_dataframe({"timeSeries": [first, second]}, layout="wide")
+
+    assert frame.columns.names[-1] == "forecastDate"
+    assert frame.shape == (2, 2)
+    column = ("A", "H.obs", "0", pd.Timestamp("2025-03-14T10:00:00Z"))
+    assert frame[column].tolist() == [3.0, 4.0]
+    with pytest.raises(ValueError, match="locationId=A, parameterId=H.obs"):
+        pi_json_to_dataframe({"timeSeries": [first, first]}, layout="wide")
+
+
+def test_pi_json_to_dataframe_events_without_time():
+    series = _series("A", [], "0", ["1.0"])
+    series["events"] = [
+        {"date": "2025-03-14T10:00:00Z", "value": "1.0"},
+        {"date": "2025-03-14T11:00:00", "value": "2.0"},
+    ]
+
+    frame = pi_json_to_dataframe({"timeZone": "1.0", "timeSeries": [series]})
+
+    assert frame["time"].tolist() == [
+        pd.Timestamp("2025-03-14T10:00:00Z"),
+        pd.Timestamp("2025-03-14T10:00:00Z"),
+    ]
+
+
+def test_pi_json_to_dataframe_millisecond_times():
+    series = _series("A", [], "0", ["1.0"])
+    series["events"] = [
+        {"date": "2025-03-14", "time": "00:00:00.000", "value": "1.0"},
+        {"date": "2025-03-15", "time": "00:00:00.250", "value": "2.0"},
+    ]
+
+    frame = pi_json_to_dataframe({"timeZone": "1.0", "timeSeries": [series]})
+
+    assert frame["time"].tolist() == [
+        pd.Timestamp("2025-03-13T23:00:00Z"),
+        pd.Timestamp("2025-03-14T23:00:00.250Z"),
+    ]
+
+
+def test_pi_json_to_dataframe_rejects_unknown_layout(timeseries_response):
+    with pytest.raises(ValueError, match="Unsupported layout 'tall'"):
+        pi_json_to_dataframe(timeseries_response, layout="tall")
+
+
+def test_pi_json_to_dataframe_compact_options(ensemble_document):
+    frame = pi_json_to_dataframe(ensemble_document, value_dtype="float32", flags="drop")
+
+    assert "flag" not in frame.columns
+    assert frame["value"].dtype == np.float32
+    np.testing.assert_array_equal(frame["value"], [1.5, np.nan, 2.5, 3.5, 4.0])
+    assert (
+        pi_json_to_xarray(ensemble_document, value_dtype="float32")[
+            "H_obs_max_daily"
+        ].dtype
+        == np.float32
+    )
+    with pytest.raises(ValueError, match="Unsupported value_dtype 'float16'"):
+        pi_json_to_dataframe(ensemble_document, value_dtype="float16")
+    with pytest.raises(ValueError, match="Unsupported flags 'bits'"):
+        pi_json_to_dataframe(ensemble_document, flags="bits")
+
+
+def test_pi_json_to_xarray_matches_netcdf_layout(timeseries_response):
+    dataset = pi_json_to_xarray(timeseries_response)
+
+    events = timeseries_response["timeSeries"][0]["events"]
+    assert dict(dataset.sizes) == {"time": len(events), "stations": 1}
+    assert dataset["P_obs_rate"].attrs == {"long_name": "P.obs.rate", "units": "mm"}
+    assert dataset["station_names"].values.tolist() == ["Pinetown Club Lane"]
+    assert dataset["lat"].values.tolist() == [-29.8169]
+    assert dataset["time"].values[0] == np.datetime64("2025-03-14T10:00:00")
+
+
+def test_pi_json_to_xarray_ensemble_and_forecast_dims(ensemble_document):
+    for series in ensemble_document["timeSeries"]:
+        series["header"]["forecastDate"] = {"date": "2025-03-14", "time": "09:00:00"}
+
+    dataset = pi_json_to_xarray(ensemble_document)
+
+    assert dataset["H_obs_max_daily"].dims == (
+        "analysis_time",
+        "realization",
+        "time",
+        "stations",
+    )
+    assert dataset["analysis_time"].attrs["standard_name"] == "forecast_reference_time"
+    assert dataset["analysis_time"].values[0] == np.datetime64("2025-03-14T07:00:00")
+    assert dataset["realization"].values.tolist() == [0, 1]
+    assert dataset["station_id"].values.tolist() == ["A", "B"]
+    member_a = dataset["H_obs_max_daily"].isel(analysis_time=0, stations=0)
+    np.testing.assert_array_equal(member_a.values, [[1.5, np.nan], [2.5, 3.5]])
+    np.testing.assert_array_equal(
+        dataset["H_obs"].isel(analysis_time=0, realization=0, stations=1).values,
+        [4.0, np.nan],
+    )
+
+
+def test_pi_json_to_xarray_keeps_series_without_forecast_date():
+    undated = _series("A", [], "0", ["1.0"])
+    dated = _series("A", [], "0", ["2.0"])
+    for series in (undated, dated):
+        del series["header"]["ensembleMemberIndex"]
+    dated["header"]["forecastDate"] = {"date": "2025-03-14", "time": "09:00:00"}
+
+    dataset = pi_json_to_xarray({"timeSeries": [undated, dated]})
+
+    assert dataset["analysis_time"].values[0] == np.datetime64("2025-03-14T09:00:00")
+    assert np.isnat(dataset["analysis_time"].values[1])
+    np.testing.assert_array_equal(
+        dataset["H_obs"].isel(time=0, stations=0).values, [2.0, 1.0]
+    )
+
+
+def test_pi_json_to_xarray_missing_member_is_deterministic(ensemble_document):
+    deterministic = _series("C", [], "0", ["5.0"])
+    del deterministic["header"]["ensembleMemberIndex"]
+    ensemble_document["timeSeries"].append(deterministic)
+
+    dataset = pi_json_to_xarray(ensemble_document)
+
+    assert dataset["realization"].values.tolist() == [0, 1]
+    assert dataset["H_obs"].sel(realization=0).isel(stations=2, time=0) == 5.0
+
+    clashing = _series("B", [], "0", ["6.0"])
+    del clashing["header"]["ensembleMemberIndex"]
+    ensemble_document["timeSeries"].append(clashing)
+    with pytest.raises(ValueError, match="would overwrite ensemble member 0"):
+        pi_json_to_xarray(ensemble_document)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 20])
+def test_iter_pi_json_series_yields_series_across_chunks(ensemble_document, chunk_size):
+    ensemble_document["version"] = 1.25
+    content = json.dumps(ensemble_document, indent=2).encode()
+    chunks = [
+        content[start : start + chunk_size]
+        for start in range(0, len(content), chunk_size)
+    ]
+
+    assert list(iter_pi_json_series(chunks)) == ensemble_document["timeSeries"]
+
+
+def test_iter_pi_json_series_decodes_response_charset(ensemble_document):
+    ensemble_document["timeSeries"][0]["header"]["stationName"] = "Zürich"
+    content = json.dumps(ensemble_document, ensure_ascii=False).encode("utf-16")
+    chunks = [content[start : start + 1] for start in range(len(content))]
+
+    series = list(iter_pi_json_series(chunks, encoding="utf-16"))
+
+    assert series == ensemble_document["timeSeries"]
+
+
+def test_iter_pi_json_series_rejects_incomplete_documents(ensemble_document):
+    content = json.dumps(ensemble_document).encode()
+
+    with pytest.raises(ValueError, match="Incomplete PI JSON"):
+        list(iter_pi_json_series([content[:-5]]))
+    with pytest.raises(ValueError, match="expected '{'"):
+        list(iter_pi_json_series([b"[]"]))
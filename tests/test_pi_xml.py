@@ -0,0 +1,91 @@
+import xml.etree.ElementTree as ET
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from fews_py_wrapper.pi_xml import PiXmlSeries, iter_pi_xml_series
+
+ENSEMBLE_DOCUMENT = b"""<?xml version="1.0" encoding="UTF-8"?>
+<TimeSeries xmlns="http://www.wldelft.nl/fews/PI" version="1.34">
+  <timeZone>2.0</timeZone>
+  <series>
+    <header>
+      <locationId>A</locationId>
+      <parameterId>H.obs</parameterId>
+      <qualifierId>max</qualifierId>
+      <qualifierId>daily</qualifierId>
+      <ensembleMemberIndex>1</ensembleMemberIndex>
+      <timeStep unit="second" multiplier="3600" />
+      <missVal>-999.0</missVal>
+    </header>
+    <event date="2025-03-14" time="10:00:00" value="1.5" flag="2" />
+    <event date="2025-03-14" time="11:00:00" value="-999.0" flag="9" />
+  </series>
+  <series>
+    <header>
+      <locationId>B</locationId>
+      <parameterId>H.obs</parameterId>
+      <missVal>NaN</missVal>
+    </header>
+  </series>
+</TimeSeries>
+"""
+
+
+@pytest.fixture
+def post_timeseries_xml_bytes(post_timeseries_xml_content) -> bytes:
+    return post_timeseries_xml_content.encode()
+
+
+def test_iter_pi_xml_series(post_timeseries_xml_bytes):
+    series = list(iter_pi_xml_series(post_timeseries_xml_bytes))
+
+    assert len(series) == 1
+    assert isinstance(series[0], PiXmlSeries)
+    header = series[0].header
+    assert header["locationId"] == "Amanzimtoti_River_level"
+    assert header["timeStep"] == {"unit": "second", "multiplier": "3600"}
+    assert header["startDate"] == {"date": "2099-03-14", "time": "10:00:00"}
+    np.testing.assert_array_equal(
+        series[0].times,
+        np.array(
+            ["2099-03-14T10:00", "2099-03-14T11:00", "2099-03-14T12:00"],
+            dtype="datetime64[ns]",
+        ),
+    )
+    np.testing.assert_array_equal(series[0].values, [0.214, 0.211, 0.209])
+    np.testing.assert_array_equal(series[0].flags, [0, 0, 0])
+
+
+def test_iter_pi_xml_series_qualifiers_missing_values_and_time_zone(tmp_path):
+    path = tmp_path / "timeseries.xml"
+    path.write_bytes(ENSEMBLE_DOCUMENT)
+
+    first, second = iter_pi_xml_series(path)
+
+    assert first.header["qualifierId"] == ["max", "daily"]
+    assert first.header["ensembleMemberIndex"] == "1"
+    assert first.times[0] == np.datetime64("2025-03-14T08:00:00")
+    np.testing.assert_array_equal(first.values, [1.5, np.nan])
+    assert first.flags.dtype == np.int8
+    np.testing.assert_array_equal(first.flags, [2, 9])
+    assert second.header["locationId"] == "B"
+    assert second.values.size == 0
+
+
+def test_iter_pi_xml_series_detaches_parsed_series():
+    roots = []
+    original_iterparse = ET.iterparse
+
+    def iterparse(source, events):
+        for event, element in original_iterparse(source, events):
+            if not roots:
+                roots.append(element)
+            yield event, element
+
+    with patch("fews_py_wrapper.pi_xml.ET.iterparse", side_effect=iterparse):
+        series = list(iter_pi_xml_series(ENSEMBLE_DOCUMENT))
+
+    assert [item.header["locationId"] for item in series] == ["A", "B"]
+    assert [child.tag.rsplit("}", 1)[-1] for child in roots[0]] == ["timeZone"]
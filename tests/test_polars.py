@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from fews_py_wrapper.models import PiLocation, PiParameter
+from fews_py_wrapper.pi_json import PI_JSON_HEADER_COLUMNS
+from fews_py_wrapper.utils import convert_netcdf_zip_response_to_xarray
+
+pl = pytest.importorskip("polars")
+
+from fews_py_wrapper.polars import (  # noqa: E402
+    netcdf_datasets_to_polars,
+    pi_json_to_polars,
+    pi_records_to_polars,
+)
+
+
+def test_pi_json_to_polars(timeseries_response):
+    timeseries_response["timeSeries"][0]["events"][0]["value"] = "1.5"
+
+    frame = pi_json_to_polars(timeseries_response)
+
+    events = timeseries_response["timeSeries"][0]["events"]
+    assert frame.columns == [*PI_JSON_HEADER_COLUMNS, "time", "value", "flag"]
+    assert frame.height == len(events)
+    assert frame.schema["locationId"] == pl.Categorical
+    assert frame.schema["time"] == pl.Datetime("ns", "UTC")
+    assert frame["locationId"][0] == "Pinetwon_Club_Lane_rain"
+    assert frame["qualifierId"].null_count() == len(events)
+    assert frame["value"][0] == 1.5
+    assert frame["value"].null_count() == len(events) - 1
+
+
+def test_netcdf_datasets_to_polars(netcdf_zip_response):
+    datasets = convert_netcdf_zip_response_to_xarray(netcdf_zip_response)
+
+    frame = netcdf_datasets_to_polars(datasets)
+
+    variable = datasets[0]["H_simulated"]
+    assert frame.height == variable.size
+    assert frame["locationId"].unique().to_list() == ["Amanzimtoti_River_level"]
+    assert frame["parameterId"].unique().to_list() == ["H_simulated"]
+    assert frame.schema["time"] == pl.Datetime("ns", "UTC")
+    np.testing.assert_array_equal(frame["value"].to_numpy(), variable.values.ravel())
+
+
+def test_netcdf_datasets_to_polars_without_series():
+    frame = netcdf_datasets_to_polars([])
+
+    assert frame.height == 0
+    assert frame.columns == [*PI_JSON_HEADER_COLUMNS, "time", "value"]
+
+
+def test_pi_records_to_polars_parses_scalar_fields():
+    frame = pi_records_to_polars(
+        [
+            {"locationId": "A", "lat": "-30.5", "x": 5, "attributes": []},
+            {"locationId": "B", "description": "Bridge"},
+        ],
+        PiLocation,
+    )
+
+    assert frame["locationId"].to_list() == ["A", "B"]
+    assert frame["lat"].to_list() == [-30.5, None]
+    assert frame["x"].to_list() == [5.0, None]
+    assert "attributes" not in frame.columns
+
+    parameters = pi_records_to_polars(
+        [{"id": "P", "usesDatum": "false"}, {"id": "Q", "usesDatum": True}],
+        PiParameter,
+    )
+    assert parameters["usesDatum"].to_list() == [False, True]
+    assert pi_records_to_polars([], PiParameter).schema["usesDatum"] == pl.Boolean
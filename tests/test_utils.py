@@ -1,14 +1,30 @@
+import copy
+import gc
 import io
 import zipfile
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
 
+import numpy as np
 import pytest
+import xarray as xr
 
+from fews_py_wrapper import utils
 from fews_py_wrapper.utils import (
+    PACKED_FLAG_FILL_VALUE,
+    NetcdfMemberCache,
+    NetcdfZipResponse,
+    concat_netcdf_time_chunks,
+    concat_netcdf_zip_responses,
     convert_netcdf_zip_response_to_xarray,
     format_datetime,
     format_time_args,
     get_function_arg_names,
+    merge_netcdf_datasets,
+    merge_pi_json_time_chunks,
+    open_netcdf_zip_response_lazily,
+    split_time_window,
 )
 
 
@@ -110,6 +126,601 @@ def test_convert_varying_station_sizes_netcdf_zip_response_to_xarray(
     assert {2, 30, 263, 322, 326, 361}.issubset(station_sizes)
 
 
+def test_convert_netcdf_zip_response_in_memory_matches_temp_files(
+    multi_member_netcdf_zip_response: bytes,
+):
+    with patch(
+        "fews_py_wrapper.utils.TemporaryDirectory",
+        side_effect=AssertionError("in-memory decoding must not touch disk"),
+    ):
+        in_memory = convert_netcdf_zip_response_to_xarray(
+            multi_member_netcdf_zip_response
+        )
+    from_temp_files = convert_netcdf_zip_response_to_xarray(
+        multi_member_netcdf_zip_response, in_memory=False
+    )
+
+    assert len(in_memory) == len(from_temp_files)
+    for dataset, expected in zip(in_memory, from_temp_files, strict=True):
+        assert dataset.identical(expected)
+
+
+def test_convert_netcdf_zip_response_from_file(
+    multi_member_netcdf_zip_response: bytes, tmp_path
+):
+    zip_path = tmp_path / "response.zip"
+    zip_path.write_bytes(multi_member_netcdf_zip_response)
+    expected = convert_netcdf_zip_response_to_xarray(multi_member_netcdf_zip_response)
+
+    from_path = convert_netcdf_zip_response_to_xarray(zip_path)
+    with zip_path.open("rb") as zip_file:
+        from_file = convert_netcdf_zip_response_to_xarray(zip_file, max_workers=2)
+
+    for datasets in (from_path, from_file):
+        assert len(datasets) == len(expected)
+        for dataset, expected_dataset in zip(datasets, expected, strict=True):
+            assert dataset.identical(expected_dataset)
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_convert_netcdf_zip_response_in_parallel_keeps_member_order(
+    multi_member_netcdf_zip_response: bytes, executor: str
+):
+    serial = convert_netcdf_zip_response_to_xarray(multi_member_netcdf_zip_response)
+    parallel = convert_netcdf_zip_response_to_xarray(
+        multi_member_netcdf_zip_response, max_workers=4, executor=executor
+    )
+
+    assert len(parallel) == len(serial)
+    for dataset, expected in zip(parallel, serial, strict=True):
+        assert dataset.identical(expected)
+
+
+def test_convert_netcdf_zip_response_reuses_process_pool(
+    multi_member_netcdf_zip_response: bytes,
+):
+    convert_netcdf_zip_response_to_xarray(
+        multi_member_netcdf_zip_response, max_workers=2, executor="process"
+    )
+    process_pool = utils._NETCDF_PROCESS_POOL._pool
+
+    datasets = convert_netcdf_zip_response_to_xarray(
+        multi_member_netcdf_zip_response, max_workers=2, executor="process"
+    )
+
+    assert process_pool is not None
+    assert utils._NETCDF_PROCESS_POOL._pool is process_pool
+    assert len(datasets) == len(
+        convert_netcdf_zip_response_to_xarray(multi_member_netcdf_zip_response)
+    )
+    utils._shutdown_netcdf_process_pool()
+    assert utils._NETCDF_PROCESS_POOL._pool is None
+
+
+def test_convert_netcdf_zip_response_with_concurrent_worker_counts(
+    multi_member_netcdf_zip_response: bytes,
+):
+    serial = convert_netcdf_zip_response_to_xarray(multi_member_netcdf_zip_response)
+    shared_pool = utils._NETCDF_PROCESS_POOL
+    shared_pool.shutdown()
+
+    def decode(max_workers: int) -> list[xr.Dataset]:
+        return convert_netcdf_zip_response_to_xarray(
+            multi_member_netcdf_zip_response,
+            max_workers=max_workers,
+            executor="process",
+        )
+
+    with shared_pool.acquire(2) as smaller_pool:
+        with ThreadPoolExecutor(max_workers=2) as threads:
+            results = list(threads.map(decode, [2, 3]))
+        # A larger pool replaced this one, which is still in use.
+        assert shared_pool._pool is not smaller_pool
+        assert smaller_pool.submit(abs, -1).result() == 1
+
+    for datasets in results:
+        assert len(datasets) == len(serial)
+        for dataset, expected in zip(datasets, serial, strict=True):
+            assert dataset.identical(expected)
+    with pytest.raises(RuntimeError, match="after shutdown"):
+        smaller_pool.submit(abs, -1)
+    utils._shutdown_netcdf_process_pool()
+
+
+def test_convert_netcdf_zip_response_rejects_invalid_parallel_options(
+    netcdf_zip_response: bytes,
+):
+    with pytest.raises(ValueError, match="Unsupported executor 'fork'"):
+        convert_netcdf_zip_response_to_xarray(netcdf_zip_response, executor="fork")
+    with pytest.raises(ValueError, match="max_workers must be at least 1"):
+        convert_netcdf_zip_response_to_xarray(netcdf_zip_response, max_workers=0)
+    with pytest.raises(ValueError, match="requires in_memory=True"):
+        convert_netcdf_zip_response_to_xarray(
+            netcdf_zip_response, in_memory=False, max_workers=2
+        )
+
+
+def test_open_netcdf_zip_response_lazily(
+    multi_member_netcdf_zip_response: bytes, tmp_path
+):
+    pytest.importorskip("dask")
+
+    lazy = open_netcdf_zip_response_lazily(
+        multi_member_netcdf_zip_response, spill_dir=tmp_path
+    )
+    eager = convert_netcdf_zip_response_to_xarray(multi_member_netcdf_zip_response)
+
+    assert len(lazy) == len(eager)
+    assert len(list(tmp_path.rglob("*.nc"))) == len(eager)
+    for dataset, expected in zip(lazy, eager, strict=True):
+        assert all(variable.chunks for variable in dataset.data_vars.values())
+        assert dataset.load().identical(expected)
+        dataset.close()
+
+
+def test_open_netcdf_zip_response_lazily_removes_spill_files(
+    multi_member_netcdf_zip_response: bytes, tmp_path
+):
+    pytest.importorskip("dask")
+
+    lazy = open_netcdf_zip_response_lazily(
+        multi_member_netcdf_zip_response, spill_dir=tmp_path
+    )
+    (response_dir,) = tmp_path.iterdir()
+    name = utils.netcdf_series_variables(lazy[0])[0]
+    variable = lazy[0][name].isel(time=slice(0, 2))
+    del lazy
+    gc.collect()
+
+    assert len(list(response_dir.iterdir())) == 1
+    assert variable.values.shape[0] == 2
+    del variable
+    gc.collect()
+    assert not response_dir.exists()
+
+
+def test_netcdf_zip_response_decodes_members_on_access(
+    multi_member_netcdf_zip_response: bytes,
+):
+    eager = convert_netcdf_zip_response_to_xarray(multi_member_netcdf_zip_response)
+    with zipfile.ZipFile(io.BytesIO(multi_member_netcdf_zip_response)) as zip_file:
+        filenames = zip_file.namelist()
+
+    with patch(
+        "fews_py_wrapper.utils._open_netcdf_bytes",
+        wraps=utils._open_netcdf_bytes,
+    ) as open_mock:
+        with NetcdfZipResponse(multi_member_netcdf_zip_response) as response:
+            assert list(response) == filenames
+            assert open_mock.call_count == 0
+
+            dataset = response["H.obs_externalhistorical_nonequidistant.nc"]
+            assert response["H.obs_externalhistorical_nonequidistant.nc"] is dataset
+            simulated = response.for_parameter("H_simulated")
+            assert open_mock.call_count == 3
+            assert len(response.parameter_ids) == len(filenames) - 1
+            assert open_mock.call_count == 3
+            with pytest.raises(KeyError):
+                response["missing.nc"]
+            with pytest.raises(KeyError):
+                response.for_parameter("missing")
+            all_members = list(response.values())
+
+    xr.testing.assert_identical(
+        dataset,
+        eager[filenames.index("H.obs_externalhistorical_nonequidistant.nc")],
+    )
+    assert len(simulated) == 2
+    for member, expected in zip(all_members, eager, strict=True):
+        xr.testing.assert_identical(member, expected)
+
+
+def test_netcdf_zip_response_reads_parameter_of_unconventional_member_names(
+    netcdf_zip_response: bytes,
+):
+    content = io.BytesIO()
+    with (
+        zipfile.ZipFile(io.BytesIO(netcdf_zip_response)) as source,
+        zipfile.ZipFile(content, "w") as renamed,
+    ):
+        renamed.writestr("member.nc", source.read(source.namelist()[0]))
+
+    response = NetcdfZipResponse(
+        content.getvalue(), value_dtype="float32", station_ids=["missing"]
+    )
+
+    assert response.parameter_ids == ["H_simulated"]
+    assert response["member.nc"]["H_simulated"].dtype == np.float32
+    assert response["member.nc"].sizes["stations"] == 0
+
+
+def test_netcdf_member_cache_serves_unchanged_members(
+    multi_member_netcdf_zip_response: bytes,
+):
+    cache = NetcdfMemberCache()
+    first = convert_netcdf_zip_response_to_xarray(
+        multi_member_netcdf_zip_response, cache=cache
+    )
+
+    changed = io.BytesIO()
+    with (
+        zipfile.ZipFile(io.BytesIO(multi_member_netcdf_zip_response)) as source,
+        zipfile.ZipFile(changed, "w") as target,
+    ):
+        members = source.infolist()
+        target.writestr(members[0].filename, source.read(members[1]))
+        for member in members[1:]:
+            target.writestr(member, source.read(member))
+
+    with patch(
+        "fews_py_wrapper.utils._open_netcdf_bytes",
+        wraps=utils._open_netcdf_bytes,
+    ) as open_mock:
+        second = convert_netcdf_zip_response_to_xarray(
+            changed.getvalue(), max_workers=2, cache=cache
+        )
+        lazy = NetcdfZipResponse(multi_member_netcdf_zip_response, cache=cache)
+        lazy_member = lazy[list(lazy)[1]]
+
+    assert open_mock.call_count == 1
+    assert (cache.hits, cache.misses) == (21, 22)
+    assert len(cache) == 22
+    xr.testing.assert_identical(second[0], first[1])
+    for dataset, expected in zip(second[1:], first[1:], strict=True):
+        xr.testing.assert_identical(dataset, expected)
+    xr.testing.assert_identical(lazy_member, first[1])
+
+    second[1]["extra"] = second[1]["time"]
+    cached = convert_netcdf_zip_response_to_xarray(
+        multi_member_netcdf_zip_response, cache=cache
+    )
+    assert "extra" not in cached[1]
+
+
+def test_netcdf_member_cache_evicts_least_recently_used(
+    multi_member_netcdf_zip_response: bytes,
+):
+    sizes = [
+        dataset.nbytes
+        for dataset in convert_netcdf_zip_response_to_xarray(
+            multi_member_netcdf_zip_response
+        )
+    ]
+    cache = NetcdfMemberCache(max_bytes=sum(sizes[-3:]))
+
+    convert_netcdf_zip_response_to_xarray(multi_member_netcdf_zip_response, cache=cache)
+
+    assert cache.nbytes <= cache.max_bytes
+    cached = len(cache)
+    assert 3 <= cached < len(sizes)
+    convert_netcdf_zip_response_to_xarray(multi_member_netcdf_zip_response, cache=cache)
+    # Only the most recently decoded members, at the end of the ZIP, survive.
+    assert cache.hits == cached
+    cache.clear()
+    assert (len(cache), cache.nbytes) == (0, 0)
+    with pytest.raises(ValueError, match="max_bytes must not be negative"):
+        NetcdfMemberCache(max_bytes=-1)
+
+
+def test_concat_netcdf_zip_responses(netcdf_zip_response: bytes):
+    dataset = convert_netcdf_zip_response_to_xarray(netcdf_zip_response)[0]
+    windows = [
+        NetcdfZipResponse(
+            netcdf_zip_response,
+            time_slice=slice(
+                dataset["time"].values[start], dataset["time"].values[end]
+            ),
+        )
+        for start, end in ((0, 3), (3, 6))
+    ]
+
+    response = concat_netcdf_zip_responses(windows, "time")
+
+    (member,) = response.values()
+    xr.testing.assert_identical(member, dataset)
+    with pytest.raises(ValueError, match="Unsupported dim"):
+        concat_netcdf_zip_responses(windows, "location")
+
+
+@pytest.mark.parametrize(
+    "decode_kwargs", [{}, {"in_memory": False}, {"max_workers": 2}]
+)
+def test_convert_netcdf_zip_response_reads_selected_subset(
+    multi_member_netcdf_zip_response: bytes, decode_kwargs
+):
+    start = datetime(2025, 3, 13, 12, tzinfo=timezone(timedelta(hours=2)))
+
+    subset = convert_netcdf_zip_response_to_xarray(
+        multi_member_netcdf_zip_response,
+        variables=["H_obs"],
+        time_slice=slice(start, None),
+        station_ids=["Amanzimtoti_River_level"],
+        **decode_kwargs,
+    )
+
+    expected = [
+        dataset.drop_vars(
+            [name for name in dataset.data_vars if "stations" in dataset[name].dims]
+        )
+        .assign(H_obs=dataset["H_obs"], station_names=dataset["station_names"])
+        .sel(time=slice(np.datetime64("2025-03-13T10:00"), None))
+        .isel(stations=[2])
+        for dataset in convert_netcdf_zip_response_to_xarray(
+            multi_member_netcdf_zip_response
+        )
+        if "H_obs" in dataset.data_vars
+    ]
+    assert len(subset) == len(expected) == 17
+    for dataset, expected_dataset in zip(subset, expected, strict=True):
+        xr.testing.assert_identical(dataset, expected_dataset)
+
+
+def test_convert_netcdf_zip_response_selects_variables_by_parameter_id(
+    multi_member_netcdf_zip_response: bytes,
+):
+    (dataset,) = convert_netcdf_zip_response_to_xarray(
+        multi_member_netcdf_zip_response, variables="C.obs.dir.depthavg"
+    )
+
+    assert list(dataset.data_vars) == ["station_names", "C_obs_dir_depthavg"]
+    with pytest.raises(ValueError, match="time_slice must be a slice"):
+        convert_netcdf_zip_response_to_xarray(
+            multi_member_netcdf_zip_response, time_slice=slice(None, None, 2)
+        )
+
+
+def test_open_netcdf_zip_response_lazily_reads_selected_subset(
+    multi_member_netcdf_zip_response: bytes, tmp_path
+):
+    pytest.importorskip("dask")
+    options = {
+        "variables": ["P_obs"],
+        "time_slice": slice(np.datetime64("2025-03-14T00:00"), None),
+    }
+
+    lazy = open_netcdf_zip_response_lazily(
+        multi_member_netcdf_zip_response, spill_dir=tmp_path, **options
+    )
+    eager = convert_netcdf_zip_response_to_xarray(
+        multi_member_netcdf_zip_response, **options
+    )
+
+    assert len(lazy) == len(eager) == 13
+    for dataset, expected in zip(lazy, eager, strict=True):
+        xr.testing.assert_identical(dataset.load(), expected)
+        dataset.close()
+
+
+def _annotated_netcdf_zip_response() -> bytes:
+    dataset = xr.Dataset(
+        {
+            "H_obs": (("time", "stations"), np.array([[1.5, np.nan]])),
+            "H_obs_flag": (
+                ("time", "stations"),
+                np.array([[0.0, np.nan]]),
+                {"flag_values": "0 1 2", "flag_meanings": "reliable doubtful missing"},
+            ),
+            "H_obs_comment": (("time", "stations"), np.array([["checked", ""]])),
+        },
+        coords={
+            "time": np.array(["2025-03-14T10:00"], dtype="datetime64[ns]"),
+            "station_id": ("stations", np.array([b"A", b"B"], dtype="S64")),
+        },
+    )
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zip_file:
+        zip_file.writestr("H_obs.nc", dataset.to_netcdf())
+    return buffer.getvalue()
+
+
+def test_convert_netcdf_zip_response_compact_options():
+    content = _annotated_netcdf_zip_response()
+
+    (packed,) = convert_netcdf_zip_response_to_xarray(
+        content, value_dtype="float32", flags="pack", skip_comments=True
+    )
+    (dropped,) = convert_netcdf_zip_response_to_xarray(content, flags="drop")
+
+    assert list(packed.data_vars) == ["H_obs", "H_obs_flag"]
+    assert packed["H_obs"].dtype == np.float32
+    assert packed["H_obs_flag"].dtype == np.uint8
+    assert packed["H_obs_flag"].values.tolist() == [[0, PACKED_FLAG_FILL_VALUE]]
+    assert packed["H_obs_flag"].attrs["flag_meanings"] == "reliable doubtful missing"
+    assert list(dropped.data_vars) == ["H_obs", "H_obs_comment"]
+    assert dropped["H_obs"].dtype == np.float64
+
+
+def _station_dataset(
+    station_ids: list[str], times: list[str], values: list[list[float]]
+) -> xr.Dataset:
+    return xr.Dataset(
+        {
+            "H_obs": (("time", "stations"), np.array(values, dtype="float32")),
+            "count": (("time", "stations"), np.ones((len(times), len(station_ids)))),
+        },
+        coords={
+            "time": np.array(times, dtype="datetime64[ns]"),
+            "station_id": ("stations", np.array(station_ids, dtype="S64")),
+        },
+        attrs={"source": "first" if station_ids[0] == "A" else "second"},
+    )
+
+
+def test_merge_netcdf_datasets_fills_union_index_first_value_wins():
+    first = _station_dataset(
+        ["A", "B"], ["2025-01-01", "2025-01-02"], [[1.0, np.nan], [2.0, 3.0]]
+    )
+    second = _station_dataset(
+        ["B", "C"], ["2025-01-01", "2025-01-03"], [[4.0, 5.0], [6.0, 7.0]]
+    )
+    second["count"] = second["count"].astype("int64")
+
+    merged = merge_netcdf_datasets([first, second])
+
+    assert merged["station_id"].values.tolist() == [b"A", b"B", b"C"]
+    assert (
+        merged["time"].values.tolist()
+        == np.array(
+            ["2025-01-01", "2025-01-02", "2025-01-03"], dtype="datetime64[ns]"
+        ).tolist()
+    )
+    np.testing.assert_array_equal(
+        merged["H_obs"].values,
+        [[1.0, 4.0, 5.0], [2.0, 3.0, np.nan], [np.nan, 6.0, 7.0]],
+    )
+    assert merged["H_obs"].dtype == np.float32
+    assert merged.attrs == {"source": "first"}
+    assert "station_id" in merged.coords
+
+
+def test_merge_netcdf_datasets_matches_members(
+    varying_station_sizes_netcdf_zip_response: bytes,
+):
+    datasets = convert_netcdf_zip_response_to_xarray(
+        varying_station_sizes_netcdf_zip_response
+    )
+
+    merged = merge_netcdf_datasets(datasets)
+
+    station_ids = {
+        station_id
+        for dataset in datasets
+        for station_id in dataset["station_id"].values.tolist()
+    }
+    assert merged.sizes["stations"] == len(station_ids)
+    first = datasets[0]
+    np.testing.assert_array_equal(
+        merged["C_obs_dir_depthavg"]
+        .isel(stations=slice(0, first.sizes["stations"]))
+        .sel(time=first["time"])
+        .values,
+        first["C_obs_dir_depthavg"].values,
+    )
+    assert set(merged.data_vars) == {
+        name for dataset in datasets for name in dataset.data_vars
+    }
+
+
 def test_convert_netcdf_zip_response_to_xarray_rejects_invalid_zip():
     with pytest.raises(ValueError, match="Expected FEWS PI_NETCDF content"):
         convert_netcdf_zip_response_to_xarray(b"not-a-zip")
+
+
+def test_split_time_window():
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    end = datetime(2025, 1, 3, 12, tzinfo=timezone.utc)
+
+    windows = split_time_window(start, end, timedelta(days=1))
+
+    assert windows == [
+        (start, datetime(2025, 1, 2, tzinfo=timezone.utc)),
+        (
+            datetime(2025, 1, 2, tzinfo=timezone.utc),
+            datetime(2025, 1, 3, tzinfo=timezone.utc),
+        ),
+        (datetime(2025, 1, 3, tzinfo=timezone.utc), end),
+    ]
+    assert split_time_window(start, start, timedelta(days=1)) == [(start, start)]
+
+    with pytest.raises(ValueError, match="chunk must be a positive timedelta"):
+        split_time_window(start, end, timedelta(0))
+    with pytest.raises(ValueError, match="end_time must not be before start_time"):
+        split_time_window(end, start, timedelta(days=1))
+
+
+def test_concat_netcdf_time_chunks_drops_boundary_duplicates(
+    netcdf_zip_response: bytes,
+):
+    dataset = convert_netcdf_zip_response_to_xarray(netcdf_zip_response)[0]
+    first_window = dataset.isel(time=slice(0, 4))
+    second_window = dataset.isel(time=slice(3, 7))
+
+    merged = concat_netcdf_time_chunks([[first_window], [second_window]])
+
+    assert len(merged) == 1
+    assert merged[0].sizes["time"] == 7
+    assert merged[0]["H_simulated"].values[:, 0].tolist() == pytest.approx(
+        [0.214, 0.211, 0.209, 0.207, 0.207, 0.207, 0.208]
+    )
+
+
+def test_concat_netcdf_time_chunks_aligns_reordered_stations(
+    multi_member_netcdf_zip_response: bytes,
+):
+    dataset = convert_netcdf_zip_response_to_xarray(multi_member_netcdf_zip_response)[0]
+    first_window = dataset.isel(time=slice(0, 20))
+    second_window = dataset.isel(time=slice(19, None), stations=[1, 0])
+
+    merged = concat_netcdf_time_chunks([[first_window], [second_window]])
+
+    assert merged[0].identical(dataset)
+
+
+def test_concat_netcdf_time_chunks_pairs_members_by_file_name(
+    netcdf_zip_response: bytes,
+):
+    dataset = convert_netcdf_zip_response_to_xarray(netcdf_zip_response)[0]
+    doubled = dataset.copy(deep=True)
+    doubled["H_simulated"] = dataset["H_simulated"] * 2
+    doubled.encoding["source"] = "doubled.nc"
+
+    merged = concat_netcdf_time_chunks(
+        [
+            [dataset.isel(time=slice(0, 4)), doubled.isel(time=slice(0, 4))],
+            [doubled.isel(time=slice(3, 7)), dataset.isel(time=slice(3, 7))],
+        ]
+    )
+
+    assert [member.encoding["source"] for member in merged] == [
+        dataset.encoding["source"],
+        "doubled.nc",
+    ]
+    xr.testing.assert_identical(
+        merged[0]["H_simulated"], dataset["H_simulated"].isel(time=slice(0, 7))
+    )
+    xr.testing.assert_identical(
+        merged[1]["H_simulated"], doubled["H_simulated"].isel(time=slice(0, 7))
+    )
+
+
+def test_merge_pi_json_time_chunks(timeseries_response):
+    series = timeseries_response["timeSeries"][0]
+    first = copy.deepcopy(timeseries_response)
+    second = copy.deepcopy(timeseries_response)
+    first["timeSeries"][0]["events"] = series["events"][:20]
+    first["timeSeries"][0]["header"]["endDate"] = dict(series["events"][19])
+    second["timeSeries"][0]["events"] = series["events"][19:]
+    second["timeSeries"][0]["header"]["startDate"] = dict(series["events"][19])
+
+    merged = merge_pi_json_time_chunks([first, second])
+
+    assert merged["version"] == timeseries_response["version"]
+    assert len(merged["timeSeries"]) == 1
+    assert merged["timeSeries"][0]["events"] == series["events"]
+    assert (
+        merged["timeSeries"][0]["header"]["startDate"] == series["header"]["startDate"]
+    )
+    assert merged["timeSeries"][0]["header"]["endDate"] == series["header"]["endDate"]
+
+
+def test_merge_pi_json_time_chunks_ignores_window_metadata(timeseries_response):
+    series = timeseries_response["timeSeries"][0]
+    first = copy.deepcopy(timeseries_response)
+    second = copy.deepcopy(timeseries_response)
+    first["timeSeries"][0]["events"] = series["events"][:20]
+    second["timeSeries"][0]["events"] = series["events"][20:]
+    first["timeSeries"][0]["header"].update(
+        creationDate="2025-03-14", creationTime="10:00:00", approvedDate="2025-03-14"
+    )
+    second["timeSeries"][0]["header"].update(
+        creationDate="2025-03-15", creationTime="11:30:00", approvedDate="2025-03-15"
+    )
+    third = copy.deepcopy(second)
+    third["timeSeries"][0]["header"]["parameterId"] = "Q.obs"
+
+    merged = merge_pi_json_time_chunks([first, second, third])
+
+    assert len(merged["timeSeries"]) == 2
+    assert merged["timeSeries"][0]["events"] == series["events"]
+    assert merged["timeSeries"][0]["header"]["creationDate"] == "2025-03-14"
+    assert merged["timeSeries"][1]["header"]["parameterId"] == "Q.obs"